@@ -16,7 +16,7 @@ elif sys.platform.startswith("darwin"):
 src_path = Path("src").resolve()
 
 a = Analysis(
-    ["src/pieces/app.py"],
+    ["src/pieces/__main__.py"],
     pathex=[str(src_path)],
     binaries=[],
     datas=[
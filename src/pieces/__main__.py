@@ -1,6 +1,6 @@
 # To be able to use
 # python -m pieces [command] [args]
-from pieces.app import main
+from pieces.daemon.client import main
 import sys
 from pathlib import Path
 
@@ -24,8 +24,8 @@ import re
 import tempfile
 
 from urllib.parse import quote
-from typing import Tuple, Optional, List, Dict, Union
-from pydantic import SecretStr
+from typing import Any, Tuple, Optional, List, Dict, Union
+from pydantic import BaseModel, SecretStr, ValidationError
 
 from pieces._vendor.pieces_os_client.configuration import Configuration
 from pieces._vendor.pieces_os_client.api_response import ApiResponse, T as ApiResponseT
@@ -72,6 +72,10 @@ class ApiClient:
         'object': object,
     }
     _pool = None
+    _type_descriptors: Dict[str, Tuple[str, Any]] = {}
+    """Parsed response type strings shared by every client,
+       maps e.g. 'List[Asset]' to ('list', 'Asset') and 'Asset' to ('class', Asset).
+    """
 
     def __init__(
         self,
@@ -409,6 +413,10 @@ class ApiClient:
             if response_text == "":
                 data = ""
             else:
+                if self.configuration.fast_deserialization:
+                    model = self.__fast_deserialize(response_text, response_type)
+                    if model is not None:
+                        return model
                 data = json.loads(response_text)
         elif re.match(r'^text\/[a-z.+-]+\s*(;|$)', content_type, re.IGNORECASE):
             data = response_text
@@ -420,6 +428,90 @@ class ApiClient:
 
         return self.__deserialize(data, response_type)
 
+    def __fast_deserialize(self, response_text: str, response_type: str):
+        """Validates a JSON model response in a single pydantic pass.
+
+        :param response_text: the JSON response body.
+        :param response_type: string of class name.
+        :return: model object, or None if the response type is not a model
+            or the fast path failed and the from_dict path should be used.
+        """
+        if not isinstance(response_type, str):
+            return None
+        kind, klass = self.__type_descriptor(response_type)
+        if kind != 'class' or not (isinstance(klass, type) and issubclass(klass, BaseModel)):
+            return None
+        try:
+            return klass.model_validate_json(response_text)
+        except ValidationError:
+            # oneOf/anyOf wrappers and custom from_dict logic
+            return None
+
+    def __type_descriptor(self, klass: str) -> Tuple[str, Any]:
+        """Returns the parsed descriptor of a type string, parsing it only once.
+
+        :param klass: string of class name, e.g. 'List[Asset]'.
+        :return: ('list' or 'dict', item type string) or ('class', class literal).
+        """
+        descriptor = self._type_descriptors.get(klass)
+        if descriptor is None:
+            if klass.startswith('List['):
+                m = re.match(r'List\[(.*)]', klass)
+                assert m is not None, "Malformed List type definition"
+                descriptor = ('list', m.group(1))
+            elif klass.startswith('Dict['):
+                m = re.match(r'Dict\[([^,]*), (.*)]', klass)
+                assert m is not None, "Malformed Dict type definition"
+                descriptor = ('dict', m.group(2))
+            else:
+                descriptor = ('class', self.__resolve_class(klass))
+            self._type_descriptors[klass] = descriptor
+        return descriptor
+
+    def __resolve_class(self, klass: str):
+        """Converts a class name to the native type or model class.
+
+        :param klass: string of class name.
+        :return: class literal.
+        """
+        if klass in self.NATIVE_TYPES_MAPPING:
+            return self.NATIVE_TYPES_MAPPING[klass]
+
+        # Convert the class to snake case
+        # NOTE:
+        # The following regex substitution doesn't work properly:
+        #
+        #     snake_case = re.sub(r'(?<!^)(?=[A-Z])', '_', klass).lower()
+        #
+        # An issue arises because this regex inserts underscores between all adjacent
+        # uppercase letters (except at the start), which is not desirable for sequences like
+        # 'QGPT'. It turns 'QGPT' into 'q_g_p_t'.
+        # The following regex substitution should fix that:
+        snake_case = re.sub(
+            r'(?<=[a-z0-9])(?=[A-Z])'      # Between lowercase/digit and uppercase
+            r'|(?<=[A-Z])(?=[A-Z][a-z])',  # Between uppercase and uppercase-lowercase sequence
+            '_',
+            klass
+        ).lower()
+        # EXPLANATION:
+        # (?<=[a-z0-9])(?=[A-Z]): Inserts an underscore between a lowercase letter or digit
+        #                         and an uppercase letter. This handles transitions like
+        #                         'myClass' to 'my_Class'.
+        # (?<=[A-Z])(?=[A-Z][a-z]): Inserts an underscore in cases where a sequence of
+        #                           uppercase letters is followed by an uppercase letter and
+        #                           then a lowercase letter. This handles cases like
+        #                           'XMLHttpRequest' to 'XML_Http_Request'.
+        #
+        # EXAMPLE OUTPUTS:
+        #     'QGPT'           -> 'qgpt'
+        #     'MyClassName'    -> 'my_class_name'
+        #     'HTTPRequest'    -> 'http_request'
+        #     'XMLHttpRequest' -> 'xml_http_request'
+
+        # Import the class
+        module = importlib.import_module(f"pieces._vendor.pieces_os_client.models.{snake_case}")
+        return getattr(module, klass)
+
     def __deserialize(self, data, klass):
         """Deserializes dict, list, str into an object.
 
@@ -432,58 +524,17 @@ class ApiClient:
             return None
 
         if isinstance(klass, str):
-            if klass.startswith('List['):
-                m = re.match(r'List\[(.*)]', klass)
-                assert m is not None, "Malformed List type definition"
-                sub_kls = m.group(1)
+            kind, sub_kls = self.__type_descriptor(klass)
+            if kind == 'list':
                 return [self.__deserialize(sub_data, sub_kls)
                         for sub_data in data]
 
-            if klass.startswith('Dict['):
-                m = re.match(r'Dict\[([^,]*), (.*)]', klass)
-                assert m is not None, "Malformed Dict type definition"
-                sub_kls = m.group(2)
+            if kind == 'dict':
                 return {k: self.__deserialize(v, sub_kls)
                         for k, v in data.items()}
 
-            # convert str to class
-            if klass in self.NATIVE_TYPES_MAPPING:
-                klass = self.NATIVE_TYPES_MAPPING[klass]
-            else:
-                # Convert the class to snake case
-                # NOTE:
-                # The following regex substitution doesn't work properly:
-                #
-                #     snake_case = re.sub(r'(?<!^)(?=[A-Z])', '_', klass).lower()
-                #
-                # An issue arises because this regex inserts underscores between all adjacent
-                # uppercase letters (except at the start), which is not desirable for sequences like
-                # 'QGPT'. It turns 'QGPT' into 'q_g_p_t'.
-                # The following regex substitution should fix that:
-                snake_case = re.sub(
-                    r'(?<=[a-z0-9])(?=[A-Z])'      # Between lowercase/digit and uppercase
-                    r'|(?<=[A-Z])(?=[A-Z][a-z])',  # Between uppercase and uppercase-lowercase sequence
-                    '_',
-                    klass
-                ).lower()
-                # EXPLANATION:
-                # (?<=[a-z0-9])(?=[A-Z]): Inserts an underscore between a lowercase letter or digit
-                #                         and an uppercase letter. This handles transitions like
-                #                         'myClass' to 'my_Class'.
-                # (?<=[A-Z])(?=[A-Z][a-z]): Inserts an underscore in cases where a sequence of
-                #                           uppercase letters is followed by an uppercase letter and
-                #                           then a lowercase letter. This handles cases like
-                #                           'XMLHttpRequest' to 'XML_Http_Request'.
-                #
-                # EXAMPLE OUTPUTS:
-                #     'QGPT'           -> 'qgpt'
-                #     'MyClassName'    -> 'my_class_name'
-                #     'HTTPRequest'    -> 'http_request'
-                #     'XMLHttpRequest' -> 'xml_http_request'
-
-                # Import the class
-                module = importlib.import_module(f"pieces._vendor.pieces_os_client.models.{snake_case}")
-                klass = getattr(module, klass)
+            # str converted to class
+            klass = sub_kls
 
         if klass in self.PRIMITIVE_TYPES:
             return self.__deserialize_primitive(data, klass)
@@ -314,6 +314,17 @@ conf = pieces_os_client.Configuration(
            cpu_count * 5 is used as default value to increase performance.
         """
 
+        self.connection_pool_block = False
+        """Block when every pooled connection is in use instead of opening
+           a connection that is discarded after the request.
+        """
+
+        self.request_timeout = None
+        """Default timeout, in seconds, for requests that don't pass
+           _request_timeout. Either one number (total) or a
+           (connection, read) tuple.
+        """
+
         self.proxy: Optional[str] = None
         """Proxy URL
         """
@@ -329,6 +340,13 @@ conf = pieces_os_client.Configuration(
         # Enable client side validation
         self.client_side_validation = True
 
+        self.fast_deserialization = True
+        """Validate JSON model responses in a single pydantic pass
+           (model_validate_json) instead of building every nested model
+           through its from_dict. Set to False to use the from_dict path,
+           e.g. when debugging a validation error.
+        """
+
         self.socket_options = None
         """Options to pass down to the underlying urllib3 socket
         """
@@ -17,6 +17,7 @@ import io
 import json
 import re
 import ssl
+from typing import Dict
 
 import urllib3
 
@@ -97,6 +98,11 @@ class RESTClientObject:
         if configuration.connection_pool_maxsize is not None:
             pool_args['maxsize'] = configuration.connection_pool_maxsize
 
+        if configuration.connection_pool_block:
+            pool_args['block'] = True
+
+        self.default_request_timeout = configuration.request_timeout
+
         # https pool manager
         self.pool_manager: urllib3.PoolManager
 
@@ -113,6 +119,26 @@ class RESTClientObject:
         else:
             self.pool_manager = urllib3.PoolManager(**pool_args)
 
+    def pool_stats(self) -> Dict[str, int]:
+        """Connection reuse across every pool of the pool manager.
+
+        :return: dict with the number of requests, the connections opened
+            for them (misses) and the requests served by a pooled
+            connection (hits).
+        """
+        requests = connections = 0
+        for key in self.pool_manager.pools.keys():
+            pool = self.pool_manager.pools.get(key)
+            if pool is None:
+                continue
+            requests += pool.num_requests
+            connections += pool.num_connections
+        return {
+            "requests": requests,
+            "hits": max(requests - connections, 0),
+            "misses": connections,
+        }
+
     def request(
         self,
         method,
@@ -156,6 +182,8 @@ class RESTClientObject:
         headers = headers or {}
 
         timeout = None
+        if not _request_timeout:
+            _request_timeout = self.default_request_timeout
         if _request_timeout:
             if isinstance(_request_timeout, (int, float)):
                 timeout = urllib3.Timeout(total=_request_timeout)
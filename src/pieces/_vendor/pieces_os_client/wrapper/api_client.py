@@ -1,7 +1,17 @@
+import multiprocessing
+import socket
+from typing import Dict, Optional
+
+from urllib3.connection import HTTPConnection
+
 from pieces._vendor.pieces_os_client.api_client import ApiClient
 from pieces._vendor.pieces_os_client.configuration import Configuration
+from pieces._vendor.pieces_os_client.rest import RESTClientObject
 from .websockets.base_websocket import BaseWebsocket
 
+# The pool size of the generated Configuration
+DEFAULT_CONNECTION_POOL_MAXSIZE = multiprocessing.cpu_count() * 5
+
 
 class PiecesApiClient:
     def __init__(self):
@@ -36,9 +46,22 @@ class PiecesApiClient:
         self._ranges_api = None
         self._workstream_summary_api = None
         self._workstream_summaries_api = None
+        # Connection settings, applied when the host is initialized or by
+        # apply_connection_settings
+        self._connection_pool_maxsize: Optional[int] = None
+        # Connections the pool needs at least when its size is not set, e.g.
+        # for the snapshot caches
+        self.min_connection_pool_maxsize = 0
+        self.connection_pool_block = False
+        self.request_timeout = None
+        self.tcp_keepalive = True
+        self.fast_deserialization = True
 
     def init_host(self, host, reconnect_on_host_change=True):
-        self.api_client = ApiClient(Configuration(host))
+        configuration = Configuration(host)
+        self._update_configuration(configuration)
+        configuration.fast_deserialization = self.fast_deserialization
+        self.api_client = ApiClient(configuration)
         # Websocket urls
         ws_base_url: str = host.replace("http", "ws")
         self.ASSETS_IDENTIFIERS_WS_URL = ws_base_url + "/assets/stream/identifiers"
@@ -58,6 +81,73 @@ class PiecesApiClient:
         if reconnect_on_host_change:
             BaseWebsocket.reconnect_all()
 
+    @property
+    def connection_pool_maxsize(self) -> Optional[int]:
+        """
+        The number of pooled connections set by the user, None to size the pool
+        from the generated default and min_connection_pool_maxsize.
+        """
+        return self._connection_pool_maxsize
+
+    @connection_pool_maxsize.setter
+    def connection_pool_maxsize(self, maxsize: Optional[int]):
+        self._connection_pool_maxsize = maxsize
+        self.apply_connection_settings()  # Resize the pool if already created
+
+    def apply_connection_settings(self):
+        """
+        Apply the connection settings changed after the host was initialized,
+        the connection pool is recreated if any of them changed.
+        """
+        if not hasattr(self, "api_client"):
+            return  # Applied by init_host
+        configuration = self.api_client.configuration
+        if self._update_configuration(configuration):
+            self.api_client.rest_client = RESTClientObject(configuration)
+
+    def _update_configuration(self, configuration: Configuration) -> bool:
+        """Write the connection settings to a configuration, returns whether it changed."""
+        settings = {
+            "connection_pool_block": self.connection_pool_block,
+            "request_timeout": self.request_timeout,
+            "socket_options": (
+                self._keepalive_socket_options() if self.tcp_keepalive else None
+            ),
+        }
+        if self.connection_pool_maxsize is not None:
+            settings["connection_pool_maxsize"] = self.connection_pool_maxsize
+        else:
+            settings["connection_pool_maxsize"] = max(
+                DEFAULT_CONNECTION_POOL_MAXSIZE, self.min_connection_pool_maxsize
+            )
+        changed = False
+        for name, value in settings.items():
+            if getattr(configuration, name) != value:
+                setattr(configuration, name, value)
+                changed = True
+        return changed
+
+    @staticmethod
+    def _keepalive_socket_options():
+        """The default urllib3 socket options with TCP keep-alive enabled."""
+        options = HTTPConnection.default_socket_options + [
+            (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+        ]
+        # Probe idle connections after 30s, not all platforms expose these
+        for name, value in (("TCP_KEEPIDLE", 30), ("TCP_KEEPINTVL", 10), ("TCP_KEEPCNT", 3)):
+            if hasattr(socket, name):
+                options.append((socket.IPPROTO_TCP, getattr(socket, name), value))
+        return options
+
+    def connection_pool_stats(self) -> Dict[str, int]:
+        """
+        Returns how many requests reused a pooled connection (hits)
+        and how many needed a new connection (misses).
+        """
+        if not hasattr(self, "api_client"):
+            return {"requests": 0, "hits": 0, "misses": 0}
+        return self.api_client.rest_client.pool_stats()
+
     @property
     def conversation_message_api(self):
         if self._conversation_message_api is None:
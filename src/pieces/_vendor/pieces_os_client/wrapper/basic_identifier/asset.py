@@ -1,6 +1,6 @@
 from ..streamed_identifiers.assets_snapshot import AssetSnapshot
 from .basic import Basic
-from typing import Literal, Optional, List, TYPE_CHECKING
+from typing import Literal, Optional, List, Tuple, TYPE_CHECKING
 
 from pieces._vendor.pieces_os_client.models.classification_specific_enum import ClassificationSpecificEnum
 from pieces._vendor.pieces_os_client.models.classification_generic_enum import ClassificationGenericEnum
@@ -11,6 +11,7 @@ if TYPE_CHECKING:
 	from pieces._vendor.pieces_os_client.models.shares import Shares
 	from pieces._vendor.pieces_os_client.models.asset import Asset
 	from pieces._vendor.pieces_os_client.models.seed import Seed
+	from pieces._vendor.pieces_os_client.models.searched_asset import SearchedAsset
 	from .annotation import BasicAnnotation
 	from .tag import BasicTag
 	from .website import BasicWebsite
@@ -26,7 +27,12 @@ class BasicAsset(Basic):
 		if AssetSnapshot.identifiers_snapshot:
 			return AssetSnapshot.identifiers_snapshot
 		
-		AssetSnapshot.identifiers_snapshot = {item.id:None for item in cls.get_identifiers()}
+		AssetSnapshot.identifiers_snapshot = {
+			item.id: AssetSnapshot.cached_identifier(
+				item.id, item.reference.updated.value if item.reference else None)
+			for item in cls.get_identifiers()}
+		if AssetSnapshot.disk_cache:  # Drop the assets deleted since the last run
+			AssetSnapshot.disk_cache.retain(AssetSnapshot.identifiers_snapshot)
 
 		return AssetSnapshot.identifiers_snapshot
 	
@@ -317,6 +323,24 @@ class BasicAsset(Basic):
 		Returns:
 			Optional[List["BasicAsset"]]: A list of search results or None if no results are found.
 		"""
+		results = BasicAsset.search_scored(query, search_type)
+		if results:
+			return [asset for asset, _ in results]
+
+	@staticmethod
+	def search_scored(query:str,search_type:Literal["fts","ncs","fuzzy"] = "fts") -> List[Tuple["BasicAsset", float]]:
+		"""
+		Same as search but returns the (asset, score) pairs given by PiecesOS,
+		exact matches first.
+		"""
+		return [(BasicAsset(result.identifier), result.score) for result in BasicAsset.search_results(query, search_type)]
+
+	@staticmethod
+	def search_results(query:str,search_type:Literal["fts","ncs","fuzzy"] = "fts") -> List["SearchedAsset"]:
+		"""
+		The raw SearchedAsset results of a search, exact matches first.
+		Fuzzy results come with their asset without transferables (e.g. its name).
+		"""
 		if search_type == 'ncs':
 			results = AssetSnapshot.pieces_client.search_api.neural_code_search(query=query)
 		elif search_type == 'fts':
@@ -330,16 +354,13 @@ class BasicAsset(Basic):
 
 			# Check if iterable_list is a list and contains SearchedAsset objects
 			if isinstance(iterable_list, list) and all(hasattr(asset, 'exact') and hasattr(asset, 'identifier') for asset in iterable_list):
-				# Extracting suggested and exact IDs
-				suggested_ids = [asset.identifier for asset in iterable_list if not asset.exact]
-				exact_ids = [asset.identifier for asset in iterable_list if asset.exact]
-
-				# Combine and store best and suggested matches in asset_ids
-				combined_ids = exact_ids + suggested_ids
+				# Extracting suggested and exact matches
+				suggested = [asset for asset in iterable_list if not asset.exact]
+				exact = [asset for asset in iterable_list if asset.exact]
 
-				# Print the combined asset details
-				if combined_ids:
-					return [BasicAsset(id) for id in combined_ids]
+				# Combine best and suggested matches
+				return exact + suggested
+		return []
 
 	@staticmethod
 	def _get_seed(raw: str, metadata: Optional["FragmentMetadata"] = None) -> "Seed":
@@ -1,4 +1,5 @@
-from typing import Optional, List, TYPE_CHECKING
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Optional, List, TYPE_CHECKING
 
 from ..streamed_identifiers import ConversationsSnapshot
 from .basic import Basic
@@ -11,6 +12,9 @@ from pieces._vendor.pieces_os_client.models.annotation_type_enum import (
 
 if TYPE_CHECKING:
     from pieces._vendor.pieces_os_client.models.conversation import Conversation
+    from pieces._vendor.pieces_os_client.models.conversation_message import (
+        ConversationMessage,
+    )
     from .message import BasicMessage
     from .annotation import BasicAnnotation
     from .website import BasicWebsite
@@ -35,18 +39,32 @@ class BasicChat(Basic):
 
         # Extract the 'id' values from each item in the 'iterable' list
         ConversationsSnapshot.identifiers_snapshot = {
-            item.id: None for item in api_response.iterable
+            item.id: ConversationsSnapshot.cached_identifier(
+                item.id, item.reference.updated.value if item.reference else None
+            )
+            for item in api_response.iterable
         }
+        if ConversationsSnapshot.disk_cache:  # Drop the chats deleted since the last run
+            ConversationsSnapshot.disk_cache.retain(
+                ConversationsSnapshot.identifiers_snapshot
+            )
 
         return ConversationsSnapshot.identifiers_snapshot
 
     @staticmethod
     def ensure_sort():
         if ConversationsSnapshot.first_shot:
-            for i in ConversationsSnapshot.identifiers_snapshot.keys():
-                ConversationsSnapshot.identifiers_snapshot[i] = (
-                    ConversationsSnapshot.update_identifier(i)
-                )
+            # Conversations loaded from the disk cache are already up to date
+            ids = [
+                i
+                for i, conversation in ConversationsSnapshot.identifiers_snapshot.items()
+                if conversation is None
+            ]
+            for i, conversation in zip(
+                ids, ConversationsSnapshot.fetch_identifiers(ids)
+            ):
+                if conversation is not None:
+                    ConversationsSnapshot._store_identifier(i, conversation)
             ConversationsSnapshot._sort_first_shot()
             ConversationsSnapshot.first_shot = False
 
@@ -105,10 +123,17 @@ class BasicChat(Basic):
         self.conversation.name = name
         self._edit_conversation(self.conversation)
 
-    def messages(self) -> List["BasicMessage"]:
+    def messages(self, lazy: bool = False) -> List["BasicMessage"]:
         """
         Retrieves the messages in the conversation.
 
+        All the messages are fetched in a single request, if it fails they are
+        fetched in parallel one by one.
+
+        Args:
+            lazy: Don't fetch the content of the messages (transferables) now,
+                it is fetched the first time the content of a message is accessed.
+
         Returns:
             A list of BasicMessage instances representing the messages in the conversation.
         """
@@ -123,13 +148,57 @@ class BasicChat(Basic):
         out: List[Optional[BasicMessage]] = [None] * (max_index + 1)
 
         pieces_client = ConversationsSnapshot.pieces_client
+        ids = [message_id for message_id, index in indices.items() if index != -1]
+        fetched = self._fetch_messages(ids, transferables=not lazy)
         for message_id, index in indices.items():
             if index != -1:
-                out[index] = BasicMessage(pieces_client, message_id)
+                # Messages missing from the bulk response are fetched on access
+                out[index] = BasicMessage(
+                    pieces_client,
+                    message_id,
+                    message=fetched.get(message_id),
+                    transferables=not lazy,
+                    lazy=True,
+                )
 
         # Only filter if you're okay skipping holes
         return [msg for msg in out if msg is not None]
 
+    def _fetch_messages(
+        self, ids: List[str], transferables: bool
+    ) -> Dict[str, "ConversationMessage"]:
+        """
+        Fetches the messages of the conversation.
+
+        Args:
+            ids: The IDs of the messages.
+            transferables: Whether to include the content of the messages.
+
+        Returns:
+            The fetched messages by ID.
+        """
+        pieces_client = ConversationsSnapshot.pieces_client
+        try:
+            response = pieces_client.conversation_api.conversation_specific_conversation_messages(
+                self._id, transferables=transferables
+            )
+            return {message.id: message for message in response.iterable}
+        except Exception as e:
+            print(f"Error fetching the messages of the conversation {self._id}: {e}")
+
+        def fetch(id):
+            try:
+                return pieces_client.conversation_message_api.message_specific_message_snapshot(
+                    message=id, transferables=transferables
+                )
+            except Exception:
+                return None
+
+        workers = min(ConversationsSnapshot.max_hydration_workers, len(ids)) or 1
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            messages = executor.map(fetch, ids)
+            return {id: message for id, message in zip(ids, messages) if message}
+
     @property
     def annotations(self) -> List["BasicAnnotation"]:
         """
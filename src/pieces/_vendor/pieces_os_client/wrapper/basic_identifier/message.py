@@ -3,6 +3,7 @@ from .basic import Basic
 
 
 if TYPE_CHECKING:
+    from pieces._vendor.pieces_os_client.models.conversation_message import ConversationMessage
     from ..client import PiecesClient
     from .chat import BasicChat
     from .annotation import BasicAnnotation
@@ -31,7 +32,14 @@ class BasicMessage(Basic):
         Deletes the message.
     """
 
-    def __init__(self, pieces_client: "PiecesClient", id: str) -> None:
+    def __init__(
+        self,
+        pieces_client: "PiecesClient",
+        id: str,
+        message: Optional["ConversationMessage"] = None,
+        transferables: bool = True,
+        lazy: bool = False,
+    ) -> None:
         """
         Constructs all the necessary attributes for the BasicMessage object.
 
@@ -41,18 +49,48 @@ class BasicMessage(Basic):
             An instance of the PiecesClient to interact with the API.
         id: str
             The ID of the message to be retrieved.
+        message: Optional[ConversationMessage]
+            The message if it was already fetched (e.g. in bulk by BasicChat.messages).
+        transferables: bool
+            Whether the given message includes its content, otherwise the content
+            is fetched the first time it is accessed.
+        lazy: bool
+            Fetch the message the first time it is accessed instead of now.
         """
+        self.pieces_client = pieces_client
+        self._message = message
+        self._transferables = transferables if message is not None else True
+        super().__init__(id)
+        if message is None and not lazy:
+            self._message = self._fetch()
 
-        from pieces._vendor.pieces_os_client.models.conversation_message import ConversationMessage
-
+    def _fetch(self) -> "ConversationMessage":
         try:
-            self.message: ConversationMessage = pieces_client.conversation_message_api.message_specific_message_snapshot(
-                message=id, transferables=True
+            return self.pieces_client.conversation_message_api.message_specific_message_snapshot(
+                message=self._id, transferables=True
             )
         except:
             raise ValueError("Error in retrieving the message")
-        self.pieces_client = pieces_client
-        super().__init__(id)
+
+    @property
+    def message(self) -> "ConversationMessage":
+        """
+        Gets the message, fetching it if it was not loaded yet.
+        """
+        if self._message is None:
+            self._message = self._fetch()
+        return self._message
+
+    @message.setter
+    def message(self, message: "ConversationMessage") -> None:
+        self._message = message
+        self._transferables = True
+
+    def _ensure_content(self) -> None:
+        """Fetch the content of a message loaded without transferables."""
+        if not self._transferables:
+            self._message = self._fetch()
+            self._transferables = True
 
     @property
     def raw_content(self) -> Optional[str]:
@@ -64,6 +102,7 @@ class BasicMessage(Basic):
         Optional[str]
             The raw content of the message if available, otherwise None.
         """
+        self._ensure_content()
         try:
             return self.message.fragment.string.raw
         except:
@@ -79,6 +118,7 @@ class BasicMessage(Basic):
         value : str
             The new raw content of the message.
         """
+        self._ensure_content()
         self.message.fragment.string.raw = value
         self.pieces_client.conversation_message_api.message_update_value(
             False, self.message
@@ -106,7 +146,7 @@ class BasicMessage(Basic):
         str
             The ID of the message.
         """
-        return self.message.id
+        return self._message.id if self._message else self._id
 
     @property
     def chat(self) -> "BasicChat":
@@ -1,7 +1,9 @@
 from concurrent.futures import ThreadPoolExecutor, as_completed
-from typing import TYPE_CHECKING, Optional, Dict, Union, Callable
+from typing import TYPE_CHECKING, Optional, Dict, Tuple, Union, Callable
 import platform
+import os
 import atexit
+import json
 import urllib.request
 import socket
 import subprocess
@@ -18,6 +20,10 @@ from .installation import PosInstaller, DownloadModel
 from .streamed_identifiers._streamed_identifiers import StreamedIdentifiersCache
 import time
 
+HYDRATED_CACHES_COUNT = 5  # assets, conversations, anchors, ranges, workstream summaries
+PORT_RANGE = range(39300, 39334)  # Ports PiecesOS may listen on
+HEALTH_TTL = 1  # Seconds a successful health check is shared for
+
 if TYPE_CHECKING:
     from pieces._vendor.pieces_os_client.models.application import Application
     from pieces._vendor.pieces_os_client.models.fragment_metadata import FragmentMetadata
@@ -27,11 +33,18 @@ if TYPE_CHECKING:
 class PiecesClient(PiecesApiClient):
     def __init__(self, **kwargs):
         self._port = ""
+        self._discovery_cache_path: Optional[str] = None
+        self._healthy_at: Optional[float] = None  # Last successful health check
+        self.fingerprint: Optional[str] = None  # Health response of PiecesOS
+        # The discovery cache entry of the PiecesOS found
+        self._discovered: Optional[Dict[str, Optional[str]]] = None
         self._models_object: Optional[list["Model"]] = None
         self.is_pos_stream_running = False
         self._reconnect_on_host_change = kwargs.get(
             "reconnect_on_host_change", True)
         StreamedIdentifiersCache.pieces_client = self
+        StreamedIdentifiersCache.batch_size = kwargs.get(
+            "hydration_batch_size", StreamedIdentifiersCache.batch_size)
         self._application = None
         self._copilot = None
         self.models: Dict[str, str] = {}  # Maps model_name to the model_id
@@ -43,6 +56,15 @@ class PiecesClient(PiecesApiClient):
         self.user = BasicUser(self)
         self.app_name = "PIECES_FOR_DEVELOPERS_CLI"
         super().__init__()
+        self.max_hydration_workers = kwargs.get(
+            "max_hydration_workers", StreamedIdentifiersCache.max_hydration_workers)
+        # Set to False to validate responses field by field when debugging
+        self.fast_deserialization = kwargs.get("fast_deserialization", True)
+        if kwargs.get("connection_pool_maxsize") is not None:
+            self.connection_pool_maxsize = kwargs["connection_pool_maxsize"]
+        self.connection_pool_block = kwargs.get("connection_pool_block", False)
+        self.request_timeout = kwargs.get("request_timeout")
+        self.tcp_keepalive = kwargs.get("tcp_keepalive", True)
 
     @property
     def copilot(self):
@@ -67,6 +89,83 @@ class PiecesClient(PiecesApiClient):
 
         return self._application
 
+    @property
+    def max_hydration_workers(self) -> int:
+        return StreamedIdentifiersCache.max_hydration_workers
+
+    @max_hydration_workers.setter
+    def max_hydration_workers(self, workers: int):
+        """
+            Sets the concurrent requests each snapshot cache uses while hydrating.
+            Unless its size was set, the connection pool grows so every cache
+            gets enough connections, it never shrinks below the default as the
+            other requests and websockets share it. The pool of an initialized
+            host is resized.
+        """
+        StreamedIdentifiersCache.max_hydration_workers = workers
+        self.min_connection_pool_maxsize = workers * HYDRATED_CACHES_COUNT
+        self.apply_connection_settings()
+
+    def enable_snapshot_disk_cache(self, directory: str, instance: str, max_entries: int = 5000):
+        """
+            Persist the cached Assets and Conversations to disk so the next run
+            only fetches what changed.
+
+            Args:
+                directory: The directory the cache files are stored in.
+                instance: A key identifying the PiecesOS instance and user,
+                    the cache is discarded when it changes.
+                max_entries: The maximum number of objects kept per cache.
+        """
+        from pieces._vendor.pieces_os_client.models.asset import Asset
+        from pieces._vendor.pieces_os_client.models.conversation import Conversation
+        from .streamed_identifiers import AssetSnapshot, ConversationsSnapshot
+        from .streamed_identifiers._disk_cache import SnapshotDiskCache
+
+        for cache, model, file_name in (
+                (AssetSnapshot, Asset, "assets.json"),
+                (ConversationsSnapshot, Conversation, "conversations.json")):
+            if cache.disk_cache is None or cache.disk_cache.instance != instance:
+                cache.disk_cache = SnapshotDiskCache(
+                    os.path.join(directory, file_name), model, instance, max_entries)
+
+    def enable_search_index(self, directory: str, instance: str):
+        """
+            Keep a persistent local search index of the cached Assets, updated
+            as they are fetched, to search them without PiecesOS.
+
+            Args:
+                directory: The directory the index file is stored in.
+                instance: A key identifying the PiecesOS instance and user,
+                    the index is discarded when it changes.
+        """
+        from .streamed_identifiers import AssetSnapshot
+        from .streamed_identifiers._search_index import AssetSearchIndex
+
+        index = AssetSnapshot.search_index
+        if index is not None and index.instance == instance:
+            return
+        if index is not None:
+            AssetSnapshot.on_update_list.remove(index.add)
+            AssetSnapshot.on_remove_list.remove(index.remove)
+        index = AssetSearchIndex(os.path.join(directory, "search_index.json"), instance)
+        for asset in list(AssetSnapshot.identifiers_snapshot.values()):
+            index.add(asset)
+        AssetSnapshot.on_update_list.append(index.add)
+        AssetSnapshot.on_remove_list.append(index.remove)
+        AssetSnapshot.search_index = index
+
+    def enable_discovery_cache(self, path: str):
+        """
+            Remember the port and fingerprint of PiecesOS in a file, the next
+            run tries that port first and only scans every port on a miss.
+            The id of PiecesOS can be saved with them, see remember_os_id.
+
+            Args:
+                path: The JSON file the last known port is stored in.
+        """
+        self._discovery_cache_path = path
+
     def connect_websocket(self) -> bool:
         from .websockets.conversations_ws import ConversationWS
         from .websockets.assets_identifiers_ws import AssetsIdentifiersWS
@@ -92,7 +191,7 @@ class PiecesClient(PiecesApiClient):
     @property
     def port(self) -> Union[str, None]:
         if not self._port:  # check also if the HealthStream is running
-            self.port = self._port_scanning()
+            self.port = self._discover_port()
         return self._port
 
     @port.setter
@@ -108,34 +207,111 @@ class PiecesClient(PiecesApiClient):
             return "http://127.0.0.1:39300"
         return "http://127.0.0.1:" + self.port
 
-    @staticmethod
-    def _port_scanning() -> str:
-        def check_port(port: int) -> Optional[str]:
-            try:
-                # 1) Quick socket check
-                with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
-                    sock.settimeout(0.05)  # Short timeout for local checks
-                    if sock.connect_ex(('127.0.0.1', port)) != 0:
-                        return None  # If non-zero, the socket isn't open
-
-                # 2) If socket is open, send a single HEAD request
-                url = f"http://127.0.0.1:{port}/.well-known/health"
-                request = urllib.request.Request(url, method='HEAD')
-                with urllib.request.urlopen(request, timeout=0.1) as response:
-                    if response.status == 200:
-                        return str(port)
-            except Exception:
-                pass
+    def _discover_port(self) -> str:
+        """
+            Find the port of PiecesOS, trying the cached port before scanning.
+            The health check of the port found is shared by is_pieces_running.
+        """
+        cached = self._load_discovery_cache()
+        fingerprint = self._check_port(int(cached["port"]), timeout=0.5) if cached else None
+        if fingerprint is not None:
+            port = cached["port"]
+        else:
+            port, fingerprint = self._scan_ports()
+        self._healthy_at = time.monotonic()
+        if cached and (cached["port"], cached["fingerprint"]) == (port, fingerprint):
+            self._discovered = cached
+        else:
+            # Another PiecesOS, the id saved with the old port is dropped
+            self._discovered = {"port": port, "fingerprint": fingerprint}
+            self._save_discovery_cache()
+        self.fingerprint = fingerprint
+        return port
+
+    def known_os_id(self, version: str) -> Optional[str]:
+        """
+            Returns the PiecesOS id saved with the discovered port, None if it
+            was saved for another health response or version of PiecesOS.
+        """
+        if self._discovered and self._discovered.get("version") == version:
+            return self._discovered.get("os_id")
+        return None
+
+    def remember_os_id(self, os_id: str, version: str):
+        """
+            Save the PiecesOS id with the discovered port, so the next runs do
+            not request it while the health response and the version match.
+        """
+        if self._discovered is None:
+            return  # The port was set by hand
+        self._discovered.update(os_id=os_id, version=version)
+        self._save_discovery_cache()
+
+    def _load_discovery_cache(self) -> Optional[Dict[str, str]]:
+        if not self._discovery_cache_path:
             return None
+        try:
+            with open(self._discovery_cache_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if int(data["port"]) in PORT_RANGE:
+                return {
+                    "port": str(data["port"]),
+                    "fingerprint": data.get("fingerprint"),
+                    "os_id": data.get("os_id"),
+                    "version": data.get("version"),
+                }
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
+        return None
+
+    def _save_discovery_cache(self):
+        if not self._discovery_cache_path:
+            return
+        try:
+            tmp_path = self._discovery_cache_path + ".tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(self._discovered, f)
+            os.replace(tmp_path, self._discovery_cache_path)
+        except OSError:
+            pass
+
+    @staticmethod
+    def _check_port(port: int, timeout: float = 0.1) -> Optional[str]:
+        """
+            Returns the health response if PiecesOS listens on the port, otherwise None.
+        """
+        try:
+            # 1) Quick socket check
+            with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+                sock.settimeout(0.05)  # Short timeout for local checks
+                if sock.connect_ex(('127.0.0.1', port)) != 0:
+                    return None  # If non-zero, the socket isn't open
+
+            # 2) If socket is open, check that PiecesOS answers the health check
+            url = f"http://127.0.0.1:{port}/.well-known/health"
+            with urllib.request.urlopen(url, timeout=timeout) as response:
+                fingerprint = response.read().decode("utf-8", "replace").strip()
+                if response.status == 200 and fingerprint.lower().startswith("ok"):
+                    return fingerprint
+        except Exception:
+            pass
+        return None
 
-        # Scan ports 39300 to 39334 in parallel
-        with ThreadPoolExecutor(max_workers=20) as executor:
-            futures = [executor.submit(check_port, p)
-                       for p in range(39300, 39334)]
+    @classmethod
+    def _scan_ports(cls) -> Tuple[str, str]:
+        """
+            Scan the PiecesOS ports in parallel, returns (port, fingerprint).
+        """
+        executor = ThreadPoolExecutor(max_workers=20)
+        try:
+            futures = {executor.submit(cls._check_port, p): p for p in PORT_RANGE}
             for future in as_completed(futures):
-                result = future.result()
-                if result is not None:
-                    return result
+                fingerprint = future.result()
+                if fingerprint is not None:
+                    return str(futures[future]), fingerprint
+        finally:
+            # Do not wait for the ports still being checked
+            executor.shutdown(wait=False, cancel_futures=True)
 
         # If no port was found, raise an error
         raise ValueError("PiecesOS is not running")
@@ -172,6 +348,11 @@ class PiecesClient(PiecesApiClient):
             self._models_object = self.models_api.models_snapshot().iterable
         return self._models_object
 
+    @models_object.setter
+    def models_object(self, models: list["Model"]):
+        self._models_object = models
+        self.models = {}  # Recomputed from the new models
+
     @property
     def model_name(self):
         if hasattr(self, "_model_name"):
@@ -206,6 +387,10 @@ class PiecesClient(PiecesApiClient):
             Use this when you exit the app
         """
         BaseWebsocket.close_all()
+        StreamedIdentifiersCache.save_disk_caches()
+        from .streamed_identifiers import AssetSnapshot
+        if AssetSnapshot.search_index:
+            AssetSnapshot.search_index.save()
         if hasattr(atexit, 'unregister'):
             atexit.unregister(cls.close)
 
@@ -256,7 +441,14 @@ class PiecesClient(PiecesApiClient):
         """
         for _ in range(maximum_retries):
             try:
-                with urllib.request.urlopen(f"{self.host}/.well-known/health", timeout=1) as response:
+                host = self.host  # Discovers the port of PiecesOS
+                if self.is_pos_stream_running or (
+                        self._healthy_at is not None
+                        and time.monotonic() - self._healthy_at < HEALTH_TTL):
+                    return True  # Reuse the health stream or the last health check
+                with urllib.request.urlopen(f"{host}/.well-known/health", timeout=1) as response:
+                    if response.status == 200:
+                        self._healthy_at = time.monotonic()
                     return response.status == 200
             except:
                 if maximum_retries == 1:
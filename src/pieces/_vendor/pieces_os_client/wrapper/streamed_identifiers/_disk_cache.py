@@ -0,0 +1,155 @@
+"""
+An on-disk cache for the objects held by a StreamedIdentifiersCache.
+
+Objects are stored as their serialized dict next to the `updated` timestamp
+they had when they were fetched, a cached object is only served back when the
+caller knows the current `updated` timestamp of the object and it matches.
+
+The file is bound to an instance key (typically the PiecesOS id and the user id),
+loading a file written for another instance discards it.
+
+Entries are kept in least recently used order and the oldest ones are evicted
+once max_entries is exceeded.
+
+The file is only read when the cache is first used, and only written back
+when an entry was added, changed or removed.
+"""
+
+from collections import OrderedDict
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional, Type
+import json
+import os
+import threading
+
+
+class SnapshotDiskCache:
+    """
+    A persistent LRU cache of API models keyed by id and `updated` timestamp.
+    """
+
+    VERSION = 1  # Bump when the file layout changes
+
+    def __init__(self, path: Path, model: Type, instance: str, max_entries: int = 5000):
+        """
+        Args:
+            path: The JSON file used to persist the cache.
+            model: The model class used to deserialize the cached objects (e.g. Asset).
+            instance: The key of the PiecesOS instance and user the objects belong to.
+            max_entries: The maximum number of objects kept on disk.
+        """
+        self.path = Path(path)
+        self.model = model
+        self.instance = instance
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._dirty = False
+        self._loaded = False
+
+    @staticmethod
+    def stamp(updated: Optional[datetime]) -> Optional[str]:
+        """Convert an `updated` timestamp value to the string stored on disk."""
+        return updated.isoformat() if updated else None
+
+    def _load(self):
+        """Read the file on first use, call it with the lock held."""
+        if self._loaded:
+            return
+        self._loaded = True
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        if data.get("version") != self.VERSION or data.get("instance") != self.instance:
+            self._dirty = True  # Written for another PiecesOS/user, drop it on save
+            return
+        for entry in data.get("entries", []):
+            self._entries[entry["id"]] = entry
+
+    def get(self, id: str, updated: Optional[datetime]):
+        """
+        Returns the cached object if it is still at the given `updated` timestamp, otherwise None.
+        """
+        stamp = self.stamp(updated)
+        if stamp is None:
+            return None
+        with self._lock:
+            self._load()
+            entry = self._entries.get(id)
+            if entry is None or entry["updated"] != stamp:
+                return None
+            self._entries.move_to_end(id)
+        try:
+            return self.model.from_dict(entry["data"])
+        except Exception:
+            self.remove(id)
+            return None
+
+    def put(self, obj):
+        """Store an object fetched from PiecesOS, unless it is already cached."""
+        updated = getattr(obj, "updated", None)
+        stamp = self.stamp(updated.value if updated else None)
+        if stamp is None:
+            return
+        with self._lock:
+            self._load()
+            entry = self._entries.get(obj.id)
+            if entry is not None and entry["updated"] == stamp:
+                self._entries.move_to_end(obj.id)
+                return
+        entry = {
+            "id": obj.id,
+            "updated": stamp,
+            "data": obj.model_dump(mode="json", by_alias=True, exclude_none=True),
+        }
+        with self._lock:
+            self._entries[obj.id] = entry
+            self._entries.move_to_end(obj.id)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+            self._dirty = True
+
+    def remove(self, id: str):
+        with self._lock:
+            self._load()
+            if self._entries.pop(id, None) is not None:
+                self._dirty = True
+
+    def retain(self, ids: Iterable[str]):
+        """Drop the entries of the objects missing from ids, e.g. deleted meanwhile."""
+        ids = set(ids)
+        with self._lock:
+            self._load()
+            stale = [id for id in self._entries if id not in ids]
+            for id in stale:
+                del self._entries[id]
+            if stale:
+                self._dirty = True
+
+    def save(self):
+        """Write the cache to disk if it changed since it was loaded."""
+        with self._lock:
+            if not self._dirty:
+                return
+            data = {
+                "version": self.VERSION,
+                "instance": self.instance,
+                "entries": list(self._entries.values()),
+            }
+            self._dirty = False
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_suffix(self.path.suffix + ".tmp")
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(data, f)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            print(f"Error saving the snapshot cache {self.path}: {e}")
+
+    def __len__(self) -> int:
+        with self._lock:
+            self._load()
+            return len(self._entries)
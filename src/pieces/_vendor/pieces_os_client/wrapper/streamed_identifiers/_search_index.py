@@ -0,0 +1,308 @@
+"""
+A persistent inverted index over the cached Assets, used to search them locally.
+
+The name, tags, description and raw content of every asset are tokenized and
+stored as weighted postings. The index is kept up to date through the
+on_update/on_remove callbacks of AssetSnapshot and saved next to the snapshot
+disk cache, bound to the same instance key.
+
+Queries match terms exactly, by prefix, and by one edit for longer terms, the
+results are ranked by a tf-idf like score normalized to [0, 1].
+"""
+
+from bisect import bisect_left
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Tuple
+import json
+import math
+import os
+import re
+import threading
+
+if TYPE_CHECKING:
+    from pieces._vendor.pieces_os_client.models.asset import Asset
+
+# Weight of a term depending on the field it was found in
+FIELD_WEIGHTS = {"name": 3.0, "tags": 2.0, "description": 1.5, "content": 1.0}
+PREFIX_FACTOR = 0.7  # Score factor of a prefix match
+FUZZY_FACTOR = 0.5  # Score factor of a match one edit away
+FUZZY_MIN_LENGTH = 4  # Shorter query terms are not matched fuzzily
+
+TOKEN_RE = re.compile(r"[A-Za-z0-9_]+")
+CAMEL_RE = re.compile(r"[A-Z]+(?![a-z])|[A-Z]?[a-z]+|[0-9]+")
+
+
+def tokenize(text: Optional[str]) -> List[str]:
+    """Lower case words of the text, identifiers are also split in their parts."""
+    if not text:
+        return []
+    tokens = []
+    for word in TOKEN_RE.findall(text):
+        lower = word.lower()
+        tokens.append(lower)
+        parts = [
+            part.lower() for chunk in word.split("_") for part in CAMEL_RE.findall(chunk)
+        ]
+        if len(parts) > 1:
+            tokens.extend(parts)
+    return tokens
+
+
+def _one_edit_apart(a: str, b: str) -> bool:
+    """True if a and b differ by one insertion, deletion or substitution."""
+    if abs(len(a) - len(b)) > 1 or a == b:
+        return False
+    if len(a) > len(b):
+        a, b = b, a
+    i = 0
+    while i < len(a) and a[i] == b[i]:
+        i += 1
+    if len(a) == len(b):
+        return a[i + 1 :] == b[i + 1 :]
+    return a[i:] == b[i + 1 :]
+
+
+def asset_fields(asset: "Asset") -> Dict[str, str]:
+    """The searchable text of an asset by field."""
+    fields = {"name": asset.name or ""}
+    if asset.tags and asset.tags.iterable:
+        fields["tags"] = " ".join(tag.text for tag in asset.tags.iterable if tag.text)
+    if asset.annotations and asset.annotations.iterable:
+        fields["description"] = " ".join(
+            annotation.text
+            for annotation in asset.annotations.iterable
+            if getattr(annotation, "type", None) == "DESCRIPTION" and annotation.text
+        )
+    for path in (
+        ("preview", "base", "reference", "fragment", "string", "raw"),
+        ("original", "reference", "fragment", "string", "raw"),
+    ):
+        value = asset
+        for attribute in path:
+            value = getattr(value, attribute, None)
+            if value is None:
+                break
+        if value:
+            fields["content"] = value
+            break
+    return fields
+
+
+class AssetSearchIndex:
+    """
+    An inverted index of the assets persisted as JSON.
+    """
+
+    VERSION = 1  # Bump when the file layout or the tokenizer changes
+
+    def __init__(self, path: Path, instance: str):
+        """
+        Args:
+            path: The JSON file used to persist the index.
+            instance: The key of the PiecesOS instance and user the assets belong to.
+        """
+        self.path = Path(path)
+        self.instance = instance
+        # id: {"updated": stamp, "terms": {term: weight}}
+        self._documents: Dict[str, Dict] = {}
+        self._postings: Dict[str, Dict[str, float]] = {}  # term: {id: weight}
+        self._sorted_terms: Optional[List[str]] = None  # Built on the first prefix query
+        self._lock = threading.Lock()
+        self._dirty = False
+        self._loaded = False  # The file is read on first use
+
+    def _load(self):
+        """Read the file once, must be called with the lock held."""
+        if self._loaded:
+            return
+        self._loaded = True
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        if data.get("version") != self.VERSION or data.get("instance") != self.instance:
+            self._dirty = True  # Written for another PiecesOS/user, drop it on save
+            return
+        for id, document in data.get("documents", {}).items():
+            self._add_document(id, document)
+
+    @staticmethod
+    def stamp(asset: "Asset") -> Optional[str]:
+        updated = getattr(asset, "updated", None)
+        return updated.value.isoformat() if updated and updated.value else None
+
+    def is_current(self, asset: "Asset") -> bool:
+        """True if the asset is indexed at its current `updated` timestamp."""
+        with self._lock:
+            self._load()
+            document = self._documents.get(asset.id)
+        return document is not None and document["updated"] == self.stamp(asset)
+
+    def add(self, asset: Optional["Asset"]):
+        """Index or re-index an asset."""
+        if asset is None or self.is_current(asset):
+            return
+        terms: Dict[str, float] = {}
+        for field, text in asset_fields(asset).items():
+            tokens = tokenize(text)
+            if not tokens:
+                continue
+            weight = FIELD_WEIGHTS[field]
+            for token in tokens:
+                terms[token] = terms.get(token, 0.0) + weight
+        # Dampen repeated terms so long contents do not dominate
+        terms = {
+            term: 1 + math.log(weight) if weight > 1 else weight
+            for term, weight in terms.items()
+        }
+        with self._lock:
+            self._load()
+            self._remove_document(asset.id)
+            self._add_document(asset.id, {"updated": self.stamp(asset), "terms": terms})
+            self._dirty = True
+
+    def remove(self, asset: Optional["Asset"]):
+        if asset is None:
+            return
+        with self._lock:
+            self._load()
+            if self._remove_document(asset.id):
+                self._dirty = True
+
+    def sync(self, snapshot: Dict[str, Optional["Asset"]]):
+        """
+        Drop the assets missing from the snapshot, e.g. deleted while the index
+        was not listening, and index the loaded assets that changed.
+        """
+        with self._lock:
+            self._load()
+            deleted = [id for id in self._documents if id not in snapshot]
+            for id in deleted:
+                self._remove_document(id)
+            if deleted:
+                self._dirty = True
+        for asset in snapshot.values():
+            self.add(asset)
+
+    def _add_document(self, id: str, document: Dict):
+        self._documents[id] = document
+        for term, weight in document["terms"].items():
+            postings = self._postings.get(term)
+            if postings is None:
+                postings = self._postings[term] = {}
+                self._sorted_terms = None
+            postings[id] = weight
+
+    def _remove_document(self, id: str) -> bool:
+        document = self._documents.pop(id, None)
+        if document is None:
+            return False
+        for term in document["terms"]:
+            postings = self._postings.get(term)
+            if postings is None:
+                continue
+            postings.pop(id, None)
+            if not postings:
+                del self._postings[term]
+                self._sorted_terms = None
+        return True
+
+    def _matching_terms(self, query_term: str) -> Iterable[Tuple[str, float]]:
+        """The indexed terms matching a query term with their score factor."""
+        if query_term in self._postings:
+            yield query_term, 1.0
+        if self._sorted_terms is None:
+            self._sorted_terms = sorted(self._postings)
+        terms = self._sorted_terms
+        start = bisect_left(terms, query_term)
+        for term in terms[start:]:
+            if not term.startswith(query_term):
+                break
+            if term != query_term:
+                yield term, PREFIX_FACTOR
+        if len(query_term) >= FUZZY_MIN_LENGTH:
+            for term in self._postings:
+                if (
+                    abs(len(term) - len(query_term)) <= 1
+                    and term[0] == query_term[0]
+                    and not term.startswith(query_term)
+                    and _one_edit_apart(term, query_term)
+                ):
+                    yield term, FUZZY_FACTOR
+
+    def search(
+        self,
+        query: str,
+        limit: Optional[int] = None,
+        ids: Optional[Iterable[str]] = None,
+    ) -> List[Tuple[str, float]]:
+        """
+        Search the index.
+
+        Args:
+            query: The search query.
+            limit: The maximum number of results.
+            ids: Only return these assets (e.g. the ones that still exist).
+
+        Returns:
+            The (asset id, score) pairs ranked by score, scores are in [0, 1].
+        """
+        query_terms = list(dict.fromkeys(tokenize(query)))
+        if not query_terms:
+            return []
+        allowed = set(ids) if ids is not None else None
+        scores: Dict[str, float] = {}
+        matched: Dict[str, int] = {}
+        with self._lock:
+            self._load()
+            total = max(len(self._documents), 1)
+            for query_term in query_terms:
+                best: Dict[str, float] = {}  # Best match of the query term per asset
+                for term, factor in self._matching_terms(query_term):
+                    postings = self._postings[term]
+                    idf = math.log(1 + total / len(postings))
+                    for id, weight in postings.items():
+                        score = weight * idf * factor
+                        if score > best.get(id, 0.0):
+                            best[id] = score
+                for id, score in best.items():
+                    scores[id] = scores.get(id, 0.0) + score
+                    matched[id] = matched.get(id, 0) + 1
+
+        # Assets matching every query term rank first
+        ranked = [
+            (id, score * matched[id] / len(query_terms))
+            for id, score in scores.items()
+            if allowed is None or id in allowed
+        ]
+        ranked.sort(key=lambda result: result[1], reverse=True)
+        if limit is not None:
+            ranked = ranked[:limit]
+        top = ranked[0][1] if ranked else 1.0
+        return [(id, round(score / top, 4)) for id, score in ranked]
+
+    def save(self):
+        """Write the index to disk if it changed since it was loaded."""
+        with self._lock:
+            if not self._dirty:
+                return
+            data = {
+                "version": self.VERSION,
+                "instance": self.instance,
+                "documents": dict(self._documents),
+            }
+            self._dirty = False
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_suffix(self.path.suffix + ".tmp")
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(data, f)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            print(f"Error saving the search index {self.path}: {e}")
+
+    def __len__(self) -> int:
+        with self._lock:
+            self._load()
+            return len(self._documents)
@@ -6,13 +6,20 @@ Attributes:
     identifiers_queue (queue.Queue): A queue for IDs to be processed.
     identifiers_set (set): A set for IDs currently in the queue.
     _api_call (Callable[[str], Union[Asset, Conversation]]): A callable that takes an ID and returns either an Asset or a Conversation.
+    _bulk_api_call (Callable[[List[str]], Dict[str, Union[Asset, Conversation]]]): An optional callable that fetches many IDs in one request.
+    batch_size (int): The maximum number of IDs coalesced into a single bulk request.
+    max_hydration_workers (int): The maximum number of concurrent per-ID API calls.
+    disk_cache (Optional[SnapshotDiskCache]): An optional persistent cache used to skip fetching unchanged objects.
     block (bool): A flag to indicate whether to wait for the queue to receive the first ID.
     first_shot (bool): A flag to indicate if it's the first time to open the websocket.
     lock (threading.Lock): A lock for thread safety.
     worker_thread (threading.Thread): A thread for processing the queue.
 
 Methods:
-    worker(): Continuously processes IDs from the queue and updates the identifiers_snapshot.
+    worker(): Continuously processes batches of IDs from the queue and updates the identifiers_snapshot.
+    fetch_identifiers(ids: List[str]): Fetches the given IDs concurrently, keeping their order.
+    cached_identifier(id: str, updated: datetime): Returns the object from the disk cache if it is up to date.
+    save_disk_caches(): Persists the disk cache of every subclass.
     update_identifier(id: str): Updates the identifier snapshot with the result of the API call.
     streamed_identifiers_callback(ids: StreamedIdentifiers): Callback method to handle streamed identifiers.
 
@@ -21,14 +28,17 @@ Example:
         pass
 """
 
+from concurrent.futures import ThreadPoolExecutor
 import queue
-from typing import List, Union, Callable, TYPE_CHECKING
+from datetime import datetime
+from typing import Dict, List, Optional, Union, Callable, TYPE_CHECKING
 from abc import ABC, abstractmethod
 import threading
 
 
 if TYPE_CHECKING:
     from ..client import PiecesClient
+    from ._disk_cache import SnapshotDiskCache
     from pieces._vendor.pieces_os_client.models.streamed_identifiers import StreamedIdentifiers
 
 
@@ -40,6 +50,8 @@ class StreamedIdentifiersCache(ABC):
 
     pieces_client: "PiecesClient"
     _initialized: threading.Event
+    batch_size: int = 100  # Max ids coalesced into one bulk request
+    max_hydration_workers: int = 4  # Max concurrent per-id requests
 
     def __init_subclass__(cls, **kwargs):
         super().__init_subclass__(**kwargs)
@@ -51,6 +63,13 @@ class StreamedIdentifiersCache(ABC):
         cls.block = True  # to wait for the queue to receive the first id
         cls.first_shot = True  # First time to open the websocket or not
         cls._lock = threading.Lock()  # Lock for thread safety
+        cls._prefetched = {}  # Map id:object returned by a bulk request
+        cls._stale = set()  # Ids updated while a bulk request was in flight
+        cls._bulk_missed = set()  # Ids a bulk request did not return
+        cls._bulk_in_flight = False
+        cls.disk_cache: Optional["SnapshotDiskCache"] = None
+        cls._executor: Optional[ThreadPoolExecutor] = None  # Hydration pool
+        cls._executor_workers = 0  # Size of the hydration pool
         cls._worker_thread = threading.Thread(target=cls.worker)
         cls._worker_thread.daemon = (
             True  # Ensure the thread exits when the main program does
@@ -70,6 +89,16 @@ class StreamedIdentifiersCache(ABC):
     def _api_call(cls, id: str):
         pass
 
+    @classmethod
+    def _bulk_api_call(cls, ids: List[str]) -> Dict[str, object]:
+        """
+        Fetch several identifiers in one request.
+        Subclasses that have a bulk endpoint should override this and return a
+        mapping of id to object, ids missing from the mapping are fetched one
+        by one through _api_call.
+        """
+        return {}
+
     @abstractmethod
     def _sort_first_shot(cls):
         """
@@ -85,17 +114,26 @@ class StreamedIdentifiersCache(ABC):
     def worker(cls):
         while True:
             try:
-                id = cls.identifiers_queue.get(block=cls.block, timeout=5)
-                with cls._lock:
-                    cls.identifiers_set.remove(id)  # Remove the id from the set
-                cls.update_identifier(id)
-                cls.identifiers_queue.task_done()
+                ids = cls._get_batch()
+                cls._prefetch(ids)
+                # Fetch concurrently but store in queue order to keep on_update ordered
+                for id, id_value in zip(ids, cls.fetch_identifiers(ids)):
+                    if id_value is not None:
+                        cls._store_identifier(id, id_value)
+                    cls.identifiers_queue.task_done()
             except queue.Empty:  # queue is empty and the block is false
                 if cls.block:
                     continue  # if there are more ids to load
 
+                with cls._lock:
+                    cls._prefetched.clear()
+                    cls._bulk_missed.clear()
+
                 if cls.first_shot:
                     cls.first_shot = False
+                    if cls.disk_cache:
+                        # The first shot lists every object, drop the deleted ones
+                        cls.disk_cache.retain(cls.identifiers_snapshot)
                     cls._initialized.set()
                     cls._sort_first_shot()
 
@@ -104,17 +142,119 @@ class StreamedIdentifiersCache(ABC):
                 print(f"Error in worker: {e}")
 
     @classmethod
-    def update_identifier(cls, identifier: str):
+    def _get_batch(cls) -> List[str]:
+        """
+        Block for the first id then drain up to batch_size ids without waiting.
+        """
+        ids = [cls.identifiers_queue.get(block=cls.block, timeout=5)]
+        while len(ids) < cls.batch_size:
+            try:
+                ids.append(cls.identifiers_queue.get_nowait())
+            except queue.Empty:
+                break
+        with cls._lock:
+            for id in ids:
+                cls.identifiers_set.discard(id)  # Remove the id from the set
+        return ids
+
+    @classmethod
+    def _prefetch(cls, ids: List[str]):
+        """
+        Populate _prefetched for the ids not already fetched by a previous bulk request.
+        """
+        with cls._lock:
+            missing = [
+                id
+                for id in ids
+                if id not in cls._prefetched and id not in cls._bulk_missed
+            ]
+            # not worth a bulk request when most of the batch is already fetched
+            if len(missing) < 2 or len(missing) * 2 < len(ids):
+                return
+            cls._bulk_in_flight = True
+        try:
+            objects = cls._bulk_api_call(missing)
+        except Exception as e:
+            print(f"Error in bulk request: {e}")
+            objects = {}
+        with cls._lock:
+            cls._bulk_in_flight = False
+            for id, obj in objects.items():
+                if id not in cls._stale:
+                    cls._prefetched[id] = obj
+            # Stragglers fall back to _api_call and are not bulk requested again
+            cls._bulk_missed.update(id for id in missing if id not in objects)
+            cls._stale.clear()
+
+    @classmethod
+    def fetch_identifiers(cls, ids: List[str]) -> List:
+        """
+        Fetch the ids using up to max_hydration_workers threads.
+        The results are returned in the same order as the ids, None for failed calls.
+        """
+        if cls.max_hydration_workers <= 1 or len(ids) <= 1:
+            return [cls._fetch_identifier(id) for id in ids]
+        return list(cls._hydration_pool().map(cls._fetch_identifier, ids))
+
+    @classmethod
+    def _hydration_pool(cls) -> ThreadPoolExecutor:
+        """
+        The thread pool of the cache, reused by every batch.
+        It is replaced when max_hydration_workers changes.
+        """
+        workers = cls.max_hydration_workers
+        with cls._lock:
+            if cls._executor is None or cls._executor_workers != workers:
+                if cls._executor is not None:
+                    cls._executor.shutdown(wait=False)
+                cls._executor = ThreadPoolExecutor(
+                    max_workers=workers, thread_name_prefix=f"{cls.__name__}Hydration"
+                )
+                cls._executor_workers = workers
+            return cls._executor
+
+    @classmethod
+    def _fetch_identifier(cls, identifier: str):
         try:
-            id_value = cls._api_call(identifier)
             with cls._lock:
-                cls.identifiers_snapshot[identifier] = id_value
-                cls.on_update(id_value)
+                id_value = cls._prefetched.pop(identifier, None)
+            if id_value is None:
+                id_value = cls._api_call(identifier)
             return id_value
         except Exception as e:
             print(f"Error updating identifier {identifier}: {e}")
             return None
 
+    @classmethod
+    def _store_identifier(cls, identifier: str, id_value):
+        with cls._lock:
+            cls.identifiers_snapshot[identifier] = id_value
+            cls.on_update(id_value)
+        if cls.disk_cache:
+            cls.disk_cache.put(id_value)
+
+    @classmethod
+    def cached_identifier(cls, identifier: str, updated: Optional[datetime]):
+        """
+        Returns the object from the disk cache if it was cached at the given updated timestamp.
+        """
+        if cls.disk_cache is None:
+            return None
+        return cls.disk_cache.get(identifier, updated)
+
+    @staticmethod
+    def save_disk_caches():
+        for subclass in StreamedIdentifiersCache.__subclasses__():
+            if subclass.disk_cache:
+                subclass.disk_cache.save()
+
+    @classmethod
+    def update_identifier(cls, identifier: str):
+        id_value = cls._fetch_identifier(identifier)
+        if id_value is not None:
+            cls._store_identifier(identifier, id_value)
+        return id_value
+
     @classmethod
     def streamed_identifiers_callback(cls, ids: "StreamedIdentifiers"):
         # Start the worker thread if it's not running
@@ -126,12 +266,25 @@ class StreamedIdentifiersCache(ABC):
 
         for item in ids.iterable:
             reference_id = getattr(item, cls._name()).id
+            cached = None
+            if cls.disk_cache and not item.deleted and item.updated:
+                cached = cls.cached_identifier(reference_id, item.updated.value)
 
             with cls._lock:
+                if (
+                    reference_id in cls.identifiers_set
+                    or reference_id in cls.identifiers_snapshot
+                ):
+                    # A newer version exists, drop any bulk fetched copy
+                    cls._prefetched.pop(reference_id, None)
+                    if cls._bulk_in_flight:
+                        cls._stale.add(reference_id)
                 if reference_id not in cls.identifiers_set:
                     if item.deleted:
                         # Asset deleted
                         cls.on_remove(cls.identifiers_snapshot.pop(reference_id, None))
+                        if cls.disk_cache:
+                            cls.disk_cache.remove(reference_id)
                     else:
                         if (
                             reference_id not in cls.identifiers_snapshot
@@ -141,6 +294,9 @@ class StreamedIdentifiersCache(ABC):
                                 reference_id: None,
                                 **cls.identifiers_snapshot,
                             }
+                        if cached is not None:
+                            # Unchanged since it was cached, the worker won't fetch it
+                            cls._prefetched[reference_id] = cached
                         cls.identifiers_queue.put(reference_id)  # Add id to the queue
                         cls.identifiers_set.add(reference_id)  # Add id to the set
 
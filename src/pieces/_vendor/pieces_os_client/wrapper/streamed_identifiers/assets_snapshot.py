@@ -1,10 +1,11 @@
 import threading
-from typing import TYPE_CHECKING, Dict
+from typing import TYPE_CHECKING, Dict, Optional
 
 from ._streamed_identifiers import StreamedIdentifiersCache
 
 if TYPE_CHECKING:
     from pieces._vendor.pieces_os_client.models.asset import Asset
+    from ._search_index import AssetSearchIndex
 
 
 class AssetSnapshot(StreamedIdentifiersCache):
@@ -14,6 +15,7 @@ class AssetSnapshot(StreamedIdentifiersCache):
 
     _initialized: threading.Event
     identifiers_snapshot: Dict[str, "Asset"] = {}  # Map id:return from the _api_call
+    search_index: Optional["AssetSearchIndex"] = None  # Local index of the cached assets
 
     @staticmethod
     def _name() -> str:
@@ -24,6 +26,13 @@ class AssetSnapshot(StreamedIdentifiersCache):
         asset = cls.pieces_client.asset_api.asset_snapshot(id)
         return asset
 
+    @classmethod
+    def _bulk_api_call(cls, ids):
+        if not cls.first_shot:  # The snapshot holds every asset, only worth it on the first shot
+            return {}
+        assets = cls.pieces_client.assets_api.assets_snapshot()
+        return {asset.id: asset for asset in assets.iterable}
+
     @staticmethod
     def _sort_first_shot():
         pass
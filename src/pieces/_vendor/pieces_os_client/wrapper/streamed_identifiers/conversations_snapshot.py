@@ -37,6 +37,15 @@ class ConversationsSnapshot(StreamedIdentifiersCache):
             conversation.id: conversation for conversation in sorted_conversations
         }
 
+    @classmethod
+    def _bulk_api_call(cls, ids):
+        if not cls.first_shot:  # The snapshot holds every conversation, only worth it on the first shot
+            return {}
+        conversations = cls.pieces_client.conversations_api.conversations_snapshot()
+        return {
+            conversation.id: conversation for conversation in conversations.iterable
+        }
+
     @classmethod
     def _api_call(cls, id):
         con = cls.pieces_client.conversation_api.conversation_get_specific_conversation(
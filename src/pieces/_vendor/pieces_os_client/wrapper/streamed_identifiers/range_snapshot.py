@@ -33,6 +33,13 @@ class RangeSnapshot(StreamedIdentifiersCache):
         )
         cls.identifiers_snapshot = {range.id: range for range in sorted_ranges}
 
+    @classmethod
+    def _bulk_api_call(cls, ids):
+        if not cls.first_shot:  # The snapshot holds every range, only worth it on the first shot
+            return {}
+        ranges = cls.pieces_client.ranges_api.ranges_snapshot()
+        return {range.id: range for range in ranges.iterable}
+
     @classmethod
     def _api_call(cls, id):
         range = cls.pieces_client.range_api.ranges_specific_range_snapshot(id)
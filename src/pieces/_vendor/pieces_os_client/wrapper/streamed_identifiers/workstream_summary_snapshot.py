@@ -33,6 +33,29 @@ class WorkstreamSummarySnapshot(StreamedIdentifiersCache):
             id
         )
 
+    @classmethod
+    def _bulk_api_call(cls, ids):
+        from pieces._vendor.pieces_os_client.models.flattened_workstream_summaries import (
+            FlattenedWorkstreamSummaries,
+        )
+        from pieces._vendor.pieces_os_client.models.referenced_workstream_summary import (
+            ReferencedWorkstreamSummary,
+        )
+        from pieces._vendor.pieces_os_client.models.workstream_summaries_batch_input import (
+            WorkstreamSummariesBatchInput,
+        )
+
+        output = cls.pieces_client.workstream_summaries_api.workstream_summaries_batch(
+            WorkstreamSummariesBatchInput(
+                workstream_summaries=FlattenedWorkstreamSummaries(
+                    iterable=[ReferencedWorkstreamSummary(id=id) for id in ids]
+                )
+            )
+        )
+        return {
+            summary.id: summary for summary in output.workstream_summaries.iterable
+        }
+
     @staticmethod
     def _sort_first_shot():
         pass
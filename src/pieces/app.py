@@ -1,6 +1,5 @@
 import sys
 import atexit
-import sentry_sdk
 import os
 
 from pieces.config.constants import PIECES_DATA_DIR
@@ -13,18 +12,24 @@ from pieces.pieces_argparser import PiecesArgparser
 from pieces.command_registry import CommandRegistry
 from pieces.settings import Settings
 from pieces.logger import Logger
-from pieces import __version__
-from pieces.command_interface import *  # noqa: F403
+from pieces import __version__, telemetry
 
 
 class PiecesCLI:
-    def __init__(self):
+    def __init__(self, lazy: bool = False):
+        """
+        Args:
+            lazy: Only import the command given in sys.argv instead of every
+                command, used when the CLI runs a single command.
+        """
         self.command: str
         self.parser = PiecesArgparser(
             description="Pieces CLI for interacting with the PiecesOS",
         )
         self.registry = CommandRegistry(self.parser)
-        self.registry.setup_parser(self.parser, __version__)
+        self.registry.setup_parser(
+            self.parser, __version__, sys.argv[1:] if lazy else None
+        )
         PiecesArgparser.parser = self.parser
 
     def _check_data_dir_permissions(self):
@@ -99,7 +104,9 @@ class PiecesCLI:
 
             res = Settings.logger.prompt(choices=["y", "n", "skip"], _default="n")
             if res.lower() == "y":
-                return OnboardingCommand.instance.execute()  # noqa: F405
+                from pieces.command_interface.simple_commands import OnboardingCommand
+
+                return OnboardingCommand.instance.execute()
             elif res.lower() == "skip":
                 Settings.user_config.skip_onboarding = True
 
@@ -120,10 +127,13 @@ class PiecesCLI:
             "open",
             "config",
             "completion",
+            "daemon",
         ] and not (command == "mcp" and mcp_subcommand == "start"):
             bypass_login = (
                 True if (command in ["version", "logout", "login"]) else False
             )
+            # Initialize Sentry while waiting for PiecesOS
+            telemetry.start()
             Settings.startup(bypass_login)
         Settings.logger.debug(f"Running command {command} using: {args}")
         args.func(**vars(args))
@@ -138,18 +148,10 @@ def main():
         environment = "production"
 
     if __version__ != "dev":
-        sentry_sdk.init(
-            # https://sentry.zendesk.com/hc/en-us/articles/26741783759899-My-DSN-key-is-publicly-visible-is-this-a-security-vulnerability
-            dsn="https://c1b7b0748590decc1aac426add5f4e12@o552351.ingest.us.sentry.io/4509837316980737",
-            release=__version__,
-            send_default_pii=True,
-            environment=environment,
-        )
-    else:
-        sentry_sdk.init(None)
-    atexit.register(lambda: sentry_sdk.flush(timeout=2))
+        telemetry.setup(__version__, environment)
+    atexit.register(telemetry.flush)
 
-    cli = PiecesCLI()
+    cli = PiecesCLI(lazy=True)
     try:
         cli.run()
     except (KeyboardInterrupt, EOFError):
@@ -160,11 +162,11 @@ def main():
                 error_message="Operation cancelled by user",
             )
     except SystemExit:
-        sentry_sdk.flush(2)
+        telemetry.flush()
         raise
     except Exception as e:
         if __version__ != "dev":
-            sentry_sdk.capture_exception(e)
+            telemetry.capture_exception(e)
         if isinstance(e, HeadlessError) or Settings.headless_mode:
             HeadlessOutput.handle_exception(e, PiecesCLI.command or "unknown")
         elif __version__ == "dev":
@@ -178,15 +180,18 @@ def main():
                 if not Settings.run_in_loop:
                     sys.exit(2)
             except SystemExit:
-                sentry_sdk.flush(2)
+                telemetry.flush()
                 raise
     finally:
         from pieces._vendor.pieces_os_client.wrapper.websockets.base_websocket import (
             BaseWebsocket,
         )
 
-        sentry_sdk.flush(2)
+        telemetry.flush()
         BaseWebsocket.close_all()
+        Settings.logger.debug(
+            f"Connection pool stats: {Settings.pieces_client.connection_pool_stats()}"
+        )
 
 
 if __name__ == "__main__":
@@ -41,6 +41,9 @@ class BaseCommand(ABC):
     def command_func(self, *args, **kwargs):
         # Only enable headless mode if the command supports it and it's requested
         Settings.headless_mode = kwargs.get("headless", False) and self.support_headless
+        Settings.headless_stream = Settings.headless_mode and kwargs.get(
+            "stream", False
+        )
         return_code = self.execute(*args, **kwargs)
         if not Settings.run_in_loop:
             if isinstance(return_code, int):
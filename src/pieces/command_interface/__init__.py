@@ -1,53 +1,77 @@
-from .config_command import ConfigCommand
-from .list_command import ListCommand
-from .auth_commands import LoginCommand, LogoutCommand
-from .search_command import SearchCommand
-from .asset_commands import (
-    SaveCommand,
-    DeleteCommand,
-    CreateCommand,
-    ShareCommand,
-    EditCommand,
-)
-from .simple_commands import (
-    ExecuteCommand,
-    RunCommand,
-    FeedbackCommand,
-    ContributeCommand,
-    InstallCommand,
-    OnboardingCommand,
-)
-from .ask_command import AskCommand
-from .conversation_commands import ChatsCommand, ChatCommand
-from .commit_command import CommitCommand
-from .open_command import OpenCommand
-from .mcp_command_group import MCPCommandGroup
-from .completions import CompletionCommand
-from .tui_command import TUICommand
+"""
+The CLI commands.
 
-__all__ = [
-    "ConfigCommand",
-    "ListCommand",
-    "LoginCommand",
-    "LogoutCommand",
-    "SearchCommand",
-    "SaveCommand",
-    "DeleteCommand",
-    "CreateCommand",
-    "ShareCommand",
-    "EditCommand",
-    "ExecuteCommand",
-    "RunCommand",
-    "AskCommand",
-    "ChatsCommand",
-    "ChatCommand",
-    "CommitCommand",
-    "OnboardingCommand",
-    "FeedbackCommand",
-    "ContributeCommand",
-    "InstallCommand",
-    "OpenCommand",
-    "MCPCommandGroup",
-    "CompletionCommand",
-    "TUICommand",
-]
+The command modules are imported on first access so that importing one
+command (see CommandRegistry) does not import every other command and
+their dependencies.
+"""
+
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .config_command import ConfigCommand
+    from .list_command import ListCommand
+    from .auth_commands import LoginCommand, LogoutCommand
+    from .search_command import SearchCommand
+    from .asset_commands import (
+        SaveCommand,
+        DeleteCommand,
+        CreateCommand,
+        ShareCommand,
+        EditCommand,
+    )
+    from .simple_commands import (
+        ExecuteCommand,
+        RunCommand,
+        FeedbackCommand,
+        ContributeCommand,
+        InstallCommand,
+        OnboardingCommand,
+    )
+    from .ask_command import AskCommand
+    from .conversation_commands import ChatsCommand, ChatCommand
+    from .commit_command import CommitCommand
+    from .open_command import OpenCommand
+    from .mcp_command_group import MCPCommandGroup
+    from .completions import CompletionCommand
+    from .tui_command import TUICommand
+    from .daemon_command_group import DaemonCommandGroup
+
+# Command class: module defining it
+_COMMAND_MODULES = {
+    "ConfigCommand": "config_command",
+    "ListCommand": "list_command",
+    "LoginCommand": "auth_commands",
+    "LogoutCommand": "auth_commands",
+    "SearchCommand": "search_command",
+    "SaveCommand": "asset_commands",
+    "DeleteCommand": "asset_commands",
+    "CreateCommand": "asset_commands",
+    "ShareCommand": "asset_commands",
+    "EditCommand": "asset_commands",
+    "ExecuteCommand": "simple_commands",
+    "RunCommand": "simple_commands",
+    "AskCommand": "ask_command",
+    "ChatsCommand": "conversation_commands",
+    "ChatCommand": "conversation_commands",
+    "CommitCommand": "commit_command",
+    "OnboardingCommand": "simple_commands",
+    "FeedbackCommand": "simple_commands",
+    "ContributeCommand": "simple_commands",
+    "InstallCommand": "simple_commands",
+    "OpenCommand": "open_command",
+    "MCPCommandGroup": "mcp_command_group",
+    "CompletionCommand": "completions",
+    "TUICommand": "tui_command",
+    "DaemonCommandGroup": "daemon_command_group",
+}
+
+__all__ = list(_COMMAND_MODULES)
+
+
+def __getattr__(name: str):
+    module = _COMMAND_MODULES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(import_module(f".{module}", __name__), name)
@@ -1,5 +1,10 @@
 import argparse
+from typing import Union
 from pieces.base_command import BaseCommand
+from pieces.headless.exceptions import HeadlessError
+from pieces.headless.models.ask import create_ask_success
+from pieces.headless.models.base import CommandResult, ErrorCode
+from pieces.settings import Settings
 from pieces.urls import URLs
 from pieces.copilot import AskStream
 from pieces.help_structure import HelpBuilder
@@ -8,6 +13,8 @@ from pieces.help_structure import HelpBuilder
 class AskCommand(BaseCommand):
     """Command to ask questions to the Pieces Copilot."""
 
+    support_headless = True
+
     def __init__(self):
         super().__init__()
         self.ask_stream = AskStream()
@@ -48,6 +55,17 @@ class AskCommand(BaseCommand):
             "pieces ask 'what did Alex and I pair on December 5th' --ltm"
         ).example("pieces ask 'what changes did I make today in Cursor editor' --ltm")
 
+        builder.section(
+            header="Headless Mode:",
+            command_template="pieces --headless [--stream] ask '[YOUR_QUERY_HERE]'",
+        ).example(
+            "pieces --headless ask 'explain Python decorators'",
+            "Print the answer as JSON once it is complete",
+        ).example(
+            "pieces --headless --stream ask 'explain Python decorators'",
+            "Stream the answer chunks as newline-delimited JSON",
+        )
+
         return builder.build()
 
     def get_docs(self) -> str:
@@ -85,7 +103,21 @@ class AskCommand(BaseCommand):
             help="Enable Long-Term Memory (LTM) to include prior context",
         )
 
-    def execute(self, **kwargs) -> int:
+    def execute(self, **kwargs) -> Union[int, CommandResult]:
         """Execute the ask command."""
-        self.ask_stream.ask(**kwargs)
-        return 0
+        answer = self.ask_stream.ask(**kwargs)
+        if not Settings.headless_mode:
+            return 0
+        if self.ask_stream.error_message or answer is None:
+            raise HeadlessError(
+                self.ask_stream.error_message or "No answer received",
+                ErrorCode.COMMAND_ERROR,
+            )
+        return CommandResult(
+            0,
+            create_ask_success(
+                kwargs.get("query") or "",
+                None if Settings.headless_stream else answer,
+                self.ask_stream.conversation_id,
+            ),
+        )
@@ -0,0 +1,198 @@
+import argparse
+import errno
+import subprocess
+import sys
+import time
+
+from pieces.base_command import BaseCommand, CommandGroup
+from pieces.daemon import FORWARDED_COMMANDS, is_supported
+from pieces.daemon.client import request
+from pieces.help_structure import HelpBuilder
+from pieces.settings import Settings
+
+START_TIMEOUT = 60  # Seconds to wait for the daemon to be ready
+
+
+def _unsupported() -> int:
+    Settings.logger.print(
+        "[red]The daemon needs Unix domain sockets, which this platform lacks."
+    )
+    return 1
+
+
+class DaemonStartCommand(BaseCommand):
+    """Subcommand to start the daemon."""
+
+    _is_command_group = True
+
+    def get_name(self) -> str:
+        return "start"
+
+    def get_help(self) -> str:
+        return "Start the daemon in the background"
+
+    def get_description(self) -> str:
+        return (
+            "Start a background daemon keeping PiecesOS connected, the next "
+            f"{', '.join(sorted(FORWARDED_COMMANDS))} commands are run by it"
+        )
+
+    def get_examples(self):
+        """Return structured examples for the daemon start command."""
+        builder = HelpBuilder()
+
+        builder.section(
+            header="Start the Daemon:", command_template="pieces daemon start"
+        ).example("pieces daemon start", "Start the daemon in the background").example(
+            "pieces daemon start --foreground", "Run the daemon in this terminal"
+        )
+
+        return builder.build()
+
+    def add_arguments(self, parser: argparse.ArgumentParser):
+        parser.add_argument(
+            "--foreground",
+            action="store_true",
+            help="Run the daemon in this process instead of the background",
+        )
+
+    def execute(self, **kwargs) -> int:
+        if not is_supported():
+            return _unsupported()
+        status = request({"control": "ping"})
+        if status:
+            Settings.logger.print(
+                f"The daemon is already running (pid {status['pid']})"
+            )
+            return 0
+        if kwargs.get("foreground"):
+            from pieces.daemon.server import run_daemon
+
+            Settings.logger.print("Running the daemon, press Ctrl+C to stop it")
+            try:
+                run_daemon()
+            except OSError as e:
+                if e.errno != errno.EADDRINUSE:
+                    raise
+                # Another daemon started meanwhile, it keeps its socket
+                Settings.logger.print("The daemon is already running")
+            return 0
+
+        # Start PiecesOS and sign in here, the daemon cannot prompt
+        Settings.startup()
+        process = subprocess.Popen(
+            self._daemon_argv(),
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            start_new_session=True,
+        )
+        deadline = time.monotonic() + START_TIMEOUT
+        with Settings.logger.console.status("Starting the daemon..."):
+            while time.monotonic() < deadline and process.poll() is None:
+                status = request({"control": "ping"})
+                if status:
+                    Settings.logger.print(f"Daemon started (pid {status['pid']})")
+                    return 0
+                time.sleep(0.1)
+        process.kill()
+        Settings.logger.print("[red]The daemon failed to start")
+        return 1
+
+    def _is_frozen(self) -> bool:
+        """Check if running from PyInstaller bundle."""
+        return getattr(sys, "frozen", False) and hasattr(sys, "_MEIPASS")
+
+    def _daemon_argv(self) -> list:
+        """The command running the daemon in the foreground."""
+        # The executable of a PyInstaller bundle is the pieces binary itself
+        if self._is_frozen():
+            prefix = [sys.executable]
+        else:
+            prefix = [sys.executable, "-m", "pieces"]
+        return prefix + ["daemon", "start", "--foreground"]
+
+
+class DaemonStopCommand(BaseCommand):
+    """Subcommand to stop the daemon."""
+
+    _is_command_group = True
+
+    def get_name(self) -> str:
+        return "stop"
+
+    def get_help(self) -> str:
+        return "Stop the daemon"
+
+    def add_arguments(self, parser: argparse.ArgumentParser):
+        pass
+
+    def execute(self, **kwargs) -> int:
+        if not is_supported():
+            return _unsupported()
+        if request({"control": "stop"}):
+            Settings.logger.print("Daemon stopped")
+        else:
+            Settings.logger.print("The daemon is not running")
+        return 0
+
+
+class DaemonStatusCommand(BaseCommand):
+    """Subcommand to show the daemon status."""
+
+    _is_command_group = True
+
+    def get_name(self) -> str:
+        return "status"
+
+    def get_help(self) -> str:
+        return "Show whether the daemon is running"
+
+    def add_arguments(self, parser: argparse.ArgumentParser):
+        pass
+
+    def execute(self, **kwargs) -> int:
+        status = request({"control": "ping"}) if is_supported() else None
+        if not status:
+            Settings.logger.print("The daemon is not running")
+            return 1
+        Settings.logger.print(
+            f"The daemon is running (pid {status['pid']},"
+            f" version {status['version']}, {status['commands_run']} commands run)"
+        )
+        return 0
+
+
+class DaemonCommandGroup(CommandGroup):
+    """Daemon command group keeping PiecesOS connected between commands."""
+
+    def get_name(self) -> str:
+        return "daemon"
+
+    def get_help(self) -> str:
+        return "Run commands faster from a background daemon"
+
+    def get_description(self) -> str:
+        return (
+            "Manage a background daemon keeping the connection to PiecesOS and "
+            "its caches warm, the CLI forwards the commands it can run to it and "
+            "runs them locally when it is not running"
+        )
+
+    def get_examples(self):
+        """Return structured examples for the daemon command group."""
+        builder = HelpBuilder()
+
+        builder.section(
+            header="Daemon Management:", command_template="pieces daemon [SUBCOMMAND]"
+        ).example("pieces daemon start", "Start the daemon").example(
+            "pieces daemon status", "Check if the daemon is running"
+        ).example("pieces daemon stop", "Stop the daemon")
+
+        return builder.build()
+
+    def _register_subcommands(self):
+        """Register all daemon subcommands."""
+        self.add_subcommand(DaemonStartCommand())
+        self.add_subcommand(DaemonStopCommand())
+        self.add_subcommand(DaemonStatusCommand())
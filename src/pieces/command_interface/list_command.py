@@ -1,5 +1,8 @@
 import argparse
+from typing import Union
 from pieces.base_command import BaseCommand
+from pieces.headless.models.base import CommandResult
+from pieces.settings import Settings
 from pieces.urls import URLs
 from pieces.core.list_command import ListCommand as ListCore
 from pieces.help_structure import HelpBuilder
@@ -8,6 +11,8 @@ from pieces.help_structure import HelpBuilder
 class ListCommand(BaseCommand):
     """Command to list various Pieces resources."""
 
+    support_headless = True
+
     def get_name(self) -> str:
         return "list"
 
@@ -40,6 +45,14 @@ class ListCommand(BaseCommand):
             "pieces list --editor", "List materials and open selected in editor"
         ).example("pieces drive", "Alias for list command")
 
+        builder.section(
+            header="Headless Mode:",
+            command_template="pieces --headless [--stream] list [TYPE]",
+        ).example("pieces --headless list models", "Print the models as JSON").example(
+            "pieces --headless --stream list",
+            "Stream the materials as newline-delimited JSON",
+        )
+
         return builder.build()
 
     def get_docs(self) -> str:
@@ -64,7 +77,9 @@ class ListCommand(BaseCommand):
             help="Open the chosen material in the editor",
         )
 
-    def execute(self, **kwargs) -> int:
+    def execute(self, **kwargs) -> Union[int, CommandResult]:
         """Execute the list command."""
+        if Settings.headless_mode:
+            return CommandResult(0, ListCore.list_headless(**kwargs))
         ListCore.list_command(**kwargs)
         return 0
@@ -1,7 +1,7 @@
 import argparse
 from pieces.base_command import BaseCommand
 from pieces.urls import URLs
-from pieces.core import open_command
+from pieces.core.open_command import open_command
 from pieces.help_structure import HelpBuilder
 
 
@@ -1,14 +1,18 @@
 import argparse
-from typing import Optional
+from typing import Optional, Union
 from pieces.base_command import BaseCommand
+from pieces.headless.models.base import CommandResult
+from pieces.settings import Settings
 from pieces.urls import URLs
-from pieces.core.search_command import search
+from pieces.core.search_command import search, search_headless
 from pieces.help_structure import HelpBuilder
 
 
 class SearchCommand(BaseCommand):
     """Command to search for materials."""
 
+    support_headless = True
+
     def get_name(self) -> str:
         return "search"
 
@@ -37,7 +41,24 @@ class SearchCommand(BaseCommand):
             "pieces search --mode ncs 'async await'", "Neural code search"
         ).example(
             "pieces search --mode fts 'TODO comments'", "Full text search"
-        ).example("pieces search --mode fuzzy 'auth'", "Fuzzy search (default)")
+        ).example(
+            "pieces search --mode fuzzy 'auth'", "Fuzzy search (default)"
+        ).example("pieces search --mode all 'auth'", "Every search mode at once")
+
+        builder.section(
+            header="Limit Results:",
+            command_template="pieces search --limit [N] [QUERY]",
+        ).example("pieces search --limit 10 'auth'", "Show the 10 best matches")
+
+        builder.section(
+            header="Headless Mode:",
+            command_template="pieces --headless [--stream] search [QUERY]",
+        ).example(
+            "pieces --headless search --mode all 'auth'", "Print the results as JSON"
+        ).example(
+            "pieces --headless --stream search 'auth'",
+            "Stream the results as newline-delimited JSON",
+        )
 
         return builder.build()
 
@@ -58,13 +79,22 @@ class SearchCommand(BaseCommand):
             type=str,
             dest="search_type",
             default="fuzzy",
-            choices=["fuzzy", "ncs", "fts"],
-            help="Type of search",
+            choices=["fuzzy", "ncs", "fts", "all"],
+            help="Type of search, all runs every type at once and merges the results",
+        )
+        parser.add_argument(
+            "--limit",
+            type=int,
+            dest="limit",
+            default=None,
+            help="Maximum number of results to show",
         )
 
-    def execute(self, **kwargs) -> int:
+    def execute(self, **kwargs) -> Union[int, CommandResult]:
         """Execute the search command."""
         query = kwargs.pop("query", None)
         if query:
             query = [query]
+        if Settings.headless_mode:
+            return CommandResult(0, search_headless(query, **kwargs))
         return search(query, **kwargs)
@@ -4,13 +4,13 @@ from pieces.base_command import BaseCommand
 from pieces.headless.models.base import CommandResult
 from pieces.headless.models.version import create_version_success
 from pieces.urls import URLs
-from pieces.core import (
-    loop,
+from pieces.core.cli_loop import loop
+from pieces.core.feedbacks import (
     feedback as feedback_func,
     contribute as contribute_func,
-    onboarding_command,
-    PiecesInstaller,
 )
+from pieces.core.onboarding import onboarding_command
+from pieces.core.install_pieces_os import PiecesInstaller
 from pieces.core.execute_command import ExecuteCommand as CoreExecute
 from pieces.gui import print_version_details
 from pieces import __version__
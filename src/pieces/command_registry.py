@@ -1,11 +1,83 @@
-from typing import Dict, List, Optional
+from importlib import import_module
+from typing import Dict, List, NamedTuple, Optional, Sequence, Tuple
 from pieces.base_command import BaseCommand
 from pieces.pieces_argparser import PiecesArgparser
 from argparse import _SubParsersAction
 
 
+class CommandSpec(NamedTuple):
+    """Lightweight metadata of a command, used to list it without importing it."""
+
+    name: str
+    help: str
+    module: str  # Module of pieces.command_interface defining the command
+    aliases: Tuple[str, ...] = ()
+
+
+# Every top level command, in the order they are listed in `pieces --help`.
+# Must match the command classes, see tests/test_command_registry.py
+COMMAND_SPECS: List[CommandSpec] = [
+    CommandSpec("config", "Configure settings", "config_command"),
+    CommandSpec(
+        "list", "List materials or apps or models", "list_command", ("drive",)
+    ),
+    CommandSpec("login", "Sign into PiecesOS", "auth_commands"),
+    CommandSpec("logout", "Sign out from PiecesOS", "auth_commands"),
+    CommandSpec(
+        "search",
+        "Perform a search for materials using the specified query string",
+        "search_command",
+    ),
+    CommandSpec(
+        "modify", "Updates the current material content", "asset_commands", ("save",)
+    ),
+    CommandSpec("delete", "Delete the current material", "asset_commands"),
+    CommandSpec("create", "Create a new material", "asset_commands"),
+    CommandSpec("share", "Share the current material", "asset_commands"),
+    CommandSpec("edit", "Edit an existing material's metadata", "asset_commands"),
+    CommandSpec("run", "Runs CLI in a loop", "simple_commands"),
+    CommandSpec("execute", "Execute shell or bash materials", "simple_commands"),
+    CommandSpec("feedback", "Submit feedback", "simple_commands"),
+    CommandSpec("contribute", "How to contribute", "simple_commands"),
+    CommandSpec("install", "Install PiecesOS", "simple_commands"),
+    CommandSpec("onboarding", "Start the onboarding process", "simple_commands"),
+    CommandSpec("version", "Gets version of PiecesOS", "simple_commands"),
+    CommandSpec("restart", "Restart PiecesOS", "simple_commands"),
+    CommandSpec("ask", "Ask a question to the Copilot", "ask_command"),
+    CommandSpec(
+        "chats", "Print all chats", "conversation_commands", ("conversations",)
+    ),
+    CommandSpec("chat", "Select a chat", "conversation_commands", ("conversation",)),
+    CommandSpec(
+        "commit",
+        "Auto-generate a GitHub commit message and commit changes",
+        "commit_command",
+    ),
+    CommandSpec("open", "Opens PiecesOS or Applet", "open_command"),
+    CommandSpec(
+        "mcp", "setup the MCP server for an integration", "mcp_command_group"
+    ),
+    CommandSpec("completion", "Display shell completion scripts", "completions"),
+    CommandSpec(
+        "tui", "Launch the TUI (Text User Interface) mode", "tui_command", ("ui",)
+    ),
+    CommandSpec(
+        "daemon", "Run commands faster from a background daemon", "daemon_command_group"
+    ),
+]
+
+# Commands that dispatch other commands, they need every command registered
+EAGER_COMMANDS = {"run"}
+
+
 class CommandRegistry:
-    """Registry for managing all CLI commands."""
+    """
+    Registry for managing all CLI commands.
+
+    The parser is either set up with every command, or lazily: only the command
+    being run is imported and registered with its arguments, the others are
+    registered from their CommandSpec so they are still listed and suggested.
+    """
 
     def __init__(self, parser: PiecesArgparser):
         self.commands: Dict[str, BaseCommand] = {}
@@ -42,8 +114,44 @@ class CommandRegistry:
                 unique_commands.append(command)
         return unique_commands
 
-    def setup_parser(self, parser: PiecesArgparser, version: str):
-        """Set up the argument parser with all registered commands."""
+    def register_spec(self, spec: CommandSpec):
+        """Register a command by its name and help only, without importing it."""
+        self.command_subparser.add_parser(
+            spec.name, help=spec.help, aliases=list(spec.aliases)
+        )
+
+    @staticmethod
+    def load(spec: CommandSpec) -> BaseCommand:
+        """Import the module of a command and return the command."""
+        import_module(f"pieces.command_interface.{spec.module}")
+        return next(
+            command for command in BaseCommand.commands if command.name == spec.name
+        )
+
+    @staticmethod
+    def find_spec(argv: Sequence[str]) -> Optional[CommandSpec]:
+        """The spec of the command given in argv, the global options come first."""
+        name = next((arg for arg in argv if not arg.startswith("-")), None)
+        for spec in COMMAND_SPECS:
+            if name == spec.name or name in spec.aliases:
+                return spec
+        return None
+
+    def setup_parser(
+        self,
+        parser: PiecesArgparser,
+        version: str,
+        argv: Optional[Sequence[str]] = None,
+    ):
+        """
+        Set up the argument parser with the commands.
+
+        Args:
+            parser: The top level parser.
+            version: The CLI version printed by --version.
+            argv: The arguments the CLI runs with. When given, only the command
+                they run is imported, otherwise every command is.
+        """
         self.parser = parser
 
         # Add global arguments
@@ -63,11 +171,26 @@ class CommandRegistry:
             action="store_true",
             help="Run in headless mode with JSON output (non-interactive)",
         )
+        parser.add_argument(
+            "--stream",
+            action="store_true",
+            help="With --headless, stream newline-delimited JSON events as they arrive",
+        )
 
         # Create subparsers for commands
         self.command_subparser = parser.add_subparsers(dest="command")
-        for command in BaseCommand.commands:
-            self.register(command)
+        spec = self.find_spec(argv) if argv is not None else None
+        if argv is None or (spec and spec.name in EAGER_COMMANDS):
+            for command_spec in COMMAND_SPECS:
+                import_module(f"pieces.command_interface.{command_spec.module}")
+            for command in BaseCommand.commands:
+                self.register(command)
+        else:
+            for command_spec in COMMAND_SPECS:
+                if command_spec is spec:
+                    self.register(self.load(command_spec))
+                else:
+                    self.register_spec(command_spec)
 
         parser.set_defaults(
             func=lambda **kwargs: print(version)
@@ -43,3 +43,13 @@ class CLIManager(BaseConfigManager[CLIConfigSchema]):
         self.config.theme = value
         self.save()
 
+    @property
+    def max_hydration_workers(self) -> int:
+        """Get configured number of hydration workers."""
+        return self.config.max_hydration_workers
+
+    @max_hydration_workers.setter
+    def max_hydration_workers(self, value: int) -> None:
+        """Set number of hydration workers and save."""
+        self.config.max_hydration_workers = value
+        self.save()
@@ -2,7 +2,7 @@
 CLI configuration schema.
 """
 
-from typing import Optional
+from typing import List, Optional
 from pydantic import BaseModel, Field, field_validator
 from pieces.config.utils import validate_semver
 
@@ -15,6 +15,63 @@ class CLIConfigSchema(BaseModel):
     )
     editor: Optional[str] = Field(default=None, description="Default editor command")
     theme: str = Field(default="pieces-dark", description="TUI theme preference")
+    max_hydration_workers: int = Field(
+        default=4,
+        ge=1,
+        description="Concurrent requests used to load materials and chats",
+    )
+    connection_pool_maxsize: Optional[int] = Field(
+        default=None,
+        ge=1,
+        description="Pooled connections to PiecesOS, by default 5 per CPU "
+        "or max_hydration_workers per snapshot cache if more",
+    )
+    connection_pool_block: bool = Field(
+        default=False,
+        description="Wait for a pooled connection instead of opening a new one",
+    )
+    request_timeout: Optional[float] = Field(
+        default=None,
+        gt=0,
+        description="Default timeout in seconds for requests to PiecesOS",
+    )
+    tcp_keepalive: bool = Field(
+        default=True, description="Enable TCP keep-alive on PiecesOS connections"
+    )
+    local_search_index: bool = Field(
+        default=False,
+        description="Keep a local index of the materials, used by fuzzy search while they are streamed",
+    )
+    startup_cache_ttl: float = Field(
+        default=0,
+        ge=0,
+        description="Seconds the PiecesOS models are reused across runs, 0 to disable",
+    )
+    tui_stream_coalesce_interval: float = Field(
+        default=0.05,
+        ge=0,
+        description="Seconds streamed Copilot chunks are batched for in the TUI, 0 to disable",
+    )
+    mcp_max_concurrent_calls: int = Field(
+        default=8,
+        ge=1,
+        description="Tool calls the MCP gateway sends to PiecesOS at the same time",
+    )
+    mcp_call_timeout: Optional[float] = Field(
+        default=120,
+        gt=0,
+        description="Timeout in seconds of a single MCP tool call, None to disable",
+    )
+    mcp_cached_tools: List[str] = Field(
+        default_factory=list,
+        description="Idempotent MCP tools whose results are cached (e.g. ask_pieces_ltm)",
+    )
+    mcp_cache_ttl: float = Field(
+        default=30, gt=0, description="Seconds a cached MCP tool result is reused"
+    )
+    mcp_cache_max_entries: int = Field(
+        default=128, ge=1, description="Maximum number of cached MCP tool results"
+    )
 
     @field_validator("editor")
     @classmethod
@@ -1,11 +1,13 @@
 from typing import TYPE_CHECKING
 from pieces.copilot.ltm import enable_ltm
+from pieces.headless.output import HeadlessOutput
 from pieces.settings import Settings
 import os
 import threading
 
 from rich.live import Live
-from rich.markdown import Markdown
+
+from pieces.copilot.markdown_stream import MarkdownStream
 
 from pieces._vendor.pieces_os_client.wrapper.basic_identifier.chat import BasicChat
 from pieces._vendor.pieces_os_client.wrapper.websockets.ask_ws import AskStreamWS
@@ -17,8 +19,13 @@ if TYPE_CHECKING:
 
 
 class AskStream:
+    REFRESH_PER_SECOND = 12  # Max redraws of the streamed answer
+
     def __init__(self):
         self.message_compeleted = threading.Event()
+        self._answer_chunks = []
+        self.error_message = None  # Error of the last answer in headless mode
+        self.conversation_id = None
 
     def on_message(self, response: "QGPTStreamOutput"):
         """Handle incoming websocket messages."""
@@ -28,14 +35,18 @@ class AskStream:
 
                 for answer in answers:
                     text = answer.text
-                    self.final_answer += text
                     if text:
-                        self.live.update(Markdown(self.final_answer), refresh=True)
+                        self._answer_chunks.append(text)
+                        if not Settings.headless_mode:
+                            self.markdown_stream.feed(text)
+                        elif Settings.headless_stream:
+                            HeadlessOutput.output_event("ask", "chunk", {"text": text})
 
             if response.status == "COMPLETED":
-                self.live.update(Markdown(self.final_answer), refresh=True)
-                self.live.stop()
+                if not Settings.headless_mode:
+                    self.markdown_stream.finish()
 
+                self.conversation_id = response.conversation
                 self.message_compeleted.set()
                 Settings.pieces_client.copilot.chat = BasicChat(response.conversation)
             elif response.status == "FAILED":
@@ -43,7 +54,10 @@ class AskStream:
                     response.error_message
                     or "An error occurred Please try again or check your input."
                 )
-                if error_message == "UserSubscriptionRequired":
+                if Settings.headless_mode:
+                    self.error_message = error_message
+                    self.message_compeleted.set()
+                elif error_message == "UserSubscriptionRequired":
                     Settings.logger.print(
                         "Please upgrade to Pieces Pro or change that model using `pieces list models`"
                     )
@@ -131,13 +145,23 @@ class AskStream:
             return
 
         self.final_answer = ""
-        self.live = Live()
-        self.live.start(refresh=True)  # Start the live
+        self._answer_chunks = []
+        self.error_message = None
+        self.conversation_id = None
+        if Settings.headless_mode:
+            self.live = None  # The answer is returned (or streamed) as JSON
+            if Settings.headless_stream:
+                HeadlessOutput.output_event("ask", "progress", {"status": "asking"})
+        else:
+            self.live = Live(refresh_per_second=self.REFRESH_PER_SECOND)
+            self.markdown_stream = MarkdownStream(self.live)
+            self.live.start(refresh=True)  # Start the live
 
         Settings.pieces_client.copilot.stream_question(query)
 
         finishes = self.message_compeleted.wait(Settings.TIMEOUT)
         self.message_compeleted.clear()
+        self.final_answer = "".join(self._answer_chunks)
 
         if not Settings.run_in_loop:
             AskStreamWS.instance.close()  # Close the websocket if we are not run in loop
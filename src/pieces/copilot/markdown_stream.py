@@ -0,0 +1,141 @@
+import re
+from typing import Optional
+
+from rich.console import Console, ConsoleOptions, RenderResult
+from rich.live import Live
+from rich.markdown import Markdown
+from rich.segment import Segment
+
+# Opening or closing line of a fenced code block
+FENCE_RE = re.compile(r"^ {0,3}(`{3,}|~{3,})")
+
+
+def _is_blank(segment: Segment) -> bool:
+    # Padding of code blocks is whitespace too, but it has a background
+    return not segment.text.strip() and not (
+        segment.style and segment.style.bgcolor
+    )
+
+
+class _MarkdownBlock:
+    """
+    Renders markdown without its leading and trailing blank lines.
+
+    Blocks rendered on their own are then joined by exactly one blank line,
+    like rich puts between the elements of a full document.
+    """
+
+    def __init__(self, text: str, separated: bool):
+        self.markdown = Markdown(text)
+        self.separated = separated  # Add a blank line before, a block was printed above
+
+    def __rich_console__(
+        self, console: Console, options: ConsoleOptions
+    ) -> RenderResult:
+        lines = console.render_lines(self.markdown, options, pad=False)
+        blank = [all(map(_is_blank, line)) for line in lines]
+        if False in blank:
+            lines = lines[blank.index(False) : len(blank) - blank[::-1].index(False)]
+        else:
+            lines = []
+        new_line = Segment.line()
+        if self.separated and lines:
+            yield new_line
+        for line in lines:
+            yield from line
+            yield new_line
+
+
+class _TailMarkdown:
+    """Renders the unfinished block of a MarkdownStream, parsed only when the Live refreshes."""
+
+    def __init__(self, stream: "MarkdownStream"):
+        self.stream = stream
+        self._key = None
+        self._block: Optional[_MarkdownBlock] = None
+
+    def __rich_console__(
+        self, console: Console, options: ConsoleOptions
+    ) -> RenderResult:
+        key = (self.stream.tail, self.stream.finalized_blocks > 0)
+        if key != self._key:
+            self._key = key
+            self._block = _MarkdownBlock(*key)
+        yield self._block
+
+
+class MarkdownStream:
+    """
+    Renders a streamed markdown answer in a rich Live.
+
+    Completed blocks are printed once above the live area, only the trailing
+    unfinished block stays in the Live and is re-parsed, at most at the Live
+    refresh rate instead of on every chunk.
+    """
+
+    def __init__(self, live: Live):
+        self.live = live
+        self.tail = ""  # The block that is still being streamed
+        self._line_start = 0  # Index in tail of the first line not scanned yet
+        self._fence: Optional[str] = None  # Opening fence while inside a code block
+        self._after_blank_line = False
+        self.finalized_blocks = 0
+        self.live.update(_TailMarkdown(self))
+
+    def feed(self, text: str):
+        """Add a chunk of the answer."""
+        if text:
+            self.tail += text
+            self._scan()
+
+    def finish(self):
+        """Render the last block and stop the Live."""
+        self.live.stop()
+
+    def _scan(self):
+        while True:
+            newline = self.tail.find("\n", self._line_start)
+            if newline == -1:
+                # The first character of the next line tells if the block ended
+                partial = self.tail[self._line_start :]
+                if self._after_blank_line and partial.strip():
+                    self._after_blank_line = False
+                    if partial[0] not in " \t":
+                        self._finalize(self._line_start)
+                return
+            start = self._line_start
+            line = self.tail[start:newline]
+            self._line_start = newline + 1
+
+            if self._fence:
+                stripped = line.strip()
+                if stripped.startswith(self._fence) and not stripped.strip(
+                    self._fence[0]
+                ):
+                    self._fence = None
+                continue
+
+            if not line.strip():
+                self._after_blank_line = True
+                continue
+
+            if self._after_blank_line:
+                self._after_blank_line = False
+                # An indented line continues the previous block (e.g. a list item)
+                if line[0] not in " \t":
+                    self._finalize(start)
+
+            match = FENCE_RE.match(line)
+            if match:
+                self._fence = match.group(1)
+
+    def _finalize(self, index: int):
+        """Print tail[:index] as a completed block and keep the rest streaming."""
+        block = self.tail[:index].strip("\n")
+        self.tail = self.tail[index:]
+        self._line_start -= index
+        if block:
+            self.live.console.print(
+                _MarkdownBlock(block, separated=self.finalized_blocks > 0)
+            )
+            self.finalized_blocks += 1
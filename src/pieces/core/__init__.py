@@ -1,24 +1,47 @@
-from .cli_loop import loop
-from .change_model import change_model
-from .search_command import search
-from .list_command import ListCommand
-from .execute_command import ExecuteCommand
-from .assets_command import AssetsCommands
-from .onboarding import onboarding_command
-from .feedbacks import feedback, contribute
-from .install_pieces_os import PiecesInstaller
-from .open_command import open_command
+"""
+The implementation of the CLI commands.
 
-__all__ = [
-    "loop",
-    "search",
-    "change_model",
-    "ListCommand",
-    "ExecuteCommand",
-    "AssetsCommands",
-    "onboarding_command",
-    "feedback",
-    "contribute",
-    "PiecesInstaller",
-    "open_command",
-]
+The modules are imported on first access so that running one command does not
+import the implementation of every other command.
+"""
+
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .cli_loop import loop
+    from .change_model import change_model
+    from .search_command import search
+    from .list_command import ListCommand
+    from .execute_command import ExecuteCommand
+    from .assets_command import AssetsCommands
+    from .onboarding import onboarding_command
+    from .feedbacks import feedback, contribute
+    from .install_pieces_os import PiecesInstaller
+    from .open_command import open_command
+
+# Name: module defining it
+_MODULES = {
+    "loop": "cli_loop",
+    "search": "search_command",
+    "change_model": "change_model",
+    "ListCommand": "list_command",
+    "ExecuteCommand": "execute_command",
+    "AssetsCommands": "assets_command",
+    "onboarding_command": "onboarding",
+    "feedback": "feedbacks",
+    "contribute": "feedbacks",
+    "PiecesInstaller": "install_pieces_os",
+    # Once the open_command module is imported, it shadows this attribute,
+    # import it from pieces.core.open_command instead
+    "open_command": "open_command",
+}
+
+__all__ = list(_MODULES)
+
+
+def __getattr__(name: str):
+    module = _MODULES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(import_module(f".{module}", __name__), name)
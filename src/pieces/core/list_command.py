@@ -1,13 +1,26 @@
 from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 import threading
+import time
 
+from pieces.headless.models.base import SuccessResponse
+from pieces.headless.models.list import create_list_success
+from pieces.headless.output import HeadlessOutput
 from pieces.settings import Settings
-from pieces._vendor.pieces_os_client.wrapper.basic_identifier.asset import BasicAsset
+from pieces._vendor.pieces_os_client.wrapper.streamed_identifiers.assets_snapshot import (
+    AssetSnapshot,
+)
 from .change_model import change_model
 from .assets_command import check_assets_existence, AssetsCommands
 
 
 class ListCommand:
+    FIRST_PAGE_SIZE = 50  # Materials named first so the first screen fills right away
+    BATCH_SIZE = 200  # Materials added to the menu at once
+    BULK_THRESHOLD = 100  # More unnamed materials are named with one assets snapshot
+    STREAM_BATCH_SIZE = 10  # Materials added at once while they are named one by one
+
     @classmethod
     def list_command(cls, **kwargs):
         type = kwargs.get("type", "materials")
@@ -19,15 +32,72 @@ class ListCommand:
         elif type == "models":
             cls.list_models()
 
+    @classmethod
+    def list_headless(cls, **kwargs) -> SuccessResponse:
+        """
+        List the materials, apps or models as a headless response. When streaming,
+        every item is emitted as a result event as soon as it is known.
+        """
+        type = kwargs.get("type", "materials")
+        if type == "materials":
+            items = cls._iter_material_items()
+        elif type == "apps":
+            items = cls._iter_app_items()
+        else:
+            items = cls._iter_model_items()
+
+        collected = []
+        count = 0
+        for item in items:
+            count += 1
+            if Settings.headless_stream:
+                HeadlessOutput.output_event("list", "result", item)
+            else:
+                collected.append(item)
+        if Settings.headless_stream:
+            return create_list_success(type, None, count)
+        return create_list_success(type, collected)
+
+    @classmethod
+    def _iter_material_items(cls) -> Iterator[Dict[str, Any]]:
+        assets = Settings.pieces_client.assets()
+        if Settings.headless_stream:
+            HeadlessOutput.output_event("list", "progress", {"total": len(assets)})
+        for batch in cls._iter_asset_names([asset._id for asset in assets]):
+            for asset_id, name in batch:
+                yield {"id": asset_id, "name": name}
+
+    @classmethod
+    def _iter_app_items(cls) -> Iterator[Dict[str, Any]]:
+        application_list = (
+            Settings.pieces_client.applications_api.applications_snapshot()
+        )
+        for app in getattr(application_list, "iterable", None) or []:
+            name, version, platform = cls._app_details(app)
+            yield {"name": name, "version": version, "platform": platform}
+
+    @classmethod
+    def _iter_model_items(cls) -> Iterator[Dict[str, Any]]:
+        model_info = Settings.model_config.model
+        for model_name in Settings.pieces_client.available_models_names:
+            yield {
+                "name": model_name,
+                "current": bool(model_info and model_info.name == model_name),
+            }
+
     @classmethod
     @check_assets_existence
     def list_assets(cls, **kwargs):
         from pieces.utils import PiecesSelectMenu
 
-        assets = kwargs.get(
-            "assets",
-            [BasicAsset(item.id) for item in BasicAsset.get_identifiers()],  # type: ignore[assignment]
-        )
+        assets = kwargs.get("assets")
+        scores = kwargs.pop("scores", None)  # Ranking scores of search results
+        names = kwargs.pop("names", None)  # Names already known, e.g. from a search
+        first_page_size = kwargs.pop("first_page_size", None)
+        started_at = kwargs.pop("started_at", None)  # perf_counter of the search start
+        if assets is None:
+            # Already loaded by check_assets_existence
+            assets = Settings.pieces_client.assets()
 
         select_menu = PiecesSelectMenu(
             [],
@@ -36,18 +106,114 @@ class ListCommand:
             title="Select a material",
         )
 
+        def elapsed() -> str:
+            return f"{(time.perf_counter() - started_at) * 1e3:.0f}ms"
+
         def update_assets():
-            for i, asset in enumerate(assets, start=1):
-                try:
-                    select_menu.add_entry(
-                        (f"{i}: {asset.name}", {"asset_id": asset.id, **kwargs})
-                    )
-                except AttributeError:
-                    pass
-
-        threading.Thread(target=update_assets).start()
+            index = 1
+            batches = cls._iter_asset_names(
+                [asset._id for asset in assets], names, first_page_size
+            )
+            for batch in batches:
+                entries = []
+                for asset_id, name in batch:
+                    label = f"{index}: {name}"
+                    if scores and asset_id in scores:
+                        label += f" ({scores[asset_id]:.2f})"
+                    entries.append((label, {"asset_id": asset_id, **kwargs}))
+                    index += 1
+                select_menu.add_entries(entries)
+                if started_at is not None and entries and index - 1 == len(entries):
+                    Settings.logger.debug(f"Time to first result: {elapsed()}")
+            if started_at is not None:
+                Settings.logger.debug(f"{index - 1} results listed in {elapsed()}")
+
+        threading.Thread(target=update_assets, daemon=True).start()
         select_menu.run()
 
+    @classmethod
+    def _iter_asset_names(
+        cls,
+        ids: List[str],
+        names: Optional[Dict[str, str]] = None,
+        first_page_size: Optional[int] = None,
+    ) -> Iterator[List[Tuple[str, str]]]:
+        """
+        Yield batches of (asset id, name) in the order of the ids.
+
+        Known and cached names are used as is. The first page is fetched with
+        concurrent requests. When many names are missing after it, they come
+        from a single assets snapshot without transferables, otherwise they
+        are fetched concurrently and streamed as they resolve. The full asset
+        is only fetched when it is opened.
+        """
+        names = dict(names or {})
+        for id in ids:
+            asset = AssetSnapshot.identifiers_snapshot.get(id)
+            if asset is not None and id not in names:
+                names[id] = asset.name or "Unnamed material"
+
+        page_size = first_page_size or cls.FIRST_PAGE_SIZE
+        first_page, rest = ids[:page_size], ids[page_size:]
+        missing_rest = [id for id in rest if id not in names]
+        workers = max(1, Settings.pieces_client.max_hydration_workers)
+        with ThreadPoolExecutor(max_workers=workers + 1) as executor:
+            bulk = None
+            if len(missing_rest) > cls.BULK_THRESHOLD:
+                bulk = executor.submit(cls._fetch_all_names)
+            missing = [id for id in first_page if id not in names]
+            names.update(zip(missing, executor.map(cls._fetch_name, missing)))
+            yield [(id, names[id]) for id in first_page if names[id] is not None]
+
+            if bulk:
+                names.update(bulk.result())
+                # Materials missing from the snapshot, e.g. created meanwhile
+                missing = [id for id in missing_rest if id not in names]
+                names.update(zip(missing, executor.map(cls._fetch_name, missing)))
+                rest = [(id, names[id]) for id in rest if names[id] is not None]
+                for start in range(0, len(rest), cls.BATCH_SIZE):
+                    yield rest[start : start + cls.BATCH_SIZE]
+                return
+
+            # Few names are missing, append them as they resolve
+            fetched = executor.map(cls._fetch_name, missing_rest)
+            batch = []
+            for id in rest:
+                name = names[id] if id in names else next(fetched)
+                if name is not None:
+                    batch.append((id, name))
+                if len(batch) >= cls.STREAM_BATCH_SIZE:
+                    yield batch
+                    batch = []
+            if batch:
+                yield batch
+
+    @staticmethod
+    def _fetch_name(asset_id: str) -> Optional[str]:
+        """Fetch the name of one asset, None if it does not exist anymore."""
+        try:
+            asset = Settings.pieces_client.assets_api.assets_specific_asset_snapshot(
+                asset_id, transferables=False
+            )
+        except Exception as e:
+            Settings.logger.debug(f"Could not fetch material {asset_id}: {e}")
+            return None
+        return asset.name or "Unnamed material"
+
+    @staticmethod
+    def _fetch_all_names() -> Dict[str, str]:
+        """Fetch the names of every asset in one request."""
+        try:
+            assets = Settings.pieces_client.assets_api.assets_snapshot(
+                transferables=False
+            )
+        except Exception as e:
+            Settings.logger.debug(f"Could not fetch the materials snapshot: {e}")
+            return {}
+        return {
+            asset.id: asset.name or "Unnamed material" for asset in assets.iterable
+        }
+
     @classmethod
     def list_models(cls):
         from pieces.utils import PiecesSelectMenu
@@ -77,19 +243,25 @@ class ListCommand:
             application_list.iterable, Iterable
         ):
             for i, app in enumerate(application_list.iterable, start=1):
-                app_name = (
-                    getattr(app, "name", "Unknown").value  # type: ignore[assignment]
-                    if hasattr(app, "name") and hasattr(app.name, "value")
-                    else "Unknown"
-                )
-                app_version = getattr(app, "version", "Unknown")
-                app_platform = (
-                    getattr(app, "platform", "Unknown").value  # type: ignore[assignment]
-                    if hasattr(app, "platform") and hasattr(app.platform, "value")
-                    else "Unknown"
-                )
+                app_name, app_version, app_platform = cls._app_details(app)
                 Settings.logger.print(f"{i}: {app_name}, {app_version}, {app_platform}")
         else:
             Settings.logger.print(
                 "Error: The 'Applications' object does not contain an iterable list of applications."
             )
+
+    @staticmethod
+    def _app_details(app) -> Tuple[str, str, str]:
+        """The name, version and platform of an application."""
+        app_name = (
+            getattr(app, "name", "Unknown").value  # type: ignore[assignment]
+            if hasattr(app, "name") and hasattr(app.name, "value")
+            else "Unknown"
+        )
+        app_version = getattr(app, "version", "Unknown")
+        app_platform = (
+            getattr(app, "platform", "Unknown").value  # type: ignore[assignment]
+            if hasattr(app, "platform") and hasattr(app.platform, "value")
+            else "Unknown"
+        )
+        return app_name, app_version, app_platform
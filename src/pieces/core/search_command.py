@@ -1,4 +1,19 @@
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+import time
+
 from pieces._vendor.pieces_os_client.wrapper.basic_identifier.asset import BasicAsset
+from pieces._vendor.pieces_os_client.wrapper.streamed_identifiers.assets_snapshot import (
+    AssetSnapshot,
+)
+from pieces._vendor.pieces_os_client.wrapper.websockets.assets_identifiers_ws import (
+    AssetsIdentifiersWS,
+)
+from ..headless.exceptions import HeadlessError
+from ..headless.models.base import ErrorCode, SuccessResponse
+from ..headless.models.search import create_search_success
+from ..headless.output import HeadlessOutput
 from ..settings import Settings
 from .list_command import ListCommand
 
@@ -7,32 +22,227 @@ search_type_map = {
     "ncs": "Neural Code Search",
     "fts": "Full Text Search",
     "fuzzy": "Fuzzy Search",
+    "all": "All Modes",
 }
+SEARCH_MODES = ("fuzzy", "fts", "ncs")  # Searched concurrently by --mode all
+RRF_K = 60  # Reciprocal rank fusion constant, damps the weight of the top ranks
 
 
-def search(query, **kwargs) -> int:
-    search_type = kwargs.get("search_type", "fuzzy")
+@dataclass
+class SearchResult:
+    identifier: str
+    score: float
+    exact: bool = False
+    name: Optional[str] = None  # Known when PiecesOS returns the asset with the result
+    modes: List[str] = field(default_factory=list)  # Search modes that found it
+
+    def to_dict(self) -> Dict:
+        return {
+            "id": self.identifier,
+            "name": self.name,
+            "score": self.score,
+            "exact": self.exact,
+            "modes": self.modes,
+        }
+
+
+def local_search(
+    search_phrase: str, limit: Optional[int] = None
+) -> List[Tuple[BasicAsset, float]]:
+    """
+    Search the local index of the cached materials. Empty unless the index is
+    enabled and current: every material was fetched since the assets websocket
+    opened and the websocket keeps the index up to date.
+    """
+    index = AssetSnapshot.search_index
+    if (
+        index is None
+        or AssetSnapshot.first_shot
+        or not AssetsIdentifiersWS.is_running()
+    ):
+        return []
+    snapshot = BasicAsset.identifiers_snapshot()
+    index.sync(snapshot)
+    return [
+        (BasicAsset(asset_id), score)
+        for asset_id, score in index.search(search_phrase, limit=limit, ids=snapshot)
+    ]
+
+
+def search_assets(
+    search_phrase: str, search_type: str, limit: Optional[int] = None
+) -> Tuple[List[SearchResult], bool]:
+    """
+    Returns the results, exact matches first, and whether they come from the local
+    index. Fuzzy searches use the local index when it is current and has matches,
+    other modes go to PiecesOS. The "all" mode searches every mode concurrently, see federated_search.
+    """
+    if search_type == "all":
+        return federated_search(search_phrase, limit)
+    if search_type == "fuzzy":
+        results = local_search(search_phrase, limit)
+        if results:
+            Settings.logger.debug(
+                f"Local index: {len(results)} results for '{search_phrase}'"
+            )
+            return [
+                SearchResult(asset._id, score, modes=[search_type])
+                for asset, score in results
+            ], True
+    results = [
+        SearchResult(
+            result.identifier,
+            result.score,
+            result.exact,
+            (result.asset.name or "Unnamed material") if result.asset else None,
+            [search_type],
+        )
+        for result in BasicAsset.search_results(search_phrase, search_type)
+    ]
+    return results[:limit] if limit is not None else results, False
+
+
+def federated_search(
+    search_phrase: str, limit: Optional[int] = None
+) -> Tuple[List[SearchResult], bool]:
+    """
+    Run every search mode concurrently and merge their results.
+
+    The results are de-duplicated by identifier and ranked by reciprocal rank
+    fusion: each mode adds 1 / (RRF_K + rank) to a material, so materials found
+    by several modes rank first. Exact matches stay in front. A failing mode is
+    skipped unless they all fail.
+    """
+    started_at = time.perf_counter()
+
+    def run(mode: str) -> Tuple[List[SearchResult], bool]:
+        mode_started_at = time.perf_counter()
+        results = search_assets(search_phrase, mode)
+        Settings.logger.debug(
+            f"{mode}: {len(results[0])} results in "
+            f"{(time.perf_counter() - mode_started_at) * 1e3:.0f}ms"
+        )
+        return results
+
+    with ThreadPoolExecutor(max_workers=len(SEARCH_MODES)) as executor:
+        futures = [executor.submit(run, mode) for mode in SEARCH_MODES]
+    merged: Dict[str, SearchResult] = {}
+    local = False
+    errors = []
+    for mode, future in zip(SEARCH_MODES, futures):
+        try:
+            results, mode_local = future.result()
+        except Exception as e:
+            Settings.logger.debug(f"{mode} search failed: {e}")
+            errors.append(e)
+            continue
+        local = local or mode_local
+        for rank, result in enumerate(results, start=1):
+            fused = merged.setdefault(
+                result.identifier, SearchResult(result.identifier, 0.0)
+            )
+            fused.score += 1 / (RRF_K + rank)
+            fused.exact = fused.exact or result.exact
+            fused.name = fused.name or result.name
+            fused.modes.append(mode)
+    if len(errors) == len(SEARCH_MODES):
+        raise errors[0]
+
+    ranked = sorted(merged.values(), key=lambda r: (r.exact, r.score), reverse=True)
+    if limit is not None:
+        ranked = ranked[:limit]
+    top = max((result.score for result in ranked), default=1.0)
+    for result in ranked:
+        result.score = round(result.score / top, 4)
+    Settings.logger.debug(
+        f"All modes: {len(merged)} unique results in "
+        f"{(time.perf_counter() - started_at) * 1e3:.0f}ms"
+    )
+    return ranked, local
 
+
+def _search_phrase(query) -> str:
     # Join the list of strings into a single search phrase
     if not query:
-        search_phrase = Settings.logger.input("prompt: ")
-    else:
-        search_phrase = " ".join(query)
+        return Settings.logger.input("prompt: ")
+    return " ".join(query)
+
+
+def search(query, **kwargs) -> int:
+    search_type = kwargs.get("search_type", "fuzzy")
+    limit = kwargs.get("limit")
+
+    search_phrase = _search_phrase(query)
     if not search_phrase:
         Settings.logger.print("No search query provided.")
         return 1
+    if limit is not None and limit < 1:
+        Settings.logger.print("The limit must be a positive number.")
+        return 1
 
-    asset_details = BasicAsset.search(search_phrase, search_type)
+    started_at = time.perf_counter()
+    results, local = search_assets(search_phrase, search_type, limit)
+    Settings.logger.debug(
+        f"{len(results)} results for '{search_phrase}' in "
+        f"{(time.perf_counter() - started_at) * 1e3:.0f}ms"
+    )
 
     # Print the combined asset details
-    if asset_details:
+    if results:
         search_type_text = search_type_map.get(search_type, "Search")
+        if local:
+            search_type_text += " (local index)"
+        exact = sum(1 for result in results if result.exact)
         ListCommand.list_assets(
-            assets=asset_details,
-            footer=(
-                f"Search Type: {search_type_text}| Results Found: {len(asset_details)}"
-            ),
+            assets=[BasicAsset(result.identifier) for result in results],
+            scores={result.identifier: result.score for result in results},
+            # Names returned with the results, the others are fetched concurrently
+            names={result.identifier: result.name for result in results if result.name},
+            # Show the exact matches before the suggested ones are named
+            first_page_size=min(exact, ListCommand.FIRST_PAGE_SIZE) or None,
+            started_at=started_at,
+            footer=(f"Search Type: {search_type_text}| Results Found: {len(results)}"),
         )
     else:
         Settings.logger.print("No matches found.")
-    return 0
\ No newline at end of file
+    return 0
+
+
+def search_headless(query, **kwargs) -> SuccessResponse:
+    """Search and return the results with their names as a headless response."""
+    search_type = kwargs.get("search_type", "fuzzy")
+    limit = kwargs.get("limit")
+
+    search_phrase = _search_phrase(query)
+    if not search_phrase:
+        raise HeadlessError("No search query provided", ErrorCode.INVALID_ARGUMENT)
+    if limit is not None and limit < 1:
+        raise HeadlessError(
+            "The limit must be a positive number", ErrorCode.INVALID_ARGUMENT
+        )
+
+    results, _ = search_assets(search_phrase, search_type, limit)
+    if Settings.headless_stream:
+        HeadlessOutput.output_event("search", "progress", {"found": len(results)})
+    by_id = {result.identifier: result for result in results}
+    exact = sum(1 for result in results if result.exact)
+    # Name the results concurrently, materials deleted meanwhile are dropped
+    batches = ListCommand._iter_asset_names(
+        list(by_id),
+        {result.identifier: result.name for result in results if result.name},
+        min(exact, ListCommand.FIRST_PAGE_SIZE) or None,
+    )
+    found = []
+    count = 0
+    for batch in batches:
+        for asset_id, name in batch:
+            result = by_id[asset_id]
+            result.name = name
+            count += 1
+            if Settings.headless_stream:
+                HeadlessOutput.output_event("search", "result", result.to_dict())
+            else:
+                found.append(result.to_dict())
+    if Settings.headless_stream:
+        return create_search_success(search_phrase, search_type, None, count)
+    return create_search_success(search_phrase, search_type, found)
@@ -0,0 +1,41 @@
+"""
+Optional background daemon keeping a warm PiecesOS client between commands.
+
+`pieces daemon start` runs a server holding the PiecesOS client, its
+websockets and snapshot caches. The `pieces` entry point forwards the
+commands it can run over a Unix domain socket and streams their output back,
+or runs them locally when the daemon is not running.
+
+The entry point imports this package before anything else, keep its imports
+light.
+"""
+
+import os
+import socket
+
+from platformdirs import user_data_dir
+
+# The same directory as pieces.config.constants.PIECES_DATA_DIR, without
+# importing pieces.config
+SOCKET_PATH = os.path.join(user_data_dir("pieces-cli", "pieces"), "daemon.sock")
+
+# Commands run by the daemon when it is up
+FORWARDED_COMMANDS = {"chats", "conversations", "list", "drive", "search"}
+# Commands opening an interactive menu, only forwarded in headless mode
+INTERACTIVE_COMMANDS = {"list", "drive", "search"}
+
+# Environment variables of the client applied to the forwarded command
+FORWARDED_ENV = ("TERM", "COLORTERM", "NO_COLOR", "FORCE_COLOR", "COLUMNS", "LINES")
+
+
+def is_supported() -> bool:
+    """Unix domain sockets are not available on every platform."""
+    return hasattr(socket, "AF_UNIX")
+
+
+def should_forward(argv: list) -> bool:
+    """Whether the command can be run by the daemon."""
+    command = next((arg for arg in argv if not arg.startswith("-")), None)
+    if command not in FORWARDED_COMMANDS:
+        return False
+    return command not in INTERACTIVE_COMMANDS or "--headless" in argv
@@ -0,0 +1,117 @@
+"""
+The thin client forwarding a command to the daemon.
+
+Messages are JSON lines. The client sends one request and the daemon answers
+with the output of the command as it is printed, then its exit code.
+"""
+
+import json
+import os
+import socket
+import sys
+from typing import Optional, TextIO
+
+from pieces import __version__
+
+from . import FORWARDED_ENV, SOCKET_PATH, is_supported, should_forward
+
+CONNECT_TIMEOUT = 0.5  # Seconds, the daemon is local
+
+
+def connect(socket_path: str = SOCKET_PATH) -> Optional[socket.socket]:
+    """Connect to the daemon, returns None if it is not running."""
+    if not is_supported() or not os.path.exists(socket_path):
+        return None
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    sock.settimeout(CONNECT_TIMEOUT)
+    try:
+        sock.connect(socket_path)
+    except OSError:
+        sock.close()
+        return None
+    sock.settimeout(None)  # Commands can take a while
+    return sock
+
+
+def request(message: dict, socket_path: str = SOCKET_PATH) -> Optional[dict]:
+    """Send a control message (ping, stop) to the daemon and return its answer."""
+    sock = connect(socket_path)
+    if sock is None:
+        return None
+    with sock, sock.makefile("rw", encoding="utf-8") as stream:
+        stream.write(json.dumps(message) + "\n")
+        stream.flush()
+        line = stream.readline()
+    return json.loads(line) if line else None
+
+
+def forward(
+    argv: list,
+    socket_path: str = SOCKET_PATH,
+    stdout: Optional[TextIO] = None,
+    stderr: Optional[TextIO] = None,
+) -> Optional[int]:
+    """
+    Run the command in the daemon and stream its output.
+
+    Returns:
+        The exit code of the command, or None if the command must run locally:
+        it cannot be forwarded, the daemon is not running or cannot run it.
+    """
+    if not should_forward(argv):
+        return None
+    sock = connect(socket_path)
+    if sock is None:
+        return None
+    stdout = stdout or sys.stdout
+    stderr = stderr or sys.stderr
+    message = {
+        "version": __version__,  # A daemon of another version lets the CLI run it
+        "argv": argv,
+        "cwd": os.getcwd(),
+        "tty": stdout.isatty(),
+        "env": {name: os.environ[name] for name in FORWARDED_ENV if name in os.environ},
+    }
+    try:
+        columns, lines = os.get_terminal_size()
+        message["env"].setdefault("COLUMNS", str(columns))
+        message["env"].setdefault("LINES", str(lines))
+    except OSError:
+        pass  # Not a terminal
+
+    output = False  # Was any output received?
+    with sock, sock.makefile("rw", encoding="utf-8") as stream:
+        try:
+            stream.write(json.dumps(message) + "\n")
+            stream.flush()
+            for line in stream:
+                frame = json.loads(line)
+                if "stdout" in frame:
+                    stdout.write(frame["stdout"])
+                    stdout.flush()
+                    output = True
+                elif "stderr" in frame:
+                    stderr.write(frame["stderr"])
+                    stderr.flush()
+                    output = True
+                elif "exit" in frame:
+                    return frame["exit"]
+                elif frame.get("fallback"):
+                    return None
+        except (OSError, ValueError):
+            pass
+    # The daemon stopped while running the command
+    return 1 if output else None
+
+
+def main():
+    """The `pieces` entry point, runs the command in the daemon if it is up."""
+    try:
+        code = forward(sys.argv[1:])
+    except KeyboardInterrupt:
+        sys.exit(130)
+    if code is None:
+        from pieces.app import main as run
+
+        return run()
+    sys.exit(code)
@@ -0,0 +1,263 @@
+"""
+The daemon serving the commands forwarded by the CLI.
+
+It starts PiecesOS once, keeps its websockets open so the snapshot caches stay
+up to date and runs every forwarded command with the parser and client of
+the process, streaming the output back to the client.
+"""
+
+import contextlib
+import errno
+import io
+import json
+import os
+import socket
+import sys
+import threading
+from typing import Optional
+
+from rich.console import Console
+
+from pieces import __version__
+from pieces.errors import format_error
+from pieces.headless.exceptions import HeadlessError
+from pieces.headless.output import HeadlessOutput
+from pieces.pieces_argparser import PiecesArgparser
+from pieces.settings import Settings
+
+from . import FORWARDED_ENV, SOCKET_PATH, should_forward
+from .client import request
+
+
+class _OutputStream(io.TextIOBase):
+    """
+    A stdout or stderr replacement sending what the command writes to the client.
+
+    sys.stdout is global to the process, the websocket and hydration threads
+    print to it too while a command runs. Only the thread running the command
+    writes to the client, the others keep writing to the output of the daemon.
+    """
+
+    def __init__(self, send, name: str, tty: bool, fallback):
+        self._send = send
+        self._name = name
+        self._tty = tty
+        self._fallback = fallback
+        self._thread = threading.get_ident()
+
+    def write(self, text: str) -> int:
+        if threading.get_ident() != self._thread:
+            return self._fallback.write(text) if self._fallback else len(text)
+        if text:
+            self._send({self._name: text})
+        return len(text)
+
+    def isatty(self) -> bool:
+        return self._tty
+
+    def writable(self) -> bool:
+        return True
+
+
+class PiecesDaemon:
+    """Serve the forwarded CLI commands from a warm PiecesOS client."""
+
+    def __init__(self, socket_path: str = SOCKET_PATH):
+        self.socket_path = socket_path
+        self.commands_run = 0
+        self._server: Optional[socket.socket] = None
+        self._stopped = threading.Event()
+        # Commands share the global Settings and stdout, they run one at a time
+        self._command_lock = threading.Lock()
+
+    def warm_up(self):
+        """Start PiecesOS, open the websockets and load the snapshot caches."""
+        from pieces._vendor.pieces_os_client.wrapper.basic_identifier.asset import (
+            BasicAsset,
+        )
+        from pieces._vendor.pieces_os_client.wrapper.basic_identifier.chat import (
+            BasicChat,
+        )
+
+        Settings.startup()
+        Settings.pieces_client.connect_websocket()
+        BasicAsset.identifiers_snapshot()
+        BasicChat.identifiers_snapshot()
+
+    def bind(self):
+        """
+        Listen on the socket, replacing the socket file of a stopped daemon.
+
+        Raises:
+            OSError: EADDRINUSE if another daemon answers on the socket.
+        """
+        if os.path.exists(self.socket_path):
+            if request({"control": "ping"}, self.socket_path):
+                raise OSError(
+                    errno.EADDRINUSE, "The daemon is already running", self.socket_path
+                )
+            os.unlink(self.socket_path)
+        server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        # Only the user can run commands, the file is created with these permissions
+        umask = os.umask(0o177)
+        try:
+            server.bind(self.socket_path)
+        except OSError:
+            server.close()
+            raise
+        finally:
+            os.umask(umask)
+        server.listen()
+        self._server = server
+
+    def serve(self):
+        """Accept connections until stopped."""
+        while not self._stopped.is_set():
+            try:
+                connection, _ = self._server.accept()
+            except OSError:
+                break  # Closed by stop()
+            threading.Thread(
+                target=self._handle, args=(connection,), daemon=True
+            ).start()
+
+    def stop(self):
+        self._stopped.set()
+        if self._server is not None:
+            # Closing alone does not wake up accept() on Linux
+            with contextlib.suppress(OSError):
+                self._server.shutdown(socket.SHUT_RDWR)
+            self._server.close()
+        with contextlib.suppress(OSError):
+            os.unlink(self.socket_path)
+
+    def _handle(self, connection: socket.socket):
+        send_lock = threading.Lock()
+
+        def send(message: dict):
+            data = (json.dumps(message) + "\n").encode("utf-8")
+            with send_lock:
+                connection.sendall(data)
+
+        with connection, connection.makefile("r", encoding="utf-8") as stream:
+            try:
+                message = json.loads(stream.readline() or "{}")
+                control = message.get("control")
+                if control == "ping":
+                    send(self.status())
+                elif control == "stop":
+                    self.stop()
+                    send({"stopped": True})
+                elif "argv" in message:
+                    self._run_command(message, send)
+            except (OSError, ValueError):
+                pass  # The client went away
+
+    def status(self) -> dict:
+        return {
+            "pid": os.getpid(),
+            "version": __version__,
+            "commands_run": self.commands_run,
+        }
+
+    def _run_command(self, message: dict, send):
+        argv = message["argv"]
+        if (
+            message.get("version") != __version__  # The CLI was upgraded meanwhile
+            or not should_forward(argv)
+            or not Settings.pieces_client.is_pieces_running()
+        ):
+            send({"fallback": True})  # Let the CLI run it or report it
+            return
+        tty = bool(message.get("tty"))
+        with self._command_lock, self._client_context(message):
+            self.reload_config()
+            stdout = _OutputStream(send, "stdout", tty, sys.stdout)
+            stderr = _OutputStream(send, "stderr", tty, sys.stderr)
+            with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(
+                stderr
+            ):
+                # Consoles detect the terminal of the client when created
+                Settings.logger.console = Console()
+                Settings.logger.console_error = Console(stderr=True)
+                code = self.run(argv)
+            self.commands_run += 1
+        send({"exit": code})
+
+    @staticmethod
+    def reload_config():
+        """Apply the config files changed since the last command, e.g. the model."""
+        for manager in (
+            Settings.cli_config,
+            Settings.model_config,
+            Settings.mcp_config,
+            Settings.user_config,
+        ):
+            manager.reload()
+        Settings.configure_client()
+        model_info = Settings.model_config.model
+        if model_info:
+            Settings.pieces_client.model_name = model_info.name
+
+    @contextlib.contextmanager
+    def _client_context(self, message: dict):
+        """
+        Run in the working directory and environment of the client.
+
+        Both are global to the process, the background threads of the daemon
+        see them too until the command returns.
+        """
+        cwd = os.getcwd()
+        environ = {name: os.environ.get(name) for name in FORWARDED_ENV}
+        try:
+            os.chdir(message.get("cwd") or cwd)
+            for name in FORWARDED_ENV:
+                os.environ.pop(name, None)
+            os.environ.update(message.get("env") or {})
+            yield
+        finally:
+            os.chdir(cwd)
+            for name, value in environ.items():
+                if value is None:
+                    os.environ.pop(name, None)
+                else:
+                    os.environ[name] = value
+
+    @staticmethod
+    def run(argv: list) -> int:
+        """Run a command like the CLI does, returns its exit code."""
+        Settings.headless_mode = False
+        Settings.headless_stream = False
+        command = "unknown"
+        try:
+            args = PiecesArgparser.parser.parse_args(argv)
+            command = args.command or command
+            args.func(**vars(args))
+        except SystemExit as e:
+            if e.code is None or isinstance(e.code, int):
+                return e.code or 0
+            return 1
+        except Exception as e:
+            if isinstance(e, HeadlessError) or Settings.headless_mode:
+                HeadlessOutput.handle_exception(e, command)
+            else:
+                Settings.logger.critical(e)
+                Settings.logger.console_error.print(
+                    f"[red]{format_error(e, include_technical=False)}[/red]"
+                )
+            return 2
+        return 0
+
+
+def run_daemon(socket_path: str = SOCKET_PATH):
+    """Start the daemon and serve commands until it is stopped."""
+    from pieces.app import PiecesCLI
+
+    daemon = PiecesDaemon(socket_path)
+    PiecesCLI()  # Registers every command in PiecesArgparser.parser
+    daemon.warm_up()
+    daemon.bind()
+    try:
+        daemon.serve()
+    finally:
+        daemon.stop()
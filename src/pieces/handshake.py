@@ -0,0 +1,158 @@
+"""
+The PiecesOS requests made when the CLI starts.
+
+The version, user and models do not depend on each other, so they are
+requested concurrently and every result is memoized for the process. The
+models list can also be reused across runs from a small file for a short TTL.
+"""
+
+import json
+import os
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, Optional
+
+if TYPE_CHECKING:
+    from pieces._vendor.pieces_os_client.wrapper import PiecesClient
+    from pieces.logger import Logger
+
+# Results that can be reused across runs, the version is always requested
+# so an upgraded PiecesOS is never checked against its old version
+DISK_CACHED_CALLS = ("models",)
+
+
+class StartupHandshake:
+    """Run the independent startup requests to PiecesOS concurrently."""
+
+    def __init__(
+        self,
+        client: "PiecesClient",
+        cache_path: Optional[str] = None,
+        cache_ttl: float = 0,
+    ):
+        """
+        Args:
+            client: The PiecesOS client.
+            cache_path: The file the models are reused from.
+            cache_ttl: Seconds the cached models are valid for, 0 to always
+                request them.
+        """
+        self.client = client
+        self.cache_path = cache_path
+        self.cache_ttl = cache_ttl
+        self.durations: Dict[str, float] = {}  # Seconds each call took
+        self.cached: set = set()  # Calls served from the disk cache
+        self._futures: Dict[str, Future] = {}
+        self._disk_cache = self._load_cache()
+
+    def _calls(self) -> Dict[str, Callable[[], Any]]:
+        client = self.client
+        return {
+            "version": lambda: client.well_known_api.get_well_known_version(),
+            "user": lambda: client.user_api.user_snapshot().user,
+            "models": lambda: client.models_api.models_snapshot().iterable,
+        }
+
+    def start(self, names: Iterable[str]):
+        """Send the requests in the background."""
+        calls = self._calls()
+        names = list(names)
+        executor = ThreadPoolExecutor(
+            max_workers=max(len(names), 1), thread_name_prefix="Handshake"
+        )
+        for name in names:
+            self._futures[name] = executor.submit(self._run, name, calls[name])
+        executor.shutdown(wait=False)
+
+    def _run(self, name: str, call: Callable[[], Any]):
+        started_at = time.perf_counter()
+        cached = self._cached(name)
+        if cached is not None:
+            self.cached.add(name)
+            result = cached
+        else:
+            result = call()
+        self.durations[name] = time.perf_counter() - started_at
+        return result
+
+    def get(self, name: str):
+        """Wait for the result of a call, raises the error of the call if it failed."""
+        return self._futures[name].result()
+
+    def _load_cache(self) -> Dict[str, Any]:
+        if not self.cache_path or not self.cache_ttl:
+            return {}
+        try:
+            with open(self.cache_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(data, dict) or data.get("instance") != self._instance():
+            return {}
+        return data
+
+    def _instance(self) -> str:
+        """The PiecesOS the cached results belong to."""
+        return f"{self.client.port}:{self.client.fingerprint}"
+
+    def _cached(self, name: str):
+        entry = self._disk_cache.get(name)
+        if not isinstance(entry, dict) or name not in DISK_CACHED_CALLS:
+            return None
+        if time.time() - entry.get("at", 0) >= self.cache_ttl:
+            return None
+        if name == "models":
+            from pieces._vendor.pieces_os_client.models.model import Model
+
+            try:
+                return [Model.from_dict(model) for model in entry["value"]]
+            except Exception:
+                return None
+        return entry.get("value")
+
+    def save(self):
+        """Write the requested models to the disk cache."""
+        if not self.cache_path or not self.cache_ttl:
+            return
+        data = {"instance": self._instance()}
+        fetched = False
+        for name in DISK_CACHED_CALLS:
+            future = self._futures.get(name)
+            if name in self.cached:
+                data[name] = self._disk_cache[name]
+            elif future is not None and future.done() and not future.exception():
+                value = future.result()
+                if name == "models":
+                    value = [model.to_dict() for model in value]
+                data[name] = {"at": time.time(), "value": value}
+                fetched = True
+        if not fetched:
+            return  # Nothing new to write
+        try:
+            tmp_path = self.cache_path + ".tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(data, f, default=str)
+            os.replace(tmp_path, self.cache_path)
+        except OSError:
+            pass
+
+    def log_trace(self, logger: "Logger", **extra: float):
+        """
+        Log the duration of every call and the critical path of the startup.
+
+        Args:
+            logger: The logger the trace is written to.
+            extra: Other steps of the startup and their duration in seconds.
+        """
+        steps = [
+            f"{name} {duration * 1e3:.1f}ms"
+            + (" (cached)" if name in self.cached else "")
+            for name, duration in {**extra, **self.durations}.items()
+        ]
+        slowest = max(self.durations, key=self.durations.get, default=None)
+        critical_path = sum(extra.values()) + self.durations.get(slowest, 0)
+        logger.debug(
+            f"Startup handshake: {', '.join(steps)};"
+            f" critical path {critical_path * 1e3:.1f}ms"
+            + (f" (slowest: {slowest})" if slowest else "")
+        )
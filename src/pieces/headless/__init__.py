@@ -2,7 +2,8 @@
 Headless mode module for Pieces CLI.
 
 This module provides JSON API-like output for commands when running in headless mode.
-Supports non-interactive operation with structured JSON responses.
+Supports non-interactive operation with structured JSON responses, optionally
+streamed as newline-delimited JSON events followed by the final response.
 """
 
 from .exceptions import HeadlessError, HeadlessPromptError, HeadlessConfirmationError
@@ -11,6 +12,7 @@ from .models.base import (
     BaseResponse,
     ErrorResponse,
     SuccessResponse,
+    EventResponse,
     CommandResult,
     ErrorCode,
 )
@@ -23,6 +25,7 @@ __all__ = [
     "BaseResponse",
     "ErrorResponse",
     "SuccessResponse",
+    "EventResponse",
     "CommandResult",
     "ErrorCode",
 ]
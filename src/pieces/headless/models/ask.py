@@ -0,0 +1,26 @@
+"""
+Ask command response models for headless mode.
+"""
+
+from typing import Optional
+from .base import SuccessResponse
+
+
+def create_ask_success(
+    query: str,
+    answer: Optional[str],
+    conversation_id: Optional[str],
+) -> SuccessResponse:
+    """
+    Create a successful ask response.
+
+    The answer is None when it was already streamed as chunk events.
+    """
+    ask_data = {
+        "query": query,
+        "conversation_id": conversation_id,
+    }
+    if answer is not None:
+        ask_data["answer"] = answer
+
+    return SuccessResponse(command="ask", data=ask_data)
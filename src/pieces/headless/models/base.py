@@ -85,6 +85,32 @@ class SuccessResponse(BaseResponse):
         return response
 
 
+class EventResponse(BaseResponse):
+    """Incremental event of a streamed headless response (one NDJSON line)."""
+
+    def __init__(self, command: str, event: str, data: Any = None):
+        """
+        Initialize event response.
+
+        Args:
+            command: The command that is running
+            event: The event type (e.g. "chunk", "result", "progress")
+            data: The event data (depends on command and event)
+        """
+        super().__init__(success=True, command=command)
+        self.event = event
+        self.data = data
+
+    def to_dict(self) -> Dict[str, Any]:
+        response = {
+            "success": self.success,
+            "command": self.command,
+            "event": self.event,
+            "data": self.data,
+        }
+        return response
+
+
 class ErrorResponse(BaseResponse):
     """Error response for headless mode."""
 
@@ -0,0 +1,27 @@
+"""
+List command response models for headless mode.
+"""
+
+from typing import Any, Dict, List, Literal, Optional
+from .base import SuccessResponse
+
+
+def create_list_success(
+    list_type: Literal["materials", "apps", "models"],
+    items: Optional[List[Dict[str, Any]]],
+    count: Optional[int] = None,
+) -> SuccessResponse:
+    """
+    Create a successful list response.
+
+    The items are None when they were already streamed as result events,
+    the count is then required.
+    """
+    list_data = {
+        "type": list_type,
+        "count": len(items) if items is not None else count,
+    }
+    if items is not None:
+        list_data["items"] = items
+
+    return SuccessResponse(command="list", data=list_data)
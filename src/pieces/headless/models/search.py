@@ -0,0 +1,29 @@
+"""
+Search command response models for headless mode.
+"""
+
+from typing import Any, Dict, List, Optional
+from .base import SuccessResponse
+
+
+def create_search_success(
+    query: str,
+    mode: str,
+    results: Optional[List[Dict[str, Any]]],
+    count: Optional[int] = None,
+) -> SuccessResponse:
+    """
+    Create a successful search response.
+
+    The results are None when they were already streamed as result events,
+    the count is then required.
+    """
+    search_data = {
+        "query": query,
+        "mode": mode,
+        "count": len(results) if results is not None else count,
+    }
+    if results is not None:
+        search_data["results"] = results
+
+    return SuccessResponse(command="search", data=search_data)
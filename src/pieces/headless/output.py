@@ -5,7 +5,9 @@ This module provides utilities for outputting structured JSON responses
 in headless mode while maintaining compatibility with normal CLI output.
 """
 
-from .models.base import BaseResponse, ErrorResponse, ErrorCode
+from typing import Any
+
+from .models.base import BaseResponse, ErrorResponse, ErrorCode, EventResponse
 from .exceptions import HeadlessError
 
 
@@ -27,6 +29,21 @@ class HeadlessOutput:
             )
             print(error_response.to_json())
 
+    @staticmethod
+    def output_event(command: str, event: str, data: Any = None) -> None:
+        """
+        Output an incremental event as one NDJSON line, flushed right away so
+        the consumer can process it before the command completes.
+        """
+        try:
+            print(EventResponse(command, event, data).to_json(), flush=True)
+        except Exception as e:
+            HeadlessOutput.output_error(
+                command=command,
+                error_code=ErrorCode.SERIALIZATION_ERROR,
+                error_message=f"Failed to serialize event: {str(e)}",
+            )
+
     @staticmethod
     def output_error(
         command: str,
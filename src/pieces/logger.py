@@ -2,7 +2,6 @@ import logging
 import os
 import sys
 from datetime import datetime
-import sentry_sdk
 from pathlib import Path
 from typing import Optional, Self, Any, Callable
 from functools import wraps
@@ -76,7 +75,9 @@ class Logger:
         exc_info = kwargs.pop("exc_info", True)
         _, exc_value, _ = sys.exc_info()
         if exc_value is not None and not ignore_sentry:
-            sentry_sdk.capture_exception(exc_value)
+            from pieces import telemetry
+
+            telemetry.capture_exception(exc_value)
         self.logger.error(message, exc_info=exc_info, *args, **kwargs)
 
     def debug(self, message, *args, **kwargs):
@@ -88,7 +89,9 @@ class Logger:
         exc_info = kwargs.pop("exc_info", True)
         _, exc_value, _ = sys.exc_info()
         if exc_value is not None and not ignore_sentry:
-            sentry_sdk.capture_exception(exc_value)
+            from pieces import telemetry
+
+            telemetry.capture_exception(exc_value)
         self.logger.error(message, exc_info=exc_info, *args, **kwargs)
 
     @staticmethod
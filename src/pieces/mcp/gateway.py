@@ -1,17 +1,21 @@
 import asyncio
+from contextvars import ContextVar
 import hashlib
 from pydantic import ValidationError
 import sentry_sdk
 import signal
 import threading
-from typing import Tuple, Callable, Awaitable
+import time
+from typing import Optional, Tuple, Callable, Awaitable
 import httpx
 import httpcore
 
 from websocket import WebSocketConnectionClosedException
 from pieces.mcp.utils import get_mcp_latest_url
 from pieces.mcp.tools_cache import PIECES_MCP_TOOLS_CACHE
+from pieces.mcp.result_cache import ToolResultCache
 from pieces.settings import Settings
+from pieces import telemetry
 from .._vendor.pieces_os_client.wrapper.version_compatibility import (
     UpdateEnum,
     VersionChecker,
@@ -21,18 +25,62 @@ from .._vendor.pieces_os_client.wrapper.websockets.ltm_vision_ws import LTMVisio
 from .._vendor.pieces_os_client.wrapper.websockets.auth_ws import AuthWS
 from mcp.client.sse import sse_client
 from mcp import ClientSession
+from mcp.shared.message import SessionMessage
 from mcp.server import Server
 import mcp.server.stdio
 import mcp.types as types
 from mcp.server.lowlevel import NotificationOptions
 from mcp.server.models import InitializationOptions
 
+# Collects the JSON-RPC id of the upstream request sent by the current task
+_sent_request: ContextVar[Optional[dict]] = ContextVar("sent_request", default=None)
+
+
+class _RequestIdStream:
+    """
+    The write stream of the upstream session, recording the id of the requests
+    it sends so a tool call can be cancelled upstream.
+    """
+
+    def __init__(self, stream):
+        self._stream = stream
+
+    async def send(self, message: SessionMessage):
+        sent_request = _sent_request.get()
+        root = message.message.root
+        if sent_request is not None and isinstance(root, types.JSONRPCRequest):
+            sent_request["id"] = root.id
+        await self._stream.send(message)
+
+    async def __aenter__(self):
+        await self._stream.__aenter__()
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return await self._stream.__aexit__(*exc_info)
+
+    def __getattr__(self, name):
+        return getattr(self._stream, name)
+
 
 class PosMcpConnection:
     """Manages connection to the Pieces MCP server."""
 
+    STATUS_CACHE_TTL = 5.0  # Seconds a successful check is reused without websockets
+    LTM_TOOLS = ("ask_pieces_ltm", "create_pieces_memory")  # Tools that need LTM
+    MAX_CONCURRENT_CALLS = 8
+    CALL_TIMEOUT = 120.0
+    SESSION_PING_INTERVAL = 30.0  # Idle seconds before an existing session is pinged again
+    RECONNECT_INITIAL_DELAY = 0.5
+    RECONNECT_MAX_DELAY = 30.0
+
     def __init__(
-        self, upstream_url: str, tools_changed_callback: Callable[[], Awaitable[None]]
+        self,
+        upstream_url: str,
+        tools_changed_callback: Callable[[], Awaitable[None]],
+        max_concurrent_calls: Optional[int] = None,
+        call_timeout: Optional[float] = CALL_TIMEOUT,
+        result_cache: Optional[ToolResultCache] = None,
     ):
         self.upstream_url = (
             upstream_url  # Can be None if PiecesOS wasn't running at startup
@@ -50,10 +98,39 @@ class PosMcpConnection:
         self._tools_changed_callback = tools_changed_callback
         self._health_check_lock = threading.Lock()
 
+        # Successful status checks keyed by tool name, used without websockets
+        self._status_cache: dict[str, float] = {}
+        self._status_generation = 0
+        # Status reported by the websockets keyed by whether LTM is required
+        self._ws_status: dict[bool, tuple[bool, str]] = {}
+        self._ws_sources: set[str] = set()  # Websockets that reported a status
+
+        # Tool calls are multiplexed over the single upstream session
+        self.max_concurrent_calls = max_concurrent_calls or self.MAX_CONCURRENT_CALLS
+        self.call_timeout = call_timeout  # None disables the timeout
+        self._call_slots = asyncio.Semaphore(self.max_concurrent_calls)
+        self._in_flight_calls = 0
+        self._last_session_activity = 0.0
+        self._background_tasks = set()
+
+        # Opt-in cache of idempotent tool results, disabled unless tools are allow-listed
+        self.result_cache = (
+            result_cache if result_cache is not None else ToolResultCache()
+        )
+
         # Add cleanup coordination
         self._cleanup_requested = asyncio.Event()
         self._connection_task = None
 
+        # Background reconnect supervisor
+        self._loop = None
+        self._reconnect_requested = asyncio.Event()
+        self._supervisor_task = None
+        self._disconnected_at = None
+        self.reconnect_count = 0
+        self.failed_reconnect_attempts = 0
+        self.last_time_to_ready = None
+
     def _try_get_upstream_url(self):
         """Try to get the upstream URL if we don't have it yet."""
         if self.upstream_url is None:
@@ -75,8 +152,11 @@ class PosMcpConnection:
         try:
             loop = asyncio.get_running_loop()
         except RuntimeError:
-            Settings.logger.debug("No running loop for cleanup request")
-            return
+            # Called from a websocket thread, use the loop the supervisor runs on
+            loop = self._loop
+            if loop is None:
+                Settings.logger.debug("No running loop for cleanup request")
+                return
 
         if loop and not loop.is_closed():
             # Schedule cleanup in the event loop
@@ -92,6 +172,116 @@ class PosMcpConnection:
             self._connection_task.cancel()
             Settings.logger.debug("Connection task cancelled due to cleanup request")
 
+        # Reconnect in the background instead of on the next tool call
+        self._on_reconnect_requested()
+
+    def _is_connected(self) -> bool:
+        return (
+            self.session is not None
+            and self._connection_task is not None
+            and not self._connection_task.done()
+            and not self._cleanup_requested.is_set()
+        )
+
+    def request_reconnect(self):
+        """
+        Ask the supervisor to re-establish the upstream session (thread-safe).
+
+        Called when the HealthWS reports PiecesOS is back up, it does nothing
+        while the session is connected.
+        """
+        loop = self._loop
+        if loop is None or loop.is_closed() or self._is_connected():
+            return
+        loop.call_soon_threadsafe(self._on_reconnect_requested)
+
+    def _on_reconnect_requested(self):
+        if self._disconnected_at is None:
+            self._disconnected_at = time.monotonic()
+        self._reconnect_requested.set()
+
+    def start_reconnect_supervisor(self):
+        """Start the background task that keeps the upstream session connected."""
+        self._loop = asyncio.get_running_loop()
+        if self._supervisor_task is None or self._supervisor_task.done():
+            self._supervisor_task = asyncio.create_task(self._reconnect_supervisor())
+
+    async def stop_reconnect_supervisor(self):
+        if self._supervisor_task and not self._supervisor_task.done():
+            self._supervisor_task.cancel()
+            try:
+                await self._supervisor_task
+            except asyncio.CancelledError:
+                pass
+        self._supervisor_task = None
+
+    async def _reconnect_supervisor(self):
+        """
+        Re-establish the upstream session with exponential backoff.
+
+        While PiecesOS is down, a reconnect request (PiecesOS reported back by
+        the HealthWS) cuts the current wait short. The backoff keeps growing
+        until the session is connected.
+        """
+        while True:
+            await self._reconnect_requested.wait()
+            delay = self.RECONNECT_INITIAL_DELAY
+            while not self._is_connected():
+                self._reconnect_requested.clear()
+                pieces_os_running = await asyncio.to_thread(
+                    self._check_pieces_os_status
+                )
+                if pieces_os_running and await self._try_reconnect():
+                    break
+                self.failed_reconnect_attempts += 1
+                Settings.logger.debug(f"Reconnect failed, retrying in {delay:.1f}s")
+                if pieces_os_running:
+                    # The upstream endpoint failed, a health report won't help
+                    await asyncio.sleep(delay)
+                else:
+                    try:
+                        await asyncio.wait_for(self._reconnect_requested.wait(), delay)
+                    except asyncio.TimeoutError:
+                        pass
+                delay = min(delay * 2, self.RECONNECT_MAX_DELAY)
+            self._reconnect_requested.clear()
+            self._disconnected_at = None
+
+    async def _try_reconnect(self) -> bool:
+        """Connect to the upstream server and refresh the tools."""
+        try:
+            # The connection handler re-runs update_tools and notifies on changes
+            await self.connect(send_notification=True)
+        except Exception as e:
+            Settings.logger.debug(f"Background reconnect failed: {e}")
+            return False
+
+        self.reconnect_count += 1
+        if self._disconnected_at is not None:
+            self.last_time_to_ready = time.monotonic() - self._disconnected_at
+        Settings.logger.info(
+            f"Reconnected to upstream MCP server ({self.reconnect_metrics()})"
+        )
+        sentry_sdk.add_breadcrumb(
+            message="MCP connection re-established",
+            category="mcp",
+            level="info",
+            data=self.reconnect_metrics(),
+        )
+        return True
+
+    def reconnect_metrics(self) -> dict:
+        """Reconnect counters of the upstream connection."""
+        return {
+            "reconnect_count": self.reconnect_count,
+            "failed_reconnect_attempts": self.failed_reconnect_attempts,
+            "last_time_to_ready": (
+                round(self.last_time_to_ready, 3)
+                if self.last_time_to_ready is not None
+                else None
+            ),
+        }
+
     async def _cleanup_stale_session(self):
         """Clean up a stale session and its resources."""
         # Store references to avoid race conditions
@@ -126,10 +316,10 @@ class PosMcpConnection:
         Returns:
             Tuple[bool, str]: A tuple containing a boolean indicating compatibility, str: message if it is not compatible.
         """
-        version = Settings.pieces_client.version
-        if version == "debug":
-            return True, ""
         if not self.result:
+            version = Settings.pieces_client.version
+            if version == "debug":
+                return True, ""
             self.result = VersionChecker(
                 Settings.PIECES_OS_MIN_VERSION,
                 Settings.PIECES_OS_MAX_VERSION,
@@ -167,8 +357,6 @@ class PosMcpConnection:
                 if health_ws:
                     health_ws.start()
 
-                sentry_sdk.set_user({"id": Settings.get_os_id() or "unknown"})
-
                 # Update the user profile cache
                 Settings.pieces_client.user.user_profile = (
                     Settings.pieces_client.user_api.user_snapshot().user
@@ -217,7 +405,7 @@ class PosMcpConnection:
             )
 
         # Step 4: Check LTM status (only for LTM-related tools)
-        if tool_name in ["ask_pieces_ltm", "create_pieces_memory"]:
+        if tool_name in self.LTM_TOOLS:
             ltm_enabled = self._check_ltm_status()
             if not ltm_enabled:
                 return False, (
@@ -230,6 +418,62 @@ class PosMcpConnection:
         # All checks passed
         return True, ""
 
+    def invalidate_status_cache(self):
+        """Drop the successful status checks, the next tool call checks again."""
+        self._status_generation += 1
+        self._status_cache = {}
+
+    def update_status_cache(self, source: Optional[str] = None):
+        """
+        Store the system status reported by the websockets (thread-safe).
+
+        Called from the HealthWS/AuthWS/LTMVisionWS callbacks with the status
+        that changed ("health", "user" or "ltm"), or without one when PiecesOS
+        went down. Once the user was reported on a connected health websocket,
+        tool calls are validated against the stored status without any request
+        to PiecesOS, LTM tools once the LTM status was reported too.
+        """
+        self.invalidate_status_cache()
+        if source is None or not (
+            HealthWS.is_running() and Settings.pieces_client.is_pos_stream_running
+        ):
+            self._ws_sources.clear()
+            self._ws_status = {}
+            return
+        self._ws_sources.add(source)
+        if "user" not in self._ws_sources:
+            return
+        # Only in memory checks now that the websockets keep the status
+        status = {False: self._validate_system_status("")}
+        if "ltm" in self._ws_sources:
+            status[True] = self._validate_system_status(self.LTM_TOOLS[0])
+        self._ws_status = status
+
+    async def _validate_system_status_async(self, tool_name: str) -> tuple[bool, str]:
+        """
+        Same as _validate_system_status without blocking the event loop.
+
+        The status reported by the websockets is used when they are connected.
+        Otherwise a successful result is reused for STATUS_CACHE_TTL seconds,
+        the blocking checks only run in a worker thread when it is expired.
+        """
+        reported = self._ws_status.get(tool_name in self.LTM_TOOLS)
+        if reported is not None:
+            return reported
+
+        checked_at = self._status_cache.get(tool_name)
+        if checked_at is not None and time.monotonic() - checked_at < self.STATUS_CACHE_TTL:
+            return True, ""
+
+        generation = self._status_generation
+        is_valid, error_message = await asyncio.to_thread(
+            self._validate_system_status, tool_name
+        )
+        # Don't cache a result a websocket invalidated while it was being checked
+        if is_valid and generation == self._status_generation:
+            self._status_cache[tool_name] = time.monotonic()
+        return is_valid, error_message
+
     def _get_error_message_for_tool(self, tool_name: str) -> str:
         """Get appropriate error message based on the tool and system status."""
         # Use the 3-step validation system
@@ -289,6 +533,8 @@ class PosMcpConnection:
                 f"Tools changed: old hash {self._previous_tools_hash}, new hash {new_hash}"
             )
             self._previous_tools_hash = new_hash
+            # Cached results may not match the new tool definitions
+            self.result_cache.clear()
             return True
         return False
 
@@ -328,6 +574,7 @@ class PosMcpConnection:
 
     async def _connection_handler(self, send_notification: bool = True):
         """Handle the connection lifecycle in a single task context."""
+        established = False
         try:
             Settings.logger.info(
                 f"Connecting to upstream MCP server at {self.upstream_url}"
@@ -338,10 +585,11 @@ class PosMcpConnection:
             read_stream, write_stream = await self.sse_client.__aenter__()
 
             # Enter session context
-            session = ClientSession(read_stream, write_stream)
+            session = ClientSession(read_stream, _RequestIdStream(write_stream))
             Settings.logger.info("Connecting to the client session")
             await session.__aenter__()
             self.session = session
+            established = True
 
             # Update tools and setup notifications
             await self.update_tools(session, send_notification)
@@ -444,9 +692,33 @@ class PosMcpConnection:
             # Cleanup happens in the same task context where __aenter__ was called
             await self._cleanup_stale_session()
             Settings.logger.debug("Connection handler cleanup completed")
+            if established and not self._cleanup_requested.is_set():
+                # The stream dropped on its own, let the supervisor reconnect
+                self._on_reconnect_requested()
+
+    def _get_active_session(self):
+        """
+        Return the current session without pinging it if it was used recently.
+
+        Concurrent tool calls share the session through this path instead of
+        queuing on the connection lock.
+        """
+        if (
+            self.session is not None
+            and self._connection_task
+            and not self._connection_task.done()
+            and time.monotonic() - self._last_session_activity
+            < self.SESSION_PING_INTERVAL
+        ):
+            return self.session
+        return None
 
     async def connect(self, send_notification: bool = True):
         """Ensures a connection to the POS server exists and returns it."""
+        session = self._get_active_session()
+        if session is not None:
+            return session
+
         async with self.connection_lock:
             # Check if we have a valid existing connection
             if (
@@ -456,6 +728,7 @@ class PosMcpConnection:
             ):
                 try:
                     await self.session.send_ping()
+                    self._last_session_activity = time.monotonic()
                     Settings.logger.debug("Using existing upstream connection")
                     return self.session
                 except Exception as e:
@@ -491,6 +764,7 @@ class PosMcpConnection:
                 ):  # Wait up to 10 seconds
                     if self.session is not None:
                         Settings.logger.info("Connection established successfully")
+                        self._last_session_activity = time.monotonic()
                         return self.session
                     await asyncio.sleep(self.CONNECTION_CHECK_INTERVAL)
 
@@ -566,6 +840,13 @@ class PosMcpConnection:
             # Clear discovered tools on full cleanup
             self.discovered_tools = []
 
+            if self.result_cache.tools:
+                Settings.logger.info(
+                    f"Tool result cache: {self.result_cache.hits} hits, "
+                    f"{self.result_cache.misses} misses"
+                )
+            self.result_cache.clear()
+
             Settings.logger.info("Connection cleanup completed")
 
     async def call_tool(self, name, arguments):
@@ -573,41 +854,136 @@ class PosMcpConnection:
         Settings.logger.debug(f"Calling tool: {name}")
 
         # Perform 3-step validation before attempting to call tool
-        is_valid, error_message = self._validate_system_status(name)
+        is_valid, error_message = await self._validate_system_status_async(name)
         if not is_valid:
             Settings.logger.debug(f"Tool validation failed for {name}: {error_message}")
             return types.CallToolResult(
                 content=[types.TextContent(type="text", text=error_message)]
             )
 
+        if self.result_cache.is_cacheable(name):
+            cached_result = self.result_cache.get(name, arguments)
+            Settings.logger.debug(
+                f"Tool result cache {'hit' if cached_result else 'miss'} for {name} "
+                f"(hits: {self.result_cache.hits}, misses: {self.result_cache.misses})"
+            )
+            if cached_result is not None:
+                return cached_result
+
         # All validations passed, try to call the upstream tool
         try:
-            Settings.logger.debug(f"Calling upstream tool: {name}")
-            session = await self.connect()
+            async with self._call_slots:
+                self._in_flight_calls += 1
+                try:
+                    Settings.logger.debug(
+                        f"Calling upstream tool: {name} "
+                        f"({self._in_flight_calls}/{self.max_concurrent_calls} in flight)"
+                    )
+                    session = await self.connect()
+                    result = await self._call_upstream_tool(session, name, arguments)
+                finally:
+                    self._in_flight_calls -= 1
 
-            result = await session.call_tool(name, arguments)
             Settings.logger.debug(f"Successfully called tool: {name}")
             Settings.logger.debug(f"with results: {result}")
+            self.result_cache.put(name, arguments, result)
             return result
 
         except Exception as e:
             Settings.logger.error(f"Error calling POS MCP {name}: {e}", exc_info=True)
 
             # Return a helpful error message based on the tool and system status
-            error_message = self._get_error_message_for_tool(name)
+            self.invalidate_status_cache()
+            error_message = await asyncio.to_thread(
+                self._get_error_message_for_tool, name
+            )
             return types.CallToolResult(
                 content=[types.TextContent(type="text", text=error_message)]
             )
 
+    async def _call_upstream_tool(self, session, name, arguments):
+        """
+        Call a tool on the upstream session with the per call timeout.
+
+        If the call times out or the stdio client cancels it, PiecesOS is told
+        to cancel the request as well so it stops working on it.
+        """
+        sent_request = {}  # Filled by _RequestIdStream when the request is sent
+        _sent_request.set(sent_request)
+        try:
+            async with asyncio.timeout(self.call_timeout):
+                result = await session.call_tool(name, arguments)
+        except asyncio.CancelledError:
+            Settings.logger.debug(f"Tool call {name} cancelled by the client")
+            self._send_upstream_cancellation(
+                session, sent_request.get("id"), "cancelled by client"
+            )
+            raise
+        except TimeoutError:
+            Settings.logger.info(
+                f"Tool call {name} timed out after {self.call_timeout} seconds"
+            )
+            self._send_upstream_cancellation(session, sent_request.get("id"), "timeout")
+            return types.CallToolResult(
+                content=[
+                    types.TextContent(
+                        type="text",
+                        text=(
+                            f"The '{self._sanitize_tool_name(name)}' tool did not respond "
+                            f"within {self.call_timeout:g} seconds. Please retry your request."
+                        ),
+                    )
+                ],
+                isError=True,
+            )
+        self._last_session_activity = time.monotonic()
+        return result
+
+    def _send_upstream_cancellation(self, session, request_id, reason: str):
+        """Notify the upstream server that a request was cancelled."""
+        if request_id is None:
+            return
+        notification = types.ClientNotification(
+            types.CancelledNotification(
+                params=types.CancelledNotificationParams(
+                    requestId=request_id, reason=reason
+                )
+            )
+        )
+        # Sent from its own task, the caller's task is already being cancelled
+        task = asyncio.get_running_loop().create_task(
+            session.send_notification(notification)
+        )
+        self._background_tasks.add(task)
+        task.add_done_callback(self._on_cancellation_sent)
+
+    def _on_cancellation_sent(self, task: asyncio.Task):
+        self._background_tasks.discard(task)
+        if not task.cancelled() and task.exception():
+            Settings.logger.debug(
+                f"Failed to send cancellation upstream: {task.exception()}"
+            )
+
 
 class MCPGateway:
     """Gateway server between POS MCP server and stdio."""
 
-    def __init__(self, server_name, upstream_url):
+    def __init__(
+        self,
+        server_name,
+        upstream_url,
+        max_concurrent_calls: Optional[int] = None,
+        call_timeout: Optional[float] = PosMcpConnection.CALL_TIMEOUT,
+        result_cache: Optional[ToolResultCache] = None,
+    ):
         self.server_name = server_name
         self.server = Server(server_name)
         self.upstream = PosMcpConnection(
-            upstream_url, self.send_tools_changed_notification
+            upstream_url,
+            self.send_tools_changed_notification,
+            max_concurrent_calls=max_concurrent_calls,
+            call_timeout=call_timeout,
+            result_cache=result_cache,
         )
 
         # Add MCP server info to Sentry context
@@ -651,7 +1027,7 @@ class MCPGateway:
         async def list_tools() -> list[types.Tool]:
             Settings.logger.debug("Received list_tools request")
 
-            if self.upstream._check_pieces_os_status():
+            if await asyncio.to_thread(self.upstream._check_pieces_os_status):
                 await self.upstream.connect(send_notification=False)
 
                 Settings.logger.debug(
@@ -702,6 +1078,7 @@ class MCPGateway:
                     await self.upstream.connect(send_notification=False)
                 except Exception as e:
                     Settings.logger.error(f"Failed to connect to upstream server {e}")
+            self.upstream.start_reconnect_supervisor()
 
             Settings.logger.info(f"Starting stdio server for {self.server.name}")
             async with mcp.server.stdio.stdio_server() as (read_stream, write_stream):
@@ -738,6 +1115,7 @@ class MCPGateway:
             # But do it in a way that doesn't interfere with stdio cleanup
             Settings.logger.info("Gateway shutting down, cleaning up connections")
             try:
+                await self.upstream.stop_reconnect_supervisor()
                 await self.upstream.cleanup()
             except Exception as e:
                 Settings.logger.debug(f"Error during cleanup: {e}")
@@ -746,6 +1124,10 @@ class MCPGateway:
 async def main():
     # Just initialize settings without starting services
     Settings.logger.info("Starting MCP Gateway")
+    telemetry.start()
+    # `mcp start` skips Settings.startup, apply the connection settings here
+    # before the first request initializes the host
+    Settings.configure_client()
     is_pos_stream_running_lock = threading.Lock()
     upstream_connection = None
 
@@ -834,16 +1216,46 @@ async def main():
     if hasattr(signal, "SIGINT"):
         signal.signal(signal.SIGINT, lambda s, f: signal_handler())
 
+    pieces_os_up = False  # Last state reported by the health websocket
+
+    def on_status_changed(source: Optional[str] = None):
+        # Keep the gateway status cache in sync with the websockets
+        if upstream_connection:
+            upstream_connection.update_status_cache(source)
+
+    def on_user_changed(user):
+        # AuthWS only stores the user profile after its callback
+        Settings.pieces_client.user.user_profile = user
+        on_status_changed("user")
+
+    def on_health_message(message: str):
+        nonlocal pieces_os_up
+        is_up = message.lower().startswith("ok")
+        if is_up != pieces_os_up:
+            pieces_os_up = is_up
+            if is_up:
+                # HealthWS only marks the stream running after its callback
+                Settings.pieces_client.is_pos_stream_running = True
+            on_status_changed("health" if is_up else None)
+            # PiecesOS is back, reconnect before the next tool call needs it
+            if upstream_connection and is_up:
+                upstream_connection.request_reconnect()
+
     # HealthWS starts the AuthWS, which starts the LTMVisionWS
-    ltm_vision = LTMVisionWS(Settings.pieces_client, lambda x: None)
+    ltm_vision = LTMVisionWS(
+        Settings.pieces_client, lambda status: on_status_changed("ltm")
+    )
     user_ws = AuthWS(
-        Settings.pieces_client, lambda x: None, lambda x: ltm_vision.start()
+        Settings.pieces_client, on_user_changed, lambda x: ltm_vision.start()
     )
 
     def on_ws_event(ws, e):
+        nonlocal pieces_os_up
         if isinstance(e, WebSocketConnectionClosedException):
             with is_pos_stream_running_lock:
                 Settings.pieces_client.is_pos_stream_running = False
+            pieces_os_up = False
+            on_status_changed(None)
             # Also request cleanup if we have the connection reference
             if upstream_connection:
                 upstream_connection.request_cleanup()
@@ -852,7 +1264,7 @@ async def main():
 
     health_ws = HealthWS(
         Settings.pieces_client,
-        lambda x: None,
+        on_health_message,
         lambda ws: user_ws.start(),
         on_error=on_ws_event,
     )
@@ -861,16 +1273,26 @@ async def main():
     upstream_url = None
     if Settings.pieces_client.is_pieces_running():
         upstream_url = get_mcp_latest_url()
-        sentry_sdk.set_user({"id": Settings.get_os_id() or "unknown"})
         health_ws.start()
 
     gateway = MCPGateway(
         server_name="pieces-stdio-mcp",
         upstream_url=upstream_url,
+        max_concurrent_calls=Settings.cli_config.config.mcp_max_concurrent_calls,
+        call_timeout=Settings.cli_config.config.mcp_call_timeout,
+        result_cache=ToolResultCache(
+            Settings.cli_config.config.mcp_cached_tools,
+            ttl=Settings.cli_config.config.mcp_cache_ttl,
+            max_entries=Settings.cli_config.config.mcp_cache_max_entries,
+        ),
     )
 
     # Store reference for exception handler
     upstream_connection = gateway.upstream
+    if pieces_os_up and Settings.pieces_client.user.user_profile:
+        # The websockets reported before the gateway was created
+        await asyncio.to_thread(on_status_changed, "health")
+        await asyncio.to_thread(on_status_changed, "user")
 
     try:
         await gateway.run()
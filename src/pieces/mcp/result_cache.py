@@ -0,0 +1,70 @@
+import json
+import time
+from collections import OrderedDict
+from typing import Any, Iterable, Optional, Tuple
+
+import mcp.types as types
+
+# Tools with side effects, never served from the cache even if configured
+NEVER_CACHED_TOOLS = frozenset({"create_pieces_memory"})
+
+
+class ToolResultCache:
+    """
+    TTL and size bounded cache of upstream tool results.
+
+    Only the tools in the allow-list are cached, the cache is disabled when it is empty.
+    """
+
+    def __init__(
+        self, tools: Iterable[str] = (), ttl: float = 30.0, max_entries: int = 128
+    ):
+        self.tools = frozenset(tools) - NEVER_CACHED_TOOLS
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[str, Tuple[float, types.CallToolResult]]" = (
+            OrderedDict()
+        )
+
+    def is_cacheable(self, name: str) -> bool:
+        return name in self.tools
+
+    @staticmethod
+    def key(name: str, arguments: Optional[dict]) -> str:
+        """Canonical key of a tool call, independent of the arguments order."""
+        return json.dumps(
+            [name, arguments or {}], sort_keys=True, separators=(",", ":"), default=str
+        )
+
+    def get(
+        self, name: str, arguments: Optional[dict]
+    ) -> Optional[types.CallToolResult]:
+        """Return the cached result of the call if it has not expired."""
+        key = self.key(name, arguments)
+        entry = self._entries.get(key)
+        if entry is not None and time.monotonic() - entry[0] < self.ttl:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+        if entry is not None:
+            del self._entries[key]
+        self.misses += 1
+        return None
+
+    def put(self, name: str, arguments: Optional[dict], result: Any):
+        """Cache a successful result of an allow-listed tool."""
+        if not self.is_cacheable(name) or getattr(result, "isError", False):
+            return
+        key = self.key(name, arguments)
+        self._entries[key] = (time.monotonic(), result)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self):
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -1,7 +1,8 @@
 import os
 import sys
+import time
+from typing import Optional
 from rich.progress import Progress, TextColumn, SpinnerColumn
-import sentry_sdk
 
 from pieces.config.constants import (
     CLI_CONFIG_PATH,
@@ -9,6 +10,7 @@ from pieces.config.constants import (
     MCP_CONFIG_PATH,
     USER_CONFIG_PATH,
 )
+from pieces.handshake import StartupHandshake
 from pieces.headless.exceptions import HeadlessCompatibilityError
 from pieces.logger import Logger
 from pieces._vendor.pieces_os_client.wrapper import PiecesClient
@@ -53,23 +55,48 @@ class Settings:
 
     run_in_loop = False  # is CLI looping?
     headless_mode: bool = False  # is CLI running in headless mode?
+    headless_stream: bool = False  # are headless events streamed as NDJSON?
 
     open_snippet_dir = os.path.join(PIECES_DATA_DIR, "opened_snippets")
+    snapshots_dir = os.path.join(PIECES_DATA_DIR, "snapshots")
+    discovery_cache_path = os.path.join(PIECES_DATA_DIR, "pieces_os_discovery.json")
+    startup_cache_path = os.path.join(PIECES_DATA_DIR, "startup_cache.json")
 
     @classmethod
     def startup(cls, bypass_login=False):
+        cls.configure_client()
+        started_at = time.perf_counter()
         if cls.pieces_client.is_pieces_running():
-            cls.version_check()  # Check the version first
+            health_duration = time.perf_counter() - started_at
+            # The independent requests are sent at once
+            handshake = StartupHandshake(
+                cls.pieces_client,
+                cls.startup_cache_path,
+                cls.cli_config.config.startup_cache_ttl,
+            )
+            handshake.start(
+                ["version"] if bypass_login else ["version", "user", "models"]
+            )
+            cls.version_check(handshake.get("version"))  # Check the version first
             if not bypass_login:
                 # All of that needs the user to be logged in
-                cls.check_login()
+                user = cls.check_login(handshake.get("user"))
+                cls.pieces_client.user.user_profile = user
+                cls.pieces_client.models_object = handshake.get("models")
                 model_info = Settings.model_config.model
                 if model_info:
                     cls.pieces_client.model_name = model_info.name
-                os_id = cls.get_os_id()
-                sentry_sdk.set_user({"id": os_id or "unknown"})
+                # The caches belong to this PiecesOS install and user
+                instance = f"{cls.pieces_os_instance()}:{user.id}"
+                cls.pieces_client.enable_snapshot_disk_cache(
+                    cls.snapshots_dir, instance
+                )
+                if cls.cli_config.config.local_search_index:
+                    cls.pieces_client.enable_search_index(cls.snapshots_dir, instance)
+            handshake.save()
+            handshake.log_trace(cls.logger, health=health_duration)
         else:
-            if cls.pieces_client.is_pieces_running() or cls.open_pieces_widget():
+            if cls.open_pieces_widget():
                 return cls.startup(bypass_login)
             if cls.logger.confirm(
                 "Pieces OS is required but wasn’t found or couldn’t be launched.\n"
@@ -85,9 +112,14 @@ class Settings:
             sys.exit(2)  # Exit the program
 
     @classmethod
-    def version_check(cls):
-        """Check if the version of PiecesOS is compatible"""
-        cls.pieces_os_version = cls.pieces_client.version
+    def version_check(cls, version: Optional[str] = None):
+        """
+        Check if the version of PiecesOS is compatible
+
+        Args:
+            version: The version of PiecesOS if already known, otherwise requested.
+        """
+        cls.pieces_os_version = version or cls.pieces_client.version
         if cls.pieces_os_version == "debug":
             return  # Skip version check in debug mode
         result = VersionChecker(
@@ -116,8 +148,28 @@ class Settings:
             sys.exit(2)
 
     @classmethod
-    def check_login(cls):
-        user = cls.pieces_client.user_api.user_snapshot().user
+    def configure_client(cls):
+        """Apply the connection settings of the CLI config to the PiecesOS client."""
+        config = cls.cli_config.config
+        cls.pieces_client.connection_pool_block = config.connection_pool_block
+        cls.pieces_client.request_timeout = config.request_timeout
+        cls.pieces_client.tcp_keepalive = config.tcp_keepalive
+        cls.pieces_client.max_hydration_workers = config.max_hydration_workers
+        # None sizes the pool from the default and the hydration workers
+        cls.pieces_client.connection_pool_maxsize = config.connection_pool_maxsize
+        # A warm client, e.g. in the daemon, gets the changed settings
+        cls.pieces_client.apply_connection_settings()
+        cls.pieces_client.enable_discovery_cache(cls.discovery_cache_path)
+
+    @classmethod
+    def check_login(cls, user=None):
+        """
+        Return the logged in user, asking the user to sign in if needed.
+
+        Args:
+            user: The user snapshot if already known, otherwise requested.
+        """
+        user = user or cls.pieces_client.user_api.user_snapshot().user
         if not user:
             if cls.logger.confirm(
                 "Please sign into Pieces to use this feature. Do you want to sign in now?"
@@ -125,7 +177,7 @@ class Settings:
                 cls.pieces_client.user.login(True)
                 user = cls.pieces_client.user_api.user_snapshot().user
         if user:
-            return
+            return user
         sys.exit(1)
 
     @classmethod
@@ -156,6 +208,19 @@ class Settings:
         if not cls.run_in_loop:
             sys.exit(2)
 
+    @classmethod
+    def pieces_os_instance(cls) -> Optional[str]:
+        """
+        The id of the PiecesOS the caches belong to. It is saved with the
+        discovered port and only requested again when the health response or
+        the version of PiecesOS changes.
+        """
+        os_id = cls.pieces_client.known_os_id(cls.pieces_os_version)
+        if os_id is None:
+            os_id = cls.get_os_id()
+            cls.pieces_client.remember_os_id(os_id, cls.pieces_os_version)
+        return os_id
+
     @classmethod
     def get_os_id(cls):
         from pieces._vendor.pieces_os_client.models.application_name_enum import (
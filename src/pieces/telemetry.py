@@ -0,0 +1,105 @@
+"""
+Error reporting with Sentry, kept off the CLI start-up path.
+
+sentry_sdk is only imported and initialized once a command needs PiecesOS
+(in a background thread while the CLI connects) or when an error is
+reported. The PiecesOS id is looked up when an event is sent rather than on
+every start-up, and the exit flush is skipped when no event was queued.
+"""
+
+import threading
+from typing import Optional
+
+# https://sentry.zendesk.com/hc/en-us/articles/26741783759899-My-DSN-key-is-publicly-visible-is-this-a-security-vulnerability
+SENTRY_DSN = (
+    "https://c1b7b0748590decc1aac426add5f4e12"
+    "@o552351.ingest.us.sentry.io/4509837316980737"
+)
+
+_options: Optional[dict] = None  # The sentry_sdk.init options, None if disabled
+_init_thread: Optional[threading.Thread] = None
+_lock = threading.Lock()
+_queued = False  # Was an event sent to Sentry?
+
+
+def setup(release: str, environment: str, dsn: Optional[str] = SENTRY_DSN):
+    """
+    Enable error reporting, Sentry itself is initialized by start().
+
+    Args:
+        release: The version of the CLI.
+        environment: The Sentry environment (production, staging...).
+        dsn: The Sentry DSN.
+    """
+    global _options
+    _options = {
+        "dsn": dsn,
+        "release": release,
+        "send_default_pii": True,
+        "environment": environment,
+        "before_send": _before_send,
+    }
+
+
+def start():
+    """Initialize Sentry in a background thread, does nothing if disabled."""
+    global _init_thread
+    with _lock:
+        if _options is None or _init_thread is not None:
+            return
+        _init_thread = threading.Thread(
+            target=_init, name="SentryInit", daemon=True
+        )
+        _init_thread.start()
+
+
+def _init():
+    import sentry_sdk
+
+    sentry_sdk.init(**_options)
+
+
+def _wait(timeout: Optional[float] = None) -> bool:
+    """Start Sentry if needed and wait for it, returns whether it is enabled."""
+    start()
+    if _init_thread is None:
+        return False
+    _init_thread.join(timeout)
+    return not _init_thread.is_alive()
+
+
+def _before_send(event, hint):
+    """Tag the event with the PiecesOS id, looked up only when an event is sent."""
+    global _queued
+    user = event.setdefault("user", {})
+    if "id" not in user:
+        user["id"] = _os_id() or "unknown"
+    _queued = True
+    return event
+
+
+def _os_id() -> Optional[str]:
+    from pieces.settings import Settings
+
+    try:
+        return Settings.get_os_id()
+    except Exception:  # PiecesOS is not reachable
+        return None
+
+
+def capture_exception(error: BaseException):
+    """Report an exception to Sentry."""
+    if not _wait(timeout=5):
+        return
+    import sentry_sdk
+
+    sentry_sdk.capture_exception(error)
+
+
+def flush(timeout: float = 2):
+    """Send the queued events, returns at once if none was queued."""
+    if not _queued:
+        return
+    import sentry_sdk
+
+    sentry_sdk.flush(timeout)
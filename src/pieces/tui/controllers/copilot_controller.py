@@ -1,5 +1,6 @@
 """Controller for handling copilot operations and streaming."""
 
+import threading
 from typing import Optional, TYPE_CHECKING
 from pieces.settings import Settings
 from .base_controller import BaseController, EventType
@@ -14,12 +15,26 @@ if TYPE_CHECKING:
 class CopilotController(BaseController):
     """Handles all copilot operations including streaming responses."""
 
-    def __init__(self):
-        """Initialize the copilot controller."""
+    STREAM_COALESCE_INTERVAL = 0.05  # Seconds stream chunks are batched for
+
+    def __init__(self, coalesce_interval: float = STREAM_COALESCE_INTERVAL):
+        """
+        Initialize the copilot controller.
+
+        Args:
+            coalesce_interval: Seconds the streamed chunks are batched for before
+                a COPILOT_STREAM_CHUNK event is emitted, 0 emits every chunk
+        """
         super().__init__()
         self._current_response = ""
         self._current_status: Optional[str] = None
         self._current_chat: Optional[BasicChat] = None
+        self.coalesce_interval = coalesce_interval
+        self._pending_chunk = ""  # Text received since the last chunk event
+        self._flush_timer: Optional[threading.Timer] = None
+        self._chunk_lock = threading.RLock()
+        self._received_chunks = 0
+        self._emitted_chunks = 0
 
     def initialize(self):
         """Initialize the copilot controller."""
@@ -43,6 +58,7 @@ class CopilotController(BaseController):
         """Clean up copilot resources."""
         try:
             # Clear streaming state
+            self._discard_pending_chunk()
             self._current_response = ""
             self._current_status = None
             self._current_chat = None
@@ -60,6 +76,7 @@ class CopilotController(BaseController):
         Args:
             query: The question to ask
         """
+        self._discard_pending_chunk()
         self._current_response = ""
         self._current_status = None
 
@@ -109,15 +126,8 @@ class CopilotController(BaseController):
                                 self._current_response,
                             )
                         else:
-                            # Subsequent chunks - update accumulated response and emit chunk event
-                            self._current_response += answer.text
-                            self.emit(
-                                EventType.COPILOT_STREAM_CHUNK,
-                                {
-                                    "text": answer.text,
-                                    "full_text": self._current_response,
-                                },
-                            )
+                            # Subsequent chunks - batched into one chunk event per interval
+                            self._queue_chunk(answer.text)
 
             elif current_status == "COMPLETED":
                 if response.conversation:
@@ -134,6 +144,10 @@ class CopilotController(BaseController):
                         self.emit(EventType.CHAT_SWITCHED, new_chat)
 
                 # Emit completion event
+                self._flush_chunks()
+                Settings.logger.debug(
+                    f"Streamed {self._received_chunks} chunks in {self._emitted_chunks} chunk events"
+                )
                 self.emit(
                     EventType.COPILOT_STREAM_COMPLETED,
                     self._current_response,
@@ -149,6 +163,7 @@ class CopilotController(BaseController):
                 or current_status == "CANCELED"
             ):
                 # Handle error/cancellation
+                self._flush_chunks()
                 self.emit(
                     EventType.COPILOT_STREAM_ERROR,
                     {
@@ -164,6 +179,7 @@ class CopilotController(BaseController):
 
         except Exception as e:
             Settings.logger.error(f"Error handling stream message: {e}")
+            self._discard_pending_chunk()
             self.emit(
                 EventType.COPILOT_STREAM_ERROR,
                 {
@@ -175,6 +191,45 @@ class CopilotController(BaseController):
             self._current_response = ""
             self._current_status = None
 
+    def _queue_chunk(self, text: str):
+        """Add a streamed chunk, it is emitted with the others received in the same interval."""
+        with self._chunk_lock:
+            self._current_response += text
+            self._pending_chunk += text
+            self._received_chunks += 1
+            if self.coalesce_interval <= 0:
+                self._flush_chunks()
+            elif self._flush_timer is None:
+                self._flush_timer = threading.Timer(
+                    self.coalesce_interval, self._flush_chunks
+                )
+                self._flush_timer.daemon = True
+                self._flush_timer.start()
+
+    def _flush_chunks(self):
+        """Emit the text received since the last chunk event as one COPILOT_STREAM_CHUNK."""
+        # The lock is held while emitting so a flush never lands after the completion event
+        with self._chunk_lock:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+            if not self._pending_chunk:
+                return
+            delta, self._pending_chunk = self._pending_chunk, ""
+            self._emitted_chunks += 1
+            # Only the delta, the whole answer is sent with the completion event
+            self.emit(EventType.COPILOT_STREAM_CHUNK, {"text": delta})
+
+    def _discard_pending_chunk(self):
+        """Drop the batched text without emitting it."""
+        with self._chunk_lock:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+            self._pending_chunk = ""
+            self._received_chunks = 0
+            self._emitted_chunks = 0
+
     def stop_streaming(self):
         """Stop the current streaming operation."""
         try:
@@ -192,6 +247,7 @@ class CopilotController(BaseController):
                 Settings.pieces_client.copilot.ask_stream_ws.send_message(stop_input)
 
                 # Emit stream stopped event
+                self._flush_chunks()
                 self.emit(
                     EventType.COPILOT_STREAM_ERROR,
                     {
@@ -31,7 +31,9 @@ class EventHub:
         self._controllers["chat"] = ChatController()
         self._controllers["model"] = ModelController()
         self._controllers["connection"] = ConnectionController()
-        self._controllers["copilot"] = CopilotController()
+        self._controllers["copilot"] = CopilotController(
+            Settings.cli_config.config.tui_stream_coalesce_interval
+        )
         self._controllers["workstream"] = WorkstreamController()
 
     def initialize(self):
@@ -201,7 +203,7 @@ class EventHub:
         self.copilot.on(
             EventType.COPILOT_STREAM_CHUNK,
             lambda data: self._post_to_all_targets(
-                CopilotMessages.StreamChunk(data["text"], data["full_text"])
+                CopilotMessages.StreamChunk(data["text"])
             ),
         )
         self.copilot.on(
@@ -21,8 +21,7 @@ class ContextClearedData(TypedDict):
 class CopilotStreamChunkData(TypedDict):
     """Data for copilot stream chunk event."""
 
-    text: str
-    full_text: str
+    text: str  # The text streamed since the previous chunk event
 
 
 class CopilotStreamErrorData(TypedDict):
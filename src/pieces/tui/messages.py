@@ -160,12 +160,11 @@ class CopilotMessages:
             self.text = text
 
     class StreamChunk(Message):
-        """Copilot streamed a chunk."""
+        """Copilot streamed a chunk, the text received since the previous one."""
 
-        def __init__(self, chunk: str, full_text: str) -> None:
+        def __init__(self, chunk: str) -> None:
             super().__init__()
             self.chunk = chunk
-            self.full_text = full_text
 
     class StreamCompleted(Message):
         """Copilot completed streaming."""
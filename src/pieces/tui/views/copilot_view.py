@@ -273,7 +273,7 @@ Ready to assist with code, questions, and more!"""
     ) -> None:
         """Handle copilot stream chunk."""
         if self.chat_view_panel:
-            self.chat_view_panel.update_streaming_message(message.full_text)
+            self.chat_view_panel.append_streaming_message(message.chunk)
 
     async def on_copilot_messages_stream_completed(
         self, _: CopilotMessages.StreamCompleted
@@ -1,5 +1,6 @@
 """Chat view panel widget for displaying conversation history."""
 
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import List, Optional, TYPE_CHECKING
 import threading
@@ -28,6 +29,26 @@ class AddMessageFromBasic(Message):
         self.basic_message = basic_message
 
 
+class MessagesLoaded(Message):
+    """Message with the (lazy) messages of a chat and its first page, from background thread."""
+
+    def __init__(self, chat: "BasicChat", all_messages: List["BasicMessage"], start: int) -> None:
+        super().__init__()
+        self.chat = chat
+        self.all_messages = all_messages
+        self.start = start
+
+
+class AddMessagesPage(Message):
+    """Message to mount an older or newer page of messages, from background thread."""
+
+    def __init__(self, chat: "BasicChat", start: int, end: int) -> None:
+        super().__init__()
+        self.chat = chat
+        self.start = start
+        self.end = end
+
+
 class FinalizeLoading(Message):
     """Message to finalize loading process from background thread."""
 
@@ -64,14 +85,23 @@ class ChatViewPanel(BaseContentPanel):
     }
     """
 
-    messages: reactive[List[ChatMessage]] = reactive([])
+    messages: reactive[List[ChatMessage]] = reactive(list)
     current_chat: Optional["BasicChat"] = None
 
+    PAGE_SIZE = 30  # Messages mounted at once when loading a page
+    MAX_MOUNTED_MESSAGES = 90  # Pages further away are unmounted
+    LOAD_MORE_THRESHOLD = 3  # Lines from the top/bottom that trigger a page load
+
     def __init__(self, **kwargs):
         super().__init__(panel_title="Chat", **kwargs)
         self._streaming_widget: Optional[ChatMessage] = None
         self._thinking_widget: Optional[Static] = None
         self._last_message_count = 0
+        # Messages of the chat, only the ones in [_window_start, _window_end) are mounted
+        self._all_messages: List["BasicMessage"] = []
+        self._window_start = 0
+        self._window_end = 0
+        self._page_loading = False
 
     def load_conversation(self, chat: "BasicChat"):
         """Load a conversation from a BasicChat object."""
@@ -81,19 +111,17 @@ class ChatViewPanel(BaseContentPanel):
         threading.Thread(target=self.load_messages, args=(chat,), daemon=True).start()
 
     def load_messages(self, chat: "BasicChat"):
-        """Load messages in background thread with proper UI updates via message system."""
+        """Load the last page of messages in background thread, older pages are loaded on scroll up."""
         try:
-            messages = chat.messages()
+            messages = chat.messages(lazy=True)
             Settings.logger.info(
                 f"Loading {len(messages)} messages for chat: {chat.name}"
             )
 
-            for i, message in enumerate(messages):
-                Settings.logger.debug(
-                    f"Message {i}: {message.role} - created: {message.message.created.value if message.message.created else 'None'}"
-                )
-                # Send message to main thread to add this message
-                self.post_message(AddMessageFromBasic(message))
+            start = max(0, len(messages) - self.PAGE_SIZE)
+            self._hydrate(messages[start:])
+            # Send messages to main thread to mount the last page
+            self.post_message(MessagesLoaded(chat, messages, start))
 
             # Send message to finalize loading
             self.post_message(FinalizeLoading(len(messages)))
@@ -103,6 +131,131 @@ class ChatViewPanel(BaseContentPanel):
             # Send error message to main thread
             self.post_message(ShowError(f"❌ Error loading conversation: {str(e)}"))
 
+    @staticmethod
+    def _hydrate(messages: List["BasicMessage"]):
+        """Fetch the content of lazily loaded messages in parallel."""
+        if not messages:
+            return
+        workers = min(Settings.pieces_client.max_hydration_workers, len(messages))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            list(executor.map(lambda message: message.raw_content, messages))
+
+    def _load_page(self, chat: "BasicChat", start: int, end: int):
+        """Fetch the content of a page in background thread and mount it."""
+        try:
+            self._hydrate(self._all_messages[start:end])
+            self.post_message(AddMessagesPage(chat, start, end))
+        except Exception as e:
+            self._page_loading = False
+            Settings.logger.error(f"Error loading messages page: {e}")
+
+    def _request_page(self, older: bool):
+        """Load the page before or after the mounted window."""
+        if self._page_loading or not self.current_chat:
+            return
+        if older:
+            if self._window_start == 0:
+                return
+            start, end = max(0, self._window_start - self.PAGE_SIZE), self._window_start
+        else:
+            if self._window_end >= len(self._all_messages):
+                return
+            start = self._window_end
+            end = min(len(self._all_messages), start + self.PAGE_SIZE)
+        self._page_loading = True
+        threading.Thread(
+            target=self._load_page, args=(self.current_chat, start, end), daemon=True
+        ).start()
+
+    def watch_scroll_y(self, old_value: float, new_value: float) -> None:
+        super().watch_scroll_y(old_value, new_value)
+        if new_value <= self.LOAD_MORE_THRESHOLD and new_value < old_value:
+            self._request_page(older=True)
+        elif new_value >= self.max_scroll_y - self.LOAD_MORE_THRESHOLD and new_value > old_value:
+            self._request_page(older=False)
+
+    def on_messages_loaded(self, event: MessagesLoaded) -> None:
+        """Handle the first page of a chat loaded from background thread."""
+        if event.chat is not self.current_chat:
+            return
+        self._all_messages = event.all_messages
+        self._window_start = self._window_end = event.start
+        self._mount_page(event.start, len(event.all_messages))
+
+    def on_add_messages_page(self, event: AddMessagesPage) -> None:
+        """Handle a page loaded on scroll from background thread."""
+        self._page_loading = False
+        if event.chat is not self.current_chat:
+            return
+        self._mount_page(event.start, event.end)
+
+    def _mount_page(self, start: int, end: int):
+        """Mount the messages [start, end) next to the window and unmount the far side."""
+        widgets = []
+        for message in self._all_messages[start:end]:
+            try:
+                widgets.append(ChatMessage.from_basic_message(message))
+            except Exception as e:
+                Settings.logger.error(f"Error adding message: {e}")
+                # Keep a widget in its place so the window stays aligned with the history
+                widgets.append(
+                    ChatMessage(role="system", content="❌ Error loading message")
+                )
+
+        if end <= self._window_start and self.messages:
+            # Older page, keep the messages in view where they are
+            height = self.virtual_size.height
+            self.messages[:0] = widgets
+            self.mount_all(widgets, before=self.messages[len(widgets)])
+            self._window_start = start
+            self.call_after_refresh(
+                lambda: self.scroll_to(
+                    y=self.scroll_y + self.virtual_size.height - height, animate=False
+                )
+            )
+            self._recycle(from_top=False)
+        else:
+            # Newer page, goes before the messages added live in this session
+            index = self._window_end - self._window_start
+            before = (
+                self.messages[index]
+                if index < len(self.messages)
+                else self._streaming_widget or self._thinking_widget
+            )
+            self.messages[index:index] = widgets
+            if before is not None:
+                self.mount_all(widgets, before=before)
+            else:
+                self.mount_all(widgets)
+            self._window_end = end
+            self._recycle(from_top=True)
+
+    def _recycle(self, from_top: bool):
+        """Unmount the messages furthest from the page that was just mounted."""
+        extra = len(self.messages) - self.MAX_MOUNTED_MESSAGES
+        if extra <= 0:
+            return
+        # Only messages of the loaded history can be mounted again later
+        history = self._window_end - self._window_start
+        extra = min(extra, history)
+        if from_top:
+            removed, self.messages[:] = self.messages[:extra], self.messages[extra:]
+            height = self.virtual_size.height
+            self._window_start += extra
+            self.call_after_refresh(
+                lambda: self.scroll_to(
+                    y=self.scroll_y - (height - self.virtual_size.height),
+                    animate=False,
+                )
+            )
+        else:
+            # The newest messages are only unmounted if they are part of the history
+            removed = self.messages[history - extra : history]
+            del self.messages[history - extra : history]
+            self._window_end -= extra
+        for widget in removed:
+            widget.remove()
+
     def update_conversation_incrementally(self, chat: "BasicChat"):
         """Add new messages to the conversation without full reload."""
         if not self.current_chat or self.current_chat.id != chat.id:
@@ -110,7 +263,8 @@ class ChatViewPanel(BaseContentPanel):
             return
 
         try:
-            messages = chat.messages()
+            # Only the new messages need their content
+            messages = chat.messages(lazy=True)
             current_count = len(messages)
             last_count = getattr(self, "_last_message_count", 0)
 
@@ -150,12 +304,25 @@ class ChatViewPanel(BaseContentPanel):
     def _add_message_from_basic(self, basic_message: "BasicMessage"):
         """Add a message from a BasicMessage object."""
         try:
+            self._show_latest_page()
             message_widget = ChatMessage.from_basic_message(basic_message)
             self.messages.append(message_widget)
             self.mount(message_widget)
         except Exception as e:
             Settings.logger.error(f"Error adding message: {e}")
 
+    def _show_latest_page(self):
+        """Make sure the newest messages are mounted before adding new ones at the bottom."""
+        if self._window_end >= len(self._all_messages):
+            return
+        history = self._window_end - self._window_start
+        for widget in self.messages[:history]:
+            widget.remove()
+        del self.messages[:history]
+        start = max(0, len(self._all_messages) - self.PAGE_SIZE)
+        self._window_start = self._window_end = start
+        self._mount_page(start, len(self._all_messages))
+
     def on_add_message_from_basic(self, event: AddMessageFromBasic) -> None:
         """Handle message to add a BasicMessage from background thread."""
         self._add_message_from_basic(event.basic_message)
@@ -251,6 +418,12 @@ class ChatViewPanel(BaseContentPanel):
                 lambda: self._update_streaming_after_refresh(content_with_cursor)
             )
 
+    def append_streaming_message(self, chunk: str):
+        """Append a streamed chunk to the streaming message content."""
+        if self._streaming_widget:
+            content = self._streaming_widget.content.removesuffix(" ▌")
+            self.update_streaming_message(content + chunk)
+
     def finalize_streaming_message(self):
         """Convert streaming message to permanent message."""
         if self._streaming_widget:
@@ -294,6 +467,9 @@ Ready to help with your coding tasks!"""
 
         self.messages.clear()
         self._last_message_count = 0
+        self._all_messages = []
+        self._window_start = self._window_end = 0
+        self._page_loading = False
 
         try:
             children_to_remove = list(self.children)
@@ -375,7 +551,9 @@ Ready to help with your coding tasks!"""
 
     def get_message_count(self) -> int:
         """Get the total number of messages."""
-        return len(self.messages)
+        # Only a window of the loaded history is mounted
+        unmounted = len(self._all_messages) - (self._window_end - self._window_start)
+        return len(self.messages) + unmounted
 
     def get_last_message(self) -> Optional[ChatMessage]:
         """Get the last message widget."""
@@ -1,4 +1,5 @@
 import shutil
+import threading
 from prompt_toolkit import Application
 from prompt_toolkit.key_binding import KeyBindings
 from prompt_toolkit.layout import Layout
@@ -21,6 +22,8 @@ def get_file_extension(language):
 
 
 class PiecesSelectMenu:
+    REDRAW_INTERVAL = 0.05  # Minimum seconds between two redraws
+
     def __init__(
         self,
         menu_options: List[Tuple],
@@ -39,29 +42,91 @@ class PiecesSelectMenu:
         self.current_selection = 0
         self.footer_text = footer_text
         self.title = title
+        self.filter_text = ""
+        self._filter_key = ""  # Lower case filter text
+        self.filtering = False  # Printable keys go to the filter instead of shortcuts
+        # Indices of the options matching the filter, None when there is no filter
+        self._matches: Optional[List[int]] = None
+        self._search_keys = [str(option[0]).lower() for option in self.menu_options]
+        self._lock = threading.Lock()
         self.update_visible_range()
 
+    def _shown_count(self) -> int:
+        """Number of options shown, the ones matching the filter."""
+        if self._matches is None:
+            return len(self.menu_options)
+        return len(self._matches)
+
+    def _option(self, index: int) -> Tuple:
+        """The option shown at the given position."""
+        if self._matches is None:
+            return self.menu_options[index]
+        return self.menu_options[self._matches[index]]
+
     def update_visible_range(self):
         terminal_size = shutil.get_terminal_size()
         # Reserve space for title, borders and footer
-        max_visible_items = terminal_size.lines - 4
-        self.visible_start = max(0, self.current_selection - max_visible_items // 2)
+        self.max_visible_items = max(1, terminal_size.lines - 4)
+        self.visible_start = max(
+            0, self.current_selection - self.max_visible_items // 2
+        )
         self.visible_end = min(
-            len(self.menu_options), self.visible_start + max_visible_items
+            self._shown_count(), self.visible_start + self.max_visible_items
         )
 
     def add_entry(self, entry: Tuple[str, Any]):
         """Add a new entry to the menu and update the layout."""
-        self.menu_options.append(entry)
-        self.update_visible_range()
+        self.add_entries([entry])
+
+    def add_entries(self, entries: List[Tuple[str, Any]]):
+        """Add several entries to the menu and update the layout once."""
+        if not entries:
+            return
+        keys = [str(entry[0]).lower() for entry in entries]
+        with self._lock:
+            start = len(self.menu_options)
+            self.menu_options.extend(entries)
+            self._search_keys.extend(keys)
+            if self._matches is not None:
+                self._matches.extend(
+                    start + i for i, key in enumerate(keys) if self._filter_key in key
+                )
+            # Only the end of the visible window can move when entries are appended
+            self.visible_end = min(
+                self._shown_count(), self.visible_start + self.max_visible_items
+            )
+        self.update_app()
+
+    def set_filter(self, text: str):
+        """Only show the options containing the text, case insensitive."""
+        key = text.lower()
+        with self._lock:
+            if not key:
+                self._matches = None
+            elif self._matches is not None and key.startswith(self._filter_key):
+                # Narrowing the filter, only the current matches can still match
+                keys = self._search_keys
+                self._matches = [i for i in self._matches if key in keys[i]]
+            else:
+                self._matches = [
+                    i
+                    for i, option_key in enumerate(self._search_keys)
+                    if key in option_key
+                ]
+            self.filter_text = text
+            self._filter_key = key
+            self.current_selection = 0
+            self.update_visible_range()
         self.update_app()
 
     def get_menu_text(self):
         result = []
 
-        for i, option in enumerate(
-            self.menu_options[self.visible_start : self.visible_end]
-        ):
+        with self._lock:
+            visible = [
+                self._option(idx) for idx in range(self.visible_start, self.visible_end)
+            ]
+        for i, option in enumerate(visible):
             idx = i + self.visible_start
 
             if idx == self.current_selection:
@@ -73,6 +138,15 @@ class PiecesSelectMenu:
         return result
 
     def get_title_text(self):
+        if self.filtering or self.filter_text:
+            count = f"{self._shown_count()}/{len(self.menu_options)}"
+            return [
+                ("class:title", f" {self.title} "),
+                (
+                    "class:filter",
+                    f" Filter: {self.filter_text}▌ ({count}) ",
+                ),
+            ]
         return [("class:title", f" {self.title} ")]
 
     def get_footer_text(self):
@@ -80,15 +154,17 @@ class PiecesSelectMenu:
             return [("class:footer", f" {self.footer_text} ")]
         else:
             return [
-                ("class:footer", " ↑/↓: Navigate • Enter: Select • q/Ctrl+C: Quit ")
+                (
+                    "class:footer",
+                    " ↑/↓: Navigate • Enter: Select • Type or /: Filter"
+                    " • q/Ctrl+C: Quit ",
+                )
             ]
 
     def update_app(self):
         if hasattr(self, "app"):
-            self.menu_window.content = FormattedTextControl(text=self.get_menu_text)
+            # Redraws are coalesced by the application (min_redraw_interval)
             self.app.invalidate()
-        else:
-            pass
 
     def run(self):
         bindings = KeyBindings()
@@ -102,7 +178,7 @@ class PiecesSelectMenu:
 
         @bindings.add("down")
         def move_down(event):
-            if self.current_selection < len(self.menu_options) - 1:
+            if self.current_selection < self._shown_count() - 1:
                 self.current_selection += 1
                 self.update_visible_range()
             event.app.layout.focus(self.menu_window)
@@ -117,8 +193,9 @@ class PiecesSelectMenu:
         @bindings.add("pagedown")
         def page_down(event):
             items_per_page = self.visible_end - self.visible_start
-            self.current_selection = min(
-                len(self.menu_options) - 1, self.current_selection + items_per_page
+            self.current_selection = max(
+                0,
+                min(self._shown_count() - 1, self.current_selection + items_per_page),
             )
             self.update_visible_range()
             event.app.layout.focus(self.menu_window)
@@ -131,20 +208,50 @@ class PiecesSelectMenu:
 
         @bindings.add("end")
         def go_to_bottom(event):
-            self.current_selection = len(self.menu_options) - 1
+            self.current_selection = max(0, self._shown_count() - 1)
             self.update_visible_range()
             event.app.layout.focus(self.menu_window)
 
         @bindings.add("enter")
         def select_option(event):
-            args = self.menu_options[self.current_selection][1]
+            with self._lock:
+                if self.current_selection >= self._shown_count():
+                    return  # Nothing matches the filter
+                args = self._option(self.current_selection)[1]
             event.app.exit(result=args)
 
         @bindings.add("c-c")
-        @bindings.add("q")
         def exit_app(event):
             event.app.exit(result=False)
 
+        @bindings.add("escape", eager=True)
+        def clear_filter(event):
+            self.filtering = False
+            self.set_filter("")
+
+        @bindings.add("backspace")
+        def delete_filter_character(event):
+            if self.filter_text:
+                self.set_filter(self.filter_text[:-1])
+            else:
+                self.filtering = False
+                self.update_app()
+
+        @bindings.add("<any>")
+        def type_filter(event):
+            character = event.data
+            if len(character) != 1 or not character.isprintable():
+                return
+            if not self.filtering:
+                if character == "q":
+                    event.app.exit(result=False)
+                    return
+                self.filtering = True
+                if character == "/":
+                    self.update_app()
+                    return
+            self.set_filter(self.filter_text + character)
+
         self.menu_window = Window(
             content=FormattedTextControl(text=self.get_menu_text),
             always_hide_cursor=True,
@@ -178,6 +285,7 @@ class PiecesSelectMenu:
             {
                 "selected": "reverse bold",
                 "title": "ansicyan bold",
+                "filter": "ansiyellow",
                 "footer": "ansibrightblack italic",
             }
         )
@@ -188,6 +296,7 @@ class PiecesSelectMenu:
             style=style,
             full_screen=True,
             mouse_support=True,
+            min_redraw_interval=self.REDRAW_INTERVAL,
         )
 
         args = self.app.run()
@@ -0,0 +1,39 @@
+"""
+Test suite for headless search models.
+
+Tests for the search response factory function.
+"""
+
+import json
+
+from pieces.headless.models.search import create_search_success
+from pieces.headless.models.base import SuccessResponse
+
+
+class TestSearchSuccess:
+    """Test create_search_success function."""
+
+    def test_create_search_success(self):
+        """Test search success response creation."""
+        results = [
+            {"id": "a", "name": "A", "score": 1.0, "exact": True, "modes": ["fts"]}
+        ]
+        response = create_search_success("query", "fts", results)
+
+        assert isinstance(response, SuccessResponse)
+        assert response.command == "search"
+        assert response.data == {
+            "query": "query",
+            "mode": "fts",
+            "count": 1,
+            "results": results,
+        }
+
+    def test_create_search_success_no_results(self):
+        """Test search success response without results serializes."""
+        response = create_search_success("query", "all", [])
+
+        parsed = json.loads(response.to_json())
+        assert parsed["success"] is True
+        assert parsed["data"]["count"] == 0
+        assert parsed["data"]["results"] == []
@@ -0,0 +1,207 @@
+"""
+Test suite for headless NDJSON streaming.
+
+Tests for EventResponse, HeadlessOutput.output_event and the streamed output
+of the ask, search and list commands: every event is one JSON line printed as
+soon as it is known, followed by the final response.
+"""
+
+import json
+from types import SimpleNamespace
+from unittest.mock import Mock, patch
+
+import pytest
+
+from pieces._vendor.pieces_os_client.models.qgpt_stream_output import QGPTStreamOutput
+from pieces.command_interface.ask_command import AskCommand
+from pieces.core import search_command
+from pieces.core.list_command import ListCommand
+from pieces.headless.exceptions import HeadlessError
+from pieces.headless.models.base import EventResponse
+from pieces.headless.output import HeadlessOutput
+from pieces.settings import Settings
+
+
+def _frame(status, text=""):
+    answers = [{"score": 1, "text": text}] if text else []
+    return QGPTStreamOutput.from_dict(
+        {
+            "conversation": "conversation-id",
+            "request": "request-id",
+            "status": status,
+            "question": {"answers": {"iterable": answers}},
+        }
+    )
+
+
+def _lines(capsys):
+    return [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+
+
+@pytest.fixture
+def headless():
+    with (
+        patch.object(Settings, "headless_mode", True),
+        patch.object(Settings, "headless_stream", True),
+        patch.object(Settings, "logger", Mock()),
+    ):
+        yield
+
+
+class TestEventResponse:
+    """Test EventResponse and HeadlessOutput.output_event."""
+
+    def test_event_response_to_dict(self):
+        """Test event response dictionary conversion."""
+        response = EventResponse("ask", "chunk", {"text": "Hello"})
+        assert response.to_dict() == {
+            "success": True,
+            "command": "ask",
+            "event": "chunk",
+            "data": {"text": "Hello"},
+        }
+
+    def test_output_event_is_one_flushed_line(self):
+        """Test that events are printed on one line and flushed."""
+        with patch("builtins.print") as mock_print:
+            HeadlessOutput.output_event("ask", "chunk", {"text": "a\nb"})
+
+        mock_print.assert_called_once()
+        line = mock_print.call_args.args[0]
+        assert "\n" not in line
+        assert json.loads(line)["data"] == {"text": "a\nb"}
+        assert mock_print.call_args.kwargs["flush"] is True
+
+    def test_output_event_serialization_error(self, capsys):
+        """Test that unserializable events are reported as errors."""
+        HeadlessOutput.output_event("ask", "chunk", {"text": object()})
+        (line,) = _lines(capsys)
+        assert line["success"] is False
+
+
+class TestAskStreaming:
+    """Test the streamed output of pieces --headless --stream ask."""
+
+    @pytest.fixture
+    def command(self, headless):
+        command = AskCommand.instance
+        frames = []
+
+        def stream_question(query):
+            for frame in frames:
+                command.ask_stream.on_message(frame)
+
+        client = Mock()
+        client.copilot.stream_question.side_effect = stream_question
+        with (
+            patch.object(Settings, "pieces_client", client),
+            patch("pieces.copilot.ask_command.AskStreamWS"),
+            patch("pieces.copilot.ask_command.BasicChat"),
+        ):
+            yield command, frames
+
+    def test_chunks_are_streamed(self, command, capsys):
+        command, frames = command
+        frames += [
+            _frame("IN-PROGRESS", "Hello"),
+            _frame("IN-PROGRESS", " world"),
+            _frame("COMPLETED"),
+        ]
+        result = command.execute(query="hi")
+
+        lines = _lines(capsys)
+        assert [line["event"] for line in lines] == ["progress", "chunk", "chunk"]
+        assert "".join(line["data"]["text"] for line in lines[1:]) == "Hello world"
+        # The streamed answer is not repeated in the final response
+        assert result.headless_response.to_dict()["data"] == {
+            "query": "hi",
+            "conversation_id": "conversation-id",
+        }
+
+    def test_answer_without_stream(self, command, capsys):
+        command, frames = command
+        frames += [_frame("IN-PROGRESS", "Hello"), _frame("COMPLETED")]
+        with patch.object(Settings, "headless_stream", False):
+            result = command.execute(query="hi")
+
+        assert capsys.readouterr().out == ""
+        assert result.headless_response.data["answer"] == "Hello"
+
+    def test_failure_raises(self, command):
+        command, frames = command
+        frames += [_frame("IN-PROGRESS", "Hel"), _frame("FAILED")]
+        with pytest.raises(HeadlessError):
+            command.execute(query="hi")
+
+
+class TestSearchAndListStreaming:
+    """Test the streamed output of search and list."""
+
+    NAMES = [[("a", "Name a"), ("b", "Name b")], [("c", "Name c")]]
+
+    def test_search_results_are_streamed(self, headless, capsys):
+        results = [
+            search_command.SearchResult(id, 1.0, modes=["fts"]) for id in "abcd"
+        ]
+        with (
+            patch.object(
+                search_command, "search_assets", return_value=(results, False)
+            ),
+            patch.object(ListCommand, "_iter_asset_names", return_value=self.NAMES),
+        ):
+            response = search_command.search_headless(["query"], search_type="fts")
+
+        lines = _lines(capsys)
+        assert lines[0]["event"] == "progress"
+        assert lines[0]["data"] == {"found": 4}
+        # "d" was deleted meanwhile
+        assert [line["data"]["name"] for line in lines[1:]] == [
+            "Name a",
+            "Name b",
+            "Name c",
+        ]
+        assert response.data == {"query": "query", "mode": "fts", "count": 3}
+
+    def test_materials_are_streamed(self, headless, capsys):
+        client = Mock()
+        client.assets.return_value = [SimpleNamespace(_id=id) for id in "abc"]
+        with (
+            patch.object(Settings, "pieces_client", client),
+            patch.object(ListCommand, "_iter_asset_names", return_value=self.NAMES),
+        ):
+            response = ListCommand.list_headless(type="materials")
+
+        lines = _lines(capsys)
+        assert lines[0] == {
+            "success": True,
+            "command": "list",
+            "event": "progress",
+            "data": {"total": 3},
+        }
+        assert [line["data"] for line in lines[1:]] == [
+            {"id": "a", "name": "Name a"},
+            {"id": "b", "name": "Name b"},
+            {"id": "c", "name": "Name c"},
+        ]
+        assert response.data == {"type": "materials", "count": 3}
+
+    def test_models_without_stream(self, headless, capsys):
+        client = Mock(available_models_names=["GPT-4o", "Claude"])
+        with (
+            patch.object(Settings, "headless_stream", False),
+            patch.object(Settings, "pieces_client", client),
+            patch.object(
+                Settings, "model_config", Mock(model=SimpleNamespace(name="Claude"))
+            ),
+        ):
+            response = ListCommand.list_headless(type="models")
+
+        assert capsys.readouterr().out == ""
+        assert response.data == {
+            "type": "models",
+            "count": 2,
+            "items": [
+                {"name": "GPT-4o", "current": False},
+                {"name": "Claude", "current": True},
+            ],
+        }
@@ -1,6 +1,9 @@
+import time
 import unittest
 from unittest.mock import Mock, patch
 from prompt_toolkit.application import Application
+from prompt_toolkit.application.current import create_app_session
+from prompt_toolkit.input import create_pipe_input
 from prompt_toolkit.output import DummyOutput
 from pieces.utils import PiecesSelectMenu
 
@@ -61,5 +64,73 @@ class TestPiecesSelectMenu(unittest.TestCase):
         self.on_enter_callback.assert_called_once_with(key="value")
 
 
+class TestPiecesSelectMenuLargeLists(unittest.TestCase):
+    """Batched appends, filtering and rendering with many entries"""
+
+    COUNT = 50_000
+
+    def setUp(self):
+        self.entries = [
+            (f"{i}: Material {i}", {"asset_id": i}) for i in range(self.COUNT)
+        ]
+        self.select_menu = PiecesSelectMenu([], Mock())
+
+    def _run(self, keys: str):
+        """Run the menu, typing the keys."""
+        with create_pipe_input() as pipe_input:
+            pipe_input.send_text(keys)
+            with create_app_session(input=pipe_input, output=DummyOutput()):
+                return self.select_menu.run()
+
+    def test_add_entries_in_batches(self):
+        start = time.perf_counter()
+        for i in range(0, self.COUNT, 200):
+            self.select_menu.add_entries(self.entries[i : i + 200])
+        elapsed = time.perf_counter() - start
+        self.assertEqual(len(self.select_menu.menu_options), self.COUNT)
+        self.assertLess(elapsed, 1)
+
+        start = time.perf_counter()
+        menu_text = self.select_menu.get_menu_text()
+        self.assertLess(time.perf_counter() - start, 0.05)
+        visible = self.select_menu.visible_end - self.select_menu.visible_start
+        self.assertEqual(len(menu_text), visible)
+        self.assertEqual(menu_text[0], ("class:selected", "|▶ 0: Material 0\n"))
+
+    def test_filter_is_incremental(self):
+        self.select_menu.add_entries(self.entries)
+        self.select_menu.set_filter("Material 4999")
+        self.assertEqual(self.select_menu._shown_count(), 11)  # 4999 and 49990-49999
+        self.select_menu.set_filter("material 49999")
+        self.assertEqual(self.select_menu._shown_count(), 1)
+        self.assertEqual(self.select_menu._option(0)[1], {"asset_id": 49999})
+        self.select_menu.set_filter("")
+        self.assertEqual(self.select_menu._shown_count(), self.COUNT)
+
+    def test_filter_applies_to_new_entries(self):
+        self.select_menu.add_entries(self.entries[:10])
+        self.select_menu.set_filter("Material 1")
+        self.assertEqual(self.select_menu._shown_count(), 1)
+        self.select_menu.add_entries(self.entries[10:20])
+        self.assertEqual(self.select_menu._shown_count(), 11)
+
+    def test_type_to_filter_and_select(self):
+        self.select_menu.add_entries(self.entries[:100])
+        self._run("Material 42\r")
+        self.select_menu.on_enter_callback.assert_called_once_with(asset_id=42)
+
+    def test_q_quits_unless_filtering(self):
+        self.select_menu.add_entries(self.entries[:100])
+        self.assertIsNone(self._run("q"))
+        self.select_menu.on_enter_callback.assert_not_called()
+
+    def test_slash_starts_filter(self):
+        self.select_menu.add_entries(
+            self.entries[:100] + [("quick sort", {"asset_id": "quick"})]
+        )
+        self._run("/quick\r")
+        self.select_menu.on_enter_callback.assert_called_once_with(asset_id="quick")
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,122 @@
+"""
+Load tests for MCP Gateway tool call multiplexing.
+Drives parallel tool calls through PosMcpConnection against a local stub MCP SSE server.
+"""
+
+import asyncio
+import statistics
+import time
+import pytest
+from unittest.mock import patch
+
+from .utils import (
+    StubPosMcpConnection,
+    mock_tools_changed_callback,
+    stub_server,
+)
+from pieces.mcp.gateway import PosMcpConnection
+
+
+async def _connection(url, **kwargs) -> PosMcpConnection:
+    connection = StubPosMcpConnection(url, mock_tools_changed_callback, **kwargs)
+    await connection.connect(send_notification=False)
+    return connection
+
+
+def _percentile(latencies, percent):
+    ordered = sorted(latencies)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * percent / 100))]
+
+
+class TestMCPGatewayLoad:
+    """Concurrent tool calls over a single upstream session"""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("calls", [8, 32])
+    async def test_parallel_tool_calls_latency(self, stub_server, calls):
+        """Parallel calls should share the session instead of running one at a time"""
+        url, state = stub_server
+        state.reset()
+        connection = await _connection(url, max_concurrent_calls=calls)
+
+        async def timed_call(i):
+            start = time.perf_counter()
+            result = await connection.call_tool("echo", {"text": f"call {i}"})
+            assert result.content[0].text == f"call {i}"
+            return time.perf_counter() - start
+
+        try:
+            with patch.object(
+                connection, "_validate_system_status", return_value=(True, "")
+            ):
+                start = time.perf_counter()
+                latencies = await asyncio.gather(*(timed_call(i) for i in range(calls)))
+                total = time.perf_counter() - start
+        finally:
+            await connection.cleanup()
+
+        print(
+            f"{calls} parallel calls: total {total * 1e3:.0f}ms,"
+            f" p50 {statistics.median(latencies) * 1e3:.0f}ms,"
+            f" p99 {_percentile(latencies, 99) * 1e3:.0f}ms"
+        )
+        # Serialized calls would never overlap on the server
+        assert state.max_in_flight > 1
+
+    @pytest.mark.asyncio
+    async def test_in_flight_limit(self, stub_server):
+        """No more than max_concurrent_calls should reach the server at once"""
+        url, state = stub_server
+        state.reset()
+        connection = await _connection(url, max_concurrent_calls=2)
+        try:
+            with patch.object(
+                connection, "_validate_system_status", return_value=(True, "")
+            ):
+                await asyncio.gather(
+                    *(connection.call_tool("echo", {"text": "x"}) for _ in range(6))
+                )
+        finally:
+            await connection.cleanup()
+
+        assert state.max_in_flight == 2
+
+    @pytest.mark.asyncio
+    async def test_call_timeout_cancels_upstream(self, stub_server):
+        """A timed out call returns an error and is cancelled on the server"""
+        url, state = stub_server
+        state.reset()
+        connection = await _connection(url, call_timeout=0.3)
+        try:
+            with patch.object(
+                connection, "_validate_system_status", return_value=(True, "")
+            ):
+                result = await connection.call_tool("hang", {})
+                assert "did not respond within 0.3 seconds" in result.content[0].text
+                assert await asyncio.to_thread(state.cancelled.wait, 5)
+
+                # The session is still usable after the timeout
+                result = await connection.call_tool("echo", {"text": "still alive"})
+                assert result.content[0].text == "still alive"
+        finally:
+            await connection.cleanup()
+
+    @pytest.mark.asyncio
+    async def test_client_cancellation_is_propagated(self, stub_server):
+        """Cancelling the gateway call cancels the upstream request"""
+        url, state = stub_server
+        state.reset()
+        connection = await _connection(url)
+        try:
+            with patch.object(
+                connection, "_validate_system_status", return_value=(True, "")
+            ):
+                task = asyncio.create_task(connection.call_tool("hang", {}))
+                await asyncio.sleep(0.3)
+                task.cancel()
+                with pytest.raises(asyncio.CancelledError):
+                    await task
+                assert await asyncio.to_thread(state.cancelled.wait, 5)
+                assert connection._in_flight_calls == 0
+        finally:
+            await connection.cleanup()
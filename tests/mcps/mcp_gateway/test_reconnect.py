@@ -0,0 +1,128 @@
+"""
+Reconnect supervisor tests for MCP Gateway.
+Tests that the upstream session is re-established in the background with backoff.
+"""
+
+import asyncio
+import pytest
+from unittest.mock import patch
+
+from .utils import (
+    StubPosMcpConnection,
+    mock_connection,
+    mock_tools_changed_callback,
+    stub_server,
+)
+
+
+async def _wait_for(predicate, timeout: float = 5):
+    async with asyncio.timeout(timeout):
+        while not predicate():
+            await asyncio.sleep(0.01)
+
+
+class TestMCPGatewayReconnect:
+    """Tests for the background reconnect supervisor"""
+
+    @pytest.mark.asyncio
+    async def test_reconnects_after_stream_drop(self, stub_server):
+        """A dropped session is re-established before the next tool call"""
+        url, _ = stub_server
+        connection = StubPosMcpConnection(url, mock_tools_changed_callback)
+        with patch.object(connection, "_check_pieces_os_status", return_value=True):
+            await connection.connect(send_notification=False)
+            connection.start_reconnect_supervisor()
+            try:
+                # The SSE stream dropped (same path as asyncio_exception_handler)
+                connection.request_cleanup()
+                await _wait_for(lambda: connection.reconnect_count == 1)
+
+                assert connection._get_active_session() is not None
+                assert connection.discovered_tools
+                metrics = connection.reconnect_metrics()
+                assert metrics["reconnect_count"] == 1
+                assert metrics["last_time_to_ready"] is not None
+
+                with patch.object(
+                    connection, "_validate_system_status", return_value=(True, "")
+                ):
+                    result = await connection.call_tool("echo", {"text": "back"})
+                assert result.content[0].text == "back"
+            finally:
+                await connection.stop_reconnect_supervisor()
+                await connection.cleanup()
+
+    @pytest.mark.asyncio
+    async def test_backoff_until_pieces_os_is_back(self, stub_server):
+        """Failed attempts back off until the HealthWS reports PiecesOS back"""
+        url, _ = stub_server
+        connection = StubPosMcpConnection(url, mock_tools_changed_callback)
+        connection.RECONNECT_INITIAL_DELAY = 0.01
+        connection.RECONNECT_MAX_DELAY = 0.04
+        pieces_os_running = False
+
+        with patch.object(
+            connection,
+            "_check_pieces_os_status",
+            side_effect=lambda: pieces_os_running,
+        ) as check_status:
+            connection.start_reconnect_supervisor()
+            try:
+                connection.request_reconnect()
+                await _wait_for(lambda: connection.failed_reconnect_attempts >= 4)
+                assert connection.reconnect_count == 0
+
+                # Backoff is capped at RECONNECT_MAX_DELAY, so attempts continue slowly
+                attempts = check_status.call_count
+                await asyncio.sleep(0.1)
+                assert check_status.call_count - attempts <= 4
+
+                pieces_os_running = True
+                await asyncio.to_thread(connection.request_reconnect)
+                await _wait_for(lambda: connection.reconnect_count == 1)
+                assert connection._is_connected()
+            finally:
+                await connection.stop_reconnect_supervisor()
+                await connection.cleanup()
+
+    @pytest.mark.asyncio
+    async def test_request_reconnect_is_ignored_while_connected(
+        self, mock_connection
+    ):
+        """Health messages while the session is up don't wake the supervisor"""
+        mock_connection.request_reconnect()  # No supervisor yet, nothing happens
+        assert not mock_connection._reconnect_requested.is_set()
+
+        mock_connection.start_reconnect_supervisor()
+        try:
+            with patch.object(mock_connection, "_is_connected", return_value=True):
+                mock_connection.request_reconnect()
+                await asyncio.sleep(0)
+            assert not mock_connection._reconnect_requested.is_set()
+            assert mock_connection._disconnected_at is None
+        finally:
+            await mock_connection.stop_reconnect_supervisor()
+
+    @pytest.mark.asyncio
+    async def test_requests_do_not_reset_the_backoff(self, mock_connection):
+        """Repeated requests while PiecesOS is up don't retry a failing upstream"""
+        mock_connection.RECONNECT_INITIAL_DELAY = 0.05
+        mock_connection.RECONNECT_MAX_DELAY = 1.0
+
+        with (
+            patch.object(mock_connection, "_check_pieces_os_status", return_value=True),
+            patch.object(
+                mock_connection, "connect", side_effect=ConnectionError("upstream down")
+            ),
+        ):
+            mock_connection.start_reconnect_supervisor()
+            try:
+                # e.g. a request for every health ping
+                for _ in range(60):
+                    await asyncio.to_thread(mock_connection.request_reconnect)
+                    await asyncio.sleep(0.005)
+            finally:
+                await mock_connection.stop_reconnect_supervisor()
+
+        # Retrying on every request would make about 60 attempts
+        assert 1 <= mock_connection.failed_reconnect_attempts <= 10
@@ -0,0 +1,148 @@
+"""
+Tool result cache tests for MCP Gateway.
+Tests the opt-in cache of idempotent tool results and its invalidation.
+"""
+
+import pytest
+import mcp.types as types
+from unittest.mock import AsyncMock, Mock, patch
+
+from .utils import mock_tools_changed_callback, create_mock_tools_list
+from pieces.mcp.gateway import PosMcpConnection
+from pieces.mcp.result_cache import ToolResultCache
+
+
+def _result(text: str, is_error: bool = False) -> types.CallToolResult:
+    return types.CallToolResult(
+        content=[types.TextContent(type="text", text=text)], isError=is_error
+    )
+
+
+@pytest.fixture
+def cached_connection():
+    """A connection caching ask_pieces_ltm results, validation always passing."""
+    connection = PosMcpConnection(
+        "http://test-url",
+        mock_tools_changed_callback,
+        result_cache=ToolResultCache(
+            ["ask_pieces_ltm", "create_pieces_memory"], ttl=30, max_entries=2
+        ),
+    )
+    session = Mock()
+    session.call_tool = AsyncMock(side_effect=lambda name, args: _result(str(args)))
+    with (
+        patch.object(
+            connection, "_validate_system_status", return_value=(True, "")
+        ),
+        patch.object(connection, "connect", AsyncMock(return_value=session)),
+    ):
+        yield connection, session
+
+
+class TestToolResultCache:
+    """Unit tests for ToolResultCache"""
+
+    def test_disabled_by_default(self):
+        """Without an allow-list nothing is cacheable"""
+        cache = ToolResultCache()
+        assert not cache.is_cacheable("ask_pieces_ltm")
+        cache.put("ask_pieces_ltm", {}, _result("a"))
+        assert len(cache) == 0
+
+    def test_create_pieces_memory_is_never_cached(self):
+        """Tools with side effects are removed from the allow-list"""
+        cache = ToolResultCache(["create_pieces_memory"])
+        assert not cache.is_cacheable("create_pieces_memory")
+
+    def test_key_ignores_argument_order(self):
+        assert ToolResultCache.key("t", {"a": 1, "b": [1, 2]}) == ToolResultCache.key(
+            "t", {"b": [1, 2], "a": 1}
+        )
+        assert ToolResultCache.key("t", {"a": 1}) != ToolResultCache.key("t", {"a": 2})
+        assert ToolResultCache.key("t", None) == ToolResultCache.key("t", {})
+
+    def test_ttl_expiry(self):
+        cache = ToolResultCache(["tool"], ttl=10)
+        with patch("pieces.mcp.result_cache.time.monotonic", return_value=100.0):
+            cache.put("tool", {}, _result("a"))
+        with patch("pieces.mcp.result_cache.time.monotonic", return_value=105.0):
+            assert cache.get("tool", {}).content[0].text == "a"
+        with patch("pieces.mcp.result_cache.time.monotonic", return_value=111.0):
+            assert cache.get("tool", {}) is None
+        assert (cache.hits, cache.misses) == (1, 1)
+        assert len(cache) == 0
+
+    def test_size_bound_evicts_least_recently_used(self):
+        cache = ToolResultCache(["tool"], max_entries=2)
+        cache.put("tool", {"q": 1}, _result("1"))
+        cache.put("tool", {"q": 2}, _result("2"))
+        cache.get("tool", {"q": 1})
+        cache.put("tool", {"q": 3}, _result("3"))
+        assert cache.get("tool", {"q": 2}) is None
+        assert cache.get("tool", {"q": 1}) is not None
+        assert cache.get("tool", {"q": 3}) is not None
+
+    def test_errors_are_not_cached(self):
+        cache = ToolResultCache(["tool"])
+        cache.put("tool", {}, _result("failed", is_error=True))
+        assert len(cache) == 0
+
+
+class TestGatewayResultCache:
+    """Tests for the result cache in PosMcpConnection.call_tool"""
+
+    @pytest.mark.asyncio
+    async def test_identical_calls_are_served_from_cache(self, cached_connection):
+        connection, session = cached_connection
+        args = {"question": "what did I work on?", "topics": ["work"]}
+        first = await connection.call_tool("ask_pieces_ltm", args)
+        second = await connection.call_tool(
+            "ask_pieces_ltm", {"topics": ["work"], "question": "what did I work on?"}
+        )
+        assert first == second
+        session.call_tool.assert_called_once()
+        assert (connection.result_cache.hits, connection.result_cache.misses) == (1, 1)
+
+    @pytest.mark.asyncio
+    async def test_different_arguments_are_not_shared(self, cached_connection):
+        connection, session = cached_connection
+        await connection.call_tool("ask_pieces_ltm", {"question": "a"})
+        await connection.call_tool("ask_pieces_ltm", {"question": "b"})
+        assert session.call_tool.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_create_pieces_memory_always_reaches_upstream(self, cached_connection):
+        connection, session = cached_connection
+        for _ in range(3):
+            await connection.call_tool("create_pieces_memory", {"summary": "x"})
+        assert session.call_tool.call_count == 3
+        assert len(connection.result_cache) == 0
+
+    @pytest.mark.asyncio
+    async def test_validation_failures_are_not_cached(self, cached_connection):
+        connection, session = cached_connection
+        with patch.object(
+            connection,
+            "_validate_system_status",
+            return_value=(False, "PiecesOS is not running"),
+        ):
+            await connection.call_tool("ask_pieces_ltm", {"question": "a"})
+        await connection.call_tool("ask_pieces_ltm", {"question": "a"})
+        session.call_tool.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_tools_hash_change_invalidates_cache(self, cached_connection):
+        connection, session = cached_connection
+        connection._tools_have_changed(create_mock_tools_list(2))
+        await connection.call_tool("ask_pieces_ltm", {"question": "a"})
+
+        # Same tools, the cache is kept
+        connection._tools_have_changed(create_mock_tools_list(2))
+        await connection.call_tool("ask_pieces_ltm", {"question": "a"})
+        session.call_tool.assert_called_once()
+
+        # New tool definitions, the cache is dropped
+        connection._tools_have_changed(create_mock_tools_list(3))
+        assert len(connection.result_cache) == 0
+        await connection.call_tool("ask_pieces_ltm", {"question": "a"})
+        assert session.call_tool.call_count == 2
@@ -0,0 +1,213 @@
+"""
+System status cache tests for MCP Gateway.
+Tests that tool calls validate off the event loop, use the status reported by
+the websockets and otherwise reuse a recent successful check.
+"""
+
+import threading
+import pytest
+import mcp.types as types
+from unittest.mock import AsyncMock, Mock, patch
+
+from pieces.settings import Settings
+from .utils import mock_connection
+
+
+def _upstream_session():
+    session = Mock()
+    session.call_tool = AsyncMock(
+        return_value=types.CallToolResult(
+            content=[types.TextContent(type="text", text="ok")]
+        )
+    )
+    return session
+
+
+class TestMCPGatewayStatusCache:
+    """Tests for the short lived system status cache"""
+
+    @pytest.mark.asyncio
+    async def test_validation_runs_off_the_event_loop(self, mock_connection):
+        """Blocking status checks should not run on the event loop thread"""
+        threads = []
+
+        def validate(tool_name):
+            threads.append(threading.current_thread())
+            return True, ""
+
+        with patch.object(mock_connection, "_validate_system_status", validate):
+            is_valid, _ = await mock_connection._validate_system_status_async("tool")
+
+        assert is_valid is True
+        assert threads and threads[0] is not threading.current_thread()
+
+    @pytest.mark.asyncio
+    async def test_successful_status_is_reused(self, mock_connection):
+        """Tool calls within the TTL should not check the system status again"""
+        with (
+            patch.object(
+                mock_connection, "_validate_system_status", return_value=(True, "")
+            ) as validate,
+            patch.object(
+                mock_connection,
+                "connect",
+                AsyncMock(return_value=_upstream_session()),
+            ),
+        ):
+            for _ in range(5):
+                result = await mock_connection.call_tool("search_pieces", {})
+                assert result.content[0].text == "ok"
+
+        validate.assert_called_once_with("search_pieces")
+
+    @pytest.mark.asyncio
+    async def test_status_is_cached_per_tool(self, mock_connection):
+        """LTM tools have extra checks so each tool name is cached separately"""
+        with patch.object(
+            mock_connection, "_validate_system_status", return_value=(True, "")
+        ) as validate:
+            await mock_connection._validate_system_status_async("search_pieces")
+            await mock_connection._validate_system_status_async("ask_pieces_ltm")
+            await mock_connection._validate_system_status_async("ask_pieces_ltm")
+
+        assert validate.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_failures_are_not_cached(self, mock_connection):
+        """A failed check should be retried so recovery is picked up immediately"""
+        with patch.object(
+            mock_connection,
+            "_validate_system_status",
+            side_effect=[(False, "PiecesOS is not running"), (True, "")],
+        ) as validate:
+            first = await mock_connection._validate_system_status_async("tool")
+            second = await mock_connection._validate_system_status_async("tool")
+
+        assert first == (False, "PiecesOS is not running")
+        assert second == (True, "")
+        assert validate.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_expired_status_is_checked_again(self, mock_connection):
+        """Entries older than STATUS_CACHE_TTL should be revalidated"""
+        with patch.object(
+            mock_connection, "_validate_system_status", return_value=(True, "")
+        ) as validate:
+            await mock_connection._validate_system_status_async("tool")
+            await mock_connection._validate_system_status_async("tool")
+            mock_connection._status_cache["tool"] -= mock_connection.STATUS_CACHE_TTL
+            await mock_connection._validate_system_status_async("tool")
+
+        assert validate.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_invalidate_status_cache(self, mock_connection):
+        """Invalidating drops the cached status"""
+        with patch.object(
+            mock_connection, "_validate_system_status", return_value=(True, "")
+        ) as validate:
+            await mock_connection._validate_system_status_async("tool")
+            mock_connection.invalidate_status_cache()
+            await mock_connection._validate_system_status_async("tool")
+
+        assert validate.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_invalidation_during_check_is_not_overwritten(self, mock_connection):
+        """A status change while a check is running should not be cached over"""
+
+        def validate(tool_name):
+            mock_connection.invalidate_status_cache()  # e.g. the user logged out
+            return True, ""
+
+        with patch.object(mock_connection, "_validate_system_status", validate):
+            await mock_connection._validate_system_status_async("tool")
+
+        assert mock_connection._status_cache == {}
+
+    def test_version_is_not_fetched_once_cached(self, mock_connection):
+        """The compatibility check should not call PiecesOS once it has a result"""
+        mock_connection.result = Mock(compatible=True)
+        with patch("pieces.mcp.gateway.Settings") as mock_settings:
+            type(mock_settings.pieces_client).version = property(
+                Mock(side_effect=AssertionError("version fetched"))
+            )
+            assert mock_connection._check_version_compatibility() == (True, "")
+
+
+class TestMCPGatewayWebsocketStatus:
+    """Tests for the system status reported by the websockets"""
+
+    @pytest.fixture
+    def connected(self, mock_connection):
+        with (
+            patch("pieces.mcp.gateway.HealthWS.is_running", return_value=True),
+            patch.object(Settings.pieces_client, "is_pos_stream_running", True),
+            patch.object(
+                mock_connection, "_validate_system_status", return_value=(True, "")
+            ) as validate,
+        ):
+            yield mock_connection, validate
+
+    @pytest.mark.asyncio
+    async def test_reported_status_is_used(self, connected):
+        """No check runs per tool call once the websockets reported the status"""
+        connection, validate = connected
+        connection.update_status_cache("health")
+        connection.update_status_cache("user")
+        validate.reset_mock()
+
+        # Long after STATUS_CACHE_TTL
+        with patch("pieces.mcp.gateway.time.monotonic", return_value=1e9):
+            for _ in range(5):
+                assert await connection._validate_system_status_async("tool") == (
+                    True,
+                    "",
+                )
+        validate.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_reported_failure(self, connected):
+        """A status change reported by a websocket applies to the next call"""
+        connection, validate = connected
+        connection.update_status_cache("user")
+        validate.return_value = (False, "User must sign up")
+        connection.update_status_cache("user")  # e.g. the user logged out
+
+        assert await connection._validate_system_status_async("tool") == (
+            False,
+            "User must sign up",
+        )
+
+    @pytest.mark.asyncio
+    async def test_ltm_tools_wait_for_the_ltm_status(self, connected):
+        """LTM tools are checked until the LTM websocket reported"""
+        connection, validate = connected
+        connection.update_status_cache("user")
+        validate.reset_mock()
+        await connection._validate_system_status_async("ask_pieces_ltm")
+        validate.assert_called_once_with("ask_pieces_ltm")
+
+        connection.update_status_cache("ltm")
+        validate.reset_mock()
+        await connection._validate_system_status_async("ask_pieces_ltm")
+        validate.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_disconnected_websockets_fall_back_to_checks(self, connected):
+        """Without the websockets the status is checked and cached for the TTL"""
+        connection, validate = connected
+        connection.update_status_cache("user")
+        connection.update_status_cache(None)  # PiecesOS went down
+        validate.reset_mock()
+
+        await connection._validate_system_status_async("tool")
+        await connection._validate_system_status_async("tool")
+        validate.assert_called_once_with("tool")
+
+    def test_health_websocket_must_be_connected(self, connected):
+        """A status reported while the health websocket is down is not stored"""
+        connection, _ = connected
+        with patch("pieces.mcp.gateway.HealthWS.is_running", return_value=False):
+            connection.update_status_cache("user")
+        assert connection._ws_status == {}
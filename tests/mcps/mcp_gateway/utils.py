@@ -8,9 +8,15 @@ This module provides shared components used across validation and integration te
 - Utility functions for test setup
 """
 
+import asyncio
+import socket
+import threading
+import time
 import urllib.request
 import pytest
 import requests
+import uvicorn
+from mcp.server.fastmcp import FastMCP
 import mcp.types as types
 from unittest.mock import Mock, patch
 from pieces.mcp.gateway import MCPGateway, PosMcpConnection
@@ -189,6 +195,90 @@ def sample_tools():
     ]
 
 
+# ===== STUB MCP SERVER =====
+
+
+STUB_TOOL_DELAY = 0.2
+"""Seconds the stub echo tool takes to answer."""
+
+
+class StubServerState:
+    """What the stub server observed, shared with the tests."""
+
+    def __init__(self):
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.cancelled = threading.Event()
+
+    def reset(self):
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.cancelled.clear()
+
+
+def create_stub_server(state: StubServerState) -> FastMCP:
+    stub = FastMCP("pieces-stub")
+
+    @stub.tool()
+    async def echo(text: str) -> str:
+        """Echo the text back after a short delay."""
+        state.in_flight += 1
+        state.max_in_flight = max(state.max_in_flight, state.in_flight)
+        try:
+            await asyncio.sleep(STUB_TOOL_DELAY)
+            return text
+        finally:
+            state.in_flight -= 1
+
+    @stub.tool()
+    async def hang() -> str:
+        """Never answer until cancelled."""
+        try:
+            await asyncio.sleep(60)
+        except asyncio.CancelledError:
+            state.cancelled.set()
+            raise
+        return "done"
+
+    return stub
+
+
+@pytest.fixture(scope="module")
+def stub_server():
+    """Run the stub MCP SSE server in a background thread."""
+    state = StubServerState()
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+
+    config = uvicorn.Config(
+        create_stub_server(state).sse_app(),
+        host="127.0.0.1",
+        port=port,
+        log_level="error",
+    )
+    server = uvicorn.Server(config)
+    thread = threading.Thread(target=server.run, daemon=True)
+    thread.start()
+    while not server.started:
+        time.sleep(0.05)
+
+    yield f"http://127.0.0.1:{port}/sse", state
+
+    server.should_exit = True
+    thread.join(timeout=5)
+
+
+class StubPosMcpConnection(PosMcpConnection):
+    """PosMcpConnection that runs the MCP initialize handshake the stub server requires."""
+
+    async def update_tools(self, session, send_notification: bool = True):
+        if not getattr(session, "_stub_initialized", False):
+            await session.initialize()
+            session._stub_initialized = True
+        await super().update_tools(session, send_notification)
+
+
 # ===== CONTEXT MANAGERS =====
 
 
@@ -240,6 +330,12 @@ __all__ = [
     "mock_connection",
     "mock_gateway",
     "sample_tools",
+    # Stub MCP server
+    "STUB_TOOL_DELAY",
+    "StubServerState",
+    "StubPosMcpConnection",
+    "create_stub_server",
+    "stub_server",
     # Context managers
     "MockPiecesOSContext",
     # Re-exports for convenience
@@ -0,0 +1,323 @@
+"""
+Test suite for the vendored ApiClient response deserialization.
+
+Tests that the single pass pydantic path and the from_dict path
+produce the same models, that response type strings are resolved once
+and that the connection settings reach the urllib3 pool.
+"""
+
+import enum
+import http.server
+import importlib
+import json
+import pkgutil
+import socket
+import threading
+from unittest.mock import patch
+
+import pytest
+from pydantic import BaseModel
+
+from pieces._vendor.pieces_os_client import models
+from pieces._vendor.pieces_os_client.api_client import ApiClient
+from pieces._vendor.pieces_os_client.configuration import Configuration
+from pieces._vendor.pieces_os_client.models.conversation import Conversation
+from pieces._vendor.pieces_os_client.models.conversations import Conversations
+from pieces._vendor.pieces_os_client.wrapper.api_client import (
+    DEFAULT_CONNECTION_POOL_MAXSIZE,
+    PiecesApiClient,
+)
+from pieces._vendor.pieces_os_client.wrapper.client import (
+    HYDRATED_CACHES_COUNT,
+    PiecesClient,
+)
+from pieces._vendor.pieces_os_client.wrapper.streamed_identifiers._streamed_identifiers import (
+    StreamedIdentifiersCache,
+)
+
+
+CONVERSATION = {
+    "id": "conversation-id",
+    "name": "A conversation",
+    "created": {"value": "2024-01-01T10:00:00.000Z", "readable": "1 year ago"},
+    "updated": {"value": "2024-01-02T10:00:00.000Z"},
+    "type": "COPILOT",
+    "favorited": False,
+    "messages": {
+        "iterable": [{"id": "message-1"}, {"id": "message-2"}],
+        "indices": {"message-1": 0, "message-2": 1},
+    },
+    "unknownField": "ignored",
+}
+
+
+@pytest.fixture
+def api_client():
+    return ApiClient(Configuration("http://127.0.0.1:39300"))
+
+
+class TestFastDeserialization:
+    """Test the fast deserialization path of ApiClient."""
+
+    @pytest.mark.parametrize(
+        "response_type, data",
+        [
+            ("Conversation", CONVERSATION),
+            ("Conversations", {"iterable": [CONVERSATION, CONVERSATION]}),
+        ],
+    )
+    def test_fast_path_matches_from_dict(self, api_client, response_type, data):
+        """Both paths should build equal models."""
+        text = json.dumps(data)
+
+        api_client.configuration.fast_deserialization = True
+        fast = api_client.deserialize(text, response_type, "application/json")
+        api_client.configuration.fast_deserialization = False
+        strict = api_client.deserialize(text, response_type, "application/json")
+
+        assert fast == strict
+        assert type(fast).__name__ == response_type
+
+    def test_fast_path_skips_from_dict(self, api_client):
+        """The fast path should validate the JSON without calling from_dict."""
+        with patch.object(Conversation, "from_dict") as from_dict:
+            conversation = api_client.deserialize(
+                json.dumps(CONVERSATION), "Conversation", "application/json"
+            )
+        from_dict.assert_not_called()
+        assert conversation.messages.iterable[1].id == "message-2"
+
+    def test_strict_path_uses_from_dict(self, api_client):
+        """Disabling fast deserialization should go through from_dict."""
+        api_client.configuration.fast_deserialization = False
+        with patch.object(
+            Conversations, "from_dict", wraps=Conversations.from_dict
+        ) as from_dict:
+            api_client.deserialize(
+                json.dumps({"iterable": [CONVERSATION]}),
+                "Conversations",
+                "application/json",
+            )
+        from_dict.assert_called_once()
+
+    def test_fast_path_falls_back_on_validation_error(self, api_client):
+        """Invalid payloads should still raise from the from_dict path."""
+        data = dict(CONVERSATION)
+        del data["created"]
+        with patch.object(
+            Conversation, "from_dict", wraps=Conversation.from_dict
+        ) as from_dict:
+            with pytest.raises(Exception):
+                api_client.deserialize(
+                    json.dumps(data), "Conversation", "application/json"
+                )
+        from_dict.assert_called_once()
+
+    def test_non_model_types(self, api_client):
+        """Lists and native types are not affected by the fast path."""
+        assert api_client.deserialize("[1, 2]", "List[int]", "application/json") == [
+            1,
+            2,
+        ]
+        assert api_client.deserialize('"text"', "str", "application/json") == "text"
+
+
+def _model_names():
+    """Names of every generated model and enum class."""
+    names = []
+    for module_info in pkgutil.iter_modules(models.__path__):
+        module = importlib.import_module(f"{models.__name__}.{module_info.name}")
+        for name, value in vars(module).items():
+            if (
+                isinstance(value, type)
+                and value.__module__ == module.__name__
+                and issubclass(value, (BaseModel, enum.Enum))
+            ):
+                names.append(name)
+    return names
+
+
+class TestTypeResolution:
+    """Test the memoized response type resolution of ApiClient."""
+
+    def test_resolves_every_model(self, api_client):
+        """Every generated model name resolves to its class."""
+        for name in _model_names():
+            kind, klass = api_client._ApiClient__type_descriptor(name)
+            assert kind == "class"
+            assert klass.__name__ == name
+
+    def test_container_types(self, api_client):
+        """List and Dict type strings are parsed into their item type."""
+        assert api_client._ApiClient__type_descriptor("List[Asset]") == (
+            "list",
+            "Asset",
+        )
+        assert api_client._ApiClient__type_descriptor("Dict[str, Asset]") == (
+            "dict",
+            "Asset",
+        )
+
+    def test_resolution_is_memoized(self, api_client):
+        """Once resolved, a type string is never converted and imported again."""
+        names = _model_names()
+        for name in names:
+            api_client._ApiClient__type_descriptor(f"List[{name}]")
+
+        other_client = ApiClient(Configuration("http://127.0.0.1:39300"))
+        with patch.object(ApiClient, "_ApiClient__resolve_class") as resolve_class:
+            for name in names:
+                other_client._ApiClient__type_descriptor(f"List[{name}]")
+                other_client._ApiClient__type_descriptor(name)
+        resolve_class.assert_not_called()
+
+    @pytest.mark.parametrize("fast_deserialization", [True, False])
+    def test_deserialize_resolves_once(
+        self, api_client, monkeypatch, fast_deserialization
+    ):
+        """The second response of a type is deserialized from the table."""
+        monkeypatch.setattr(ApiClient, "_type_descriptors", {})
+        api_client.configuration.fast_deserialization = fast_deserialization
+        text = json.dumps({"iterable": [CONVERSATION]})
+        resolve_class = ApiClient._ApiClient__resolve_class
+
+        with patch.object(
+            ApiClient,
+            "_ApiClient__resolve_class",
+            autospec=True,
+            side_effect=resolve_class,
+        ) as resolve:
+            api_client.deserialize(text, "Conversations", "application/json")
+            assert "Conversations" in ApiClient._type_descriptors
+            descriptors = dict(ApiClient._type_descriptors)
+            calls = resolve.call_count
+            assert calls >= 1
+
+            api_client.deserialize(text, "Conversations", "application/json")
+        assert resolve.call_count == calls
+        assert ApiClient._type_descriptors == descriptors
+
+
+class _VersionHandler(http.server.BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep the connection open between requests
+
+    def do_GET(self):
+        body = b'"12.0.0"'
+        self.send_response(200)
+        self.send_header("content-type", "application/json")
+        self.send_header("content-length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def local_server():
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), _VersionHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{server.server_port}"
+    server.shutdown()
+    server.server_close()
+
+
+class TestConnectionPool:
+    """Test the connection settings of PiecesApiClient."""
+
+    def test_settings_are_applied(self, local_server):
+        client = PiecesApiClient()
+        client.connection_pool_maxsize = 1000
+        client.connection_pool_block = True
+        client.request_timeout = 3
+        client.init_host(local_server, reconnect_on_host_change=False)
+
+        configuration = client.api_client.configuration
+        assert configuration.connection_pool_maxsize == 1000
+        assert configuration.connection_pool_block is True
+        assert client.api_client.rest_client.default_request_timeout == 3
+        assert (
+            socket.SOL_SOCKET,
+            socket.SO_KEEPALIVE,
+            1,
+        ) in configuration.socket_options
+
+    def test_pool_is_sized_from_the_hydration_workers(self, local_server, monkeypatch):
+        # PiecesClient configures the snapshot caches globally
+        for name in ("pieces_client", "max_hydration_workers", "batch_size"):
+            monkeypatch.setattr(
+                StreamedIdentifiersCache, name, getattr(StreamedIdentifiersCache, name)
+            )
+        client = PiecesClient(max_hydration_workers=2)
+        client.init_host(local_server, reconnect_on_host_change=False)
+        # Never smaller than the default, other requests share the pool
+        assert (
+            client.api_client.configuration.connection_pool_maxsize
+            == DEFAULT_CONNECTION_POOL_MAXSIZE
+        )
+
+        # More workers than the default covers, resized once the host is initialized
+        workers = DEFAULT_CONNECTION_POOL_MAXSIZE
+        client.max_hydration_workers = workers
+        maxsize = workers * HYDRATED_CACHES_COUNT
+        assert client.api_client.configuration.connection_pool_maxsize == maxsize
+        assert client.api_client.rest_client.pool_manager.connection_pool_kw[
+            "maxsize"
+        ] == maxsize
+        assert client.well_known_api.get_well_known_version() == "12.0.0"
+
+    def test_explicit_pool_size_is_kept(self, local_server, monkeypatch):
+        for name in ("pieces_client", "max_hydration_workers", "batch_size"):
+            monkeypatch.setattr(
+                StreamedIdentifiersCache, name, getattr(StreamedIdentifiersCache, name)
+            )
+        client = PiecesClient(connection_pool_maxsize=7)
+        client.init_host(local_server, reconnect_on_host_change=False)
+        client.max_hydration_workers = 100
+        assert client.api_client.configuration.connection_pool_maxsize == 7
+
+        client.connection_pool_maxsize = None  # Back to the derived size
+        assert client.api_client.configuration.connection_pool_maxsize == max(
+            DEFAULT_CONNECTION_POOL_MAXSIZE, 100 * HYDRATED_CACHES_COUNT
+        )
+
+    def test_settings_are_applied_to_an_initialized_host(self, local_server):
+        client = PiecesApiClient()
+        client.init_host(local_server, reconnect_on_host_change=False)
+        rest_client = client.api_client.rest_client
+
+        client.apply_connection_settings()  # Nothing changed
+        assert client.api_client.rest_client is rest_client
+
+        client.connection_pool_block = True
+        client.request_timeout = 3
+        client.tcp_keepalive = False
+        client.apply_connection_settings()
+        configuration = client.api_client.configuration
+        assert configuration.connection_pool_block is True
+        assert configuration.socket_options is None
+        assert client.api_client.rest_client is not rest_client
+        assert client.api_client.rest_client.default_request_timeout == 3
+        assert client.well_known_api.get_well_known_version() == "12.0.0"
+
+    def test_keepalive_can_be_disabled(self, local_server):
+        client = PiecesApiClient()
+        client.tcp_keepalive = False
+        client.init_host(local_server, reconnect_on_host_change=False)
+        assert client.api_client.configuration.socket_options is None
+
+    def test_pool_stats(self, local_server):
+        client = PiecesApiClient()
+        assert client.connection_pool_stats() == {
+            "requests": 0,
+            "hits": 0,
+            "misses": 0,
+        }
+        client.init_host(local_server, reconnect_on_host_change=False)
+        for _ in range(3):
+            assert client.well_known_api.get_well_known_version() == "12.0.0"
+        assert client.connection_pool_stats() == {
+            "requests": 3,
+            "hits": 2,
+            "misses": 1,
+        }
@@ -0,0 +1,175 @@
+"""
+Test suite for loading the messages of a chat.
+
+Tests that BasicChat.messages fetches every message of a conversation in a
+single request, falls back to a parallel fetch and loads the content of
+lazy messages on access.
+"""
+
+import time
+from unittest.mock import Mock, patch
+
+import pytest
+
+from pieces._vendor.pieces_os_client.models.conversation import Conversation
+from pieces._vendor.pieces_os_client.models.conversation_message import (
+    ConversationMessage,
+)
+from pieces._vendor.pieces_os_client.models.conversation_messages import (
+    ConversationMessages,
+)
+from pieces._vendor.pieces_os_client.wrapper.basic_identifier.chat import BasicChat
+from pieces._vendor.pieces_os_client.wrapper.streamed_identifiers import (
+    ConversationsSnapshot,
+)
+
+TIMESTAMP = {"value": "2024-01-01T10:00:00.000Z"}
+LATENCY = 0.005  # Simulated PiecesOS round-trip
+
+
+def _message(index: int, content: bool = True) -> ConversationMessage:
+    data = {
+        "id": f"message-{index}",
+        "conversation": {"id": "conversation-id"},
+        "created": TIMESTAMP,
+        "updated": TIMESTAMP,
+        "role": "USER" if index % 2 == 0 else "ASSISTANT",
+    }
+    if content:
+        data["fragment"] = {"string": {"raw": f"content {index}"}}
+    return ConversationMessage.from_dict(data)
+
+
+def _pieces_client(count: int):
+    """A PiecesClient mock with a conversation of `count` messages."""
+
+    def bulk(conversation, transferables=None):
+        time.sleep(LATENCY)
+        return ConversationMessages(
+            iterable=[_message(i, content=transferables) for i in range(count)]
+        )
+
+    def single(message, transferables=None):
+        time.sleep(LATENCY)
+        return _message(int(message.split("-")[1]), content=transferables)
+
+    client = Mock()
+    client.conversation_api.conversation_specific_conversation_messages.side_effect = bulk
+    client.conversation_message_api.message_specific_message_snapshot.side_effect = (
+        single
+    )
+    return client
+
+
+@pytest.fixture
+def chat_factory():
+    patches = []
+
+    def create(count: int):
+        client = _pieces_client(count)
+        # Indices are not in message order, and one message was deleted (-1)
+        indices = {f"message-{i}": i for i in reversed(range(count))}
+        indices["message-deleted"] = -1
+        conversation = Conversation.from_dict(
+            {
+                "id": "conversation-id",
+                "created": TIMESTAMP,
+                "updated": TIMESTAMP,
+                "type": "COPILOT",
+                "messages": {
+                    "iterable": [{"id": id} for id in indices],
+                    "indices": indices,
+                },
+            }
+        )
+        for p in (
+            patch.object(ConversationsSnapshot, "pieces_client", client),
+            patch.object(
+                ConversationsSnapshot,
+                "identifiers_snapshot",
+                {"conversation-id": conversation},
+            ),
+        ):
+            p.start()
+            patches.append(p)
+        return BasicChat("conversation-id"), client
+
+    yield create
+    for p in patches:
+        p.stop()
+
+
+class TestChatMessages:
+    """Test BasicChat.messages."""
+
+    def test_single_request(self, chat_factory):
+        chat, client = chat_factory(300)
+        messages = chat.messages()
+
+        assert [m.id for m in messages] == [f"message-{i}" for i in range(300)]
+        assert messages[1].raw_content == "content 1"
+        assert messages[1].role == "ASSISTANT"
+        client.conversation_api.conversation_specific_conversation_messages.assert_called_once_with(
+            "conversation-id", transferables=True
+        )
+        client.conversation_message_api.message_specific_message_snapshot.assert_not_called()
+
+    def test_lazy_content(self, chat_factory):
+        chat, client = chat_factory(10)
+        messages = chat.messages(lazy=True)
+        single = client.conversation_message_api.message_specific_message_snapshot
+
+        client.conversation_api.conversation_specific_conversation_messages.assert_called_once_with(
+            "conversation-id", transferables=False
+        )
+        assert messages[3].role == "ASSISTANT"
+        single.assert_not_called()
+
+        assert messages[3].raw_content == "content 3"
+        assert messages[3].raw_content == "content 3"
+        single.assert_called_once_with(message="message-3", transferables=True)
+
+    def test_parallel_fallback(self, chat_factory):
+        chat, client = chat_factory(50)
+        client.conversation_api.conversation_specific_conversation_messages.side_effect = (
+            Exception("Not supported")
+        )
+        single = client.conversation_message_api.message_specific_message_snapshot
+
+        messages = chat.messages()
+
+        assert [m.raw_content for m in messages] == [f"content {i}" for i in range(50)]
+        assert single.call_count == 50
+
+    def test_missing_messages_are_fetched_on_access(self, chat_factory):
+        chat, client = chat_factory(5)
+        client.conversation_api.conversation_specific_conversation_messages.side_effect = (
+            lambda conversation, transferables=None: ConversationMessages(
+                iterable=[_message(0)]
+            )
+        )
+        messages = chat.messages()
+        assert messages[4].raw_content == "content 4"
+        client.conversation_message_api.message_specific_message_snapshot.assert_called_once()
+
+    def test_benchmark(self, chat_factory):
+        """Opening a 300 message chat no longer costs one round-trip per message."""
+        chat, _ = chat_factory(300)
+        start = time.perf_counter()
+        messages = chat.messages()
+        bulk = time.perf_counter() - start
+
+        start = time.perf_counter()
+        sequential = [
+            ConversationsSnapshot.pieces_client.conversation_message_api.message_specific_message_snapshot(
+                message=m.id, transferables=True
+            )
+            for m in messages
+        ]
+        per_message = time.perf_counter() - start
+
+        print(
+            f"300 messages: bulk {bulk * 1e3:.0f}ms, one request per message {per_message * 1e3:.0f}ms"
+        )
+        assert len(sequential) == 300
+        assert bulk < per_message / 5
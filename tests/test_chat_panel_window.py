@@ -0,0 +1,100 @@
+"""
+Test suite for the windowed message loading of the TUI chat panel.
+
+Tests that only the last page of a long conversation is mounted when it is
+opened, that older pages are mounted on scroll up, and that the number of
+mounted message widgets stays bounded.
+"""
+
+from unittest.mock import Mock, patch
+
+import pytest
+from textual.app import App
+
+from pieces.settings import Settings
+from pieces.tui.widgets.chat_panel import ChatViewPanel
+
+
+class _Message:
+    """Stand-in for a lazily loaded BasicMessage."""
+
+    message = None
+
+    def __init__(self, index: int):
+        self.id = f"message-{index}"
+        self.role = "USER" if index % 2 else "ASSISTANT"
+        self.raw_content = f"message {index}"
+
+
+class _ChatApp(App):
+    def compose(self):
+        yield ChatViewPanel()
+
+
+def _chat(count: int):
+    chat = Mock()
+    chat.id = "chat-id"
+    chat.name = "Long chat"
+    chat.messages = Mock(return_value=[_Message(i) for i in range(count)])
+    return chat
+
+
+async def _wait_for(pilot, condition, attempts=200):
+    for _ in range(attempts):
+        if condition():
+            return True
+        await pilot.pause(0.02)
+    return False
+
+
+@pytest.fixture(autouse=True)
+def mock_logger():
+    with patch.object(Settings, "logger", Mock()):
+        yield
+
+
+@pytest.fixture(autouse=True)
+def hydration_workers(monkeypatch):
+    """Hydrate the messages with 8 workers, restored after the test."""
+    monkeypatch.setattr(Settings.pieces_client, "max_hydration_workers", 8)
+
+
+class TestChatPanelWindow:
+    """Test the paging and recycling of ChatViewPanel"""
+
+    @pytest.mark.asyncio
+    async def test_only_last_page_is_mounted(self):
+        app = _ChatApp()
+        async with app.run_test(size=(100, 40)) as pilot:
+            panel = app.query_one(ChatViewPanel)
+            panel.load_conversation(_chat(500))
+            assert await _wait_for(pilot, lambda: panel.messages)
+
+            assert len(panel.messages) == ChatViewPanel.PAGE_SIZE
+            assert (panel._window_start, panel._window_end) == (470, 500)
+            assert panel.messages[-1].message_id == "message-499"
+            assert panel.get_message_count() == 500
+
+    @pytest.mark.asyncio
+    async def test_scrolling_up_loads_older_pages_and_recycles(self):
+        app = _ChatApp()
+        async with app.run_test(size=(100, 40)) as pilot:
+            panel = app.query_one(ChatViewPanel)
+            panel.load_conversation(_chat(500))
+            assert await _wait_for(pilot, lambda: panel.messages)
+
+            def scrolled_to(start):
+                panel.scroll_to(y=0, animate=False)
+                return panel._window_start <= start
+
+            assert await _wait_for(pilot, lambda: scrolled_to(380))
+            assert len(panel.messages) <= ChatViewPanel.MAX_MOUNTED_MESSAGES
+            assert panel._window_end - panel._window_start == len(panel.messages)
+            assert panel.messages[0].message_id == f"message-{panel._window_start}"
+            assert panel.get_message_count() == 500
+
+            # New messages show the latest page again
+            panel._add_message_from_basic(_Message(500))
+            assert panel._window_end == 500
+            assert panel.messages[-2].message_id == "message-499"
+            assert panel.messages[-1].message_id == "message-500"
@@ -0,0 +1,144 @@
+"""
+Test suite for the lazy command registry.
+
+Tests that the command metadata matches the command classes, that a lazily
+set up parser registers only the command being run with its arguments, and
+profiles the imports of `pieces --version`, `pieces completion bash` and
+`pieces list` with `python -X importtime` against the import of every command.
+"""
+
+import re
+import subprocess
+import sys
+
+import pytest
+
+from pieces.base_command import BaseCommand
+from pieces.command_registry import COMMAND_SPECS, CommandRegistry
+from pieces.pieces_argparser import PiecesArgparser
+
+# Commands whose imports are profiled
+PROFILED_COMMANDS = ["--version", "completion bash", "list"]
+# A lazy command must import in less than this share of the eager import time
+LAZY_IMPORT_RATIO = 0.75
+# Modules no profiled command needs
+HEAVY_MODULES = [
+    "pieces.mcp",
+    "mcp.server",
+    "pieces.copilot",
+    "pieces.tui",
+    "textual",
+    "sentry_sdk",
+]
+
+IMPORT_SCRIPT = """
+import sys
+sys.argv = ["pieces", *sys.argv[1:]]
+from pieces.app import PiecesCLI
+cli = PiecesCLI(lazy={lazy})
+cli.parser.parse_args(sys.argv[1:])
+"""
+IMPORT_LINE = re.compile(r"^import time:\s+\d+ \|\s+(\d+) \|( *)(\S+)$")
+
+
+def _import_profile(args: str, lazy: bool = True):
+    """Run the CLI parser setup for args, returns (total ms, imported modules)."""
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", IMPORT_SCRIPT.format(lazy=lazy)]
+        + args.split(),
+        capture_output=True,
+        text=True,
+        timeout=60,
+    )
+    assert process.returncode == 0, process.stderr[-2000:]
+    total = 0
+    modules = set()
+    for line in process.stderr.splitlines():
+        match = IMPORT_LINE.match(line)
+        if not match:
+            continue
+        cumulative, indent, module = match.groups()
+        modules.add(module)
+        if len(indent) == 1:  # Top level import
+            total += int(cumulative)
+    return total / 1000, modules
+
+
+def _lazy_parser(argv):
+    parser = PiecesArgparser(description="test")
+    CommandRegistry(parser).setup_parser(parser, "1.0.0", argv)
+    return parser
+
+
+def _command_parser(parser, name):
+    return parser._subparsers._group_actions[0].choices[name]
+
+
+class TestCommandSpecs:
+    """The metadata must match the commands it stands for"""
+
+    def test_specs_match_commands(self):
+        _lazy_parser(None)  # Imports every command
+        commands = {command.name: command for command in BaseCommand.commands}
+        assert {spec.name for spec in COMMAND_SPECS} <= set(commands)
+        for spec in COMMAND_SPECS:
+            command = commands[spec.name]
+            assert spec.help == command.help
+            assert list(spec.aliases) == command.aliases
+            module = f"pieces.command_interface.{spec.module}"
+            assert type(command).__module__ == module
+
+    def test_find_spec(self):
+        spec = CommandRegistry.find_spec(["--headless", "list", "models"])
+        assert spec.name == "list"
+        assert CommandRegistry.find_spec(["drive"]).name == "list"
+        assert CommandRegistry.find_spec(["--version"]) is None
+        assert CommandRegistry.find_spec(["lsit"]) is None
+
+
+class TestLazyParser:
+    """A lazy parser only registers the arguments of the command being run"""
+
+    def test_only_the_command_run_has_arguments(self):
+        parser = _lazy_parser(["search", "--mode", "all", "query"])
+        args = parser.parse_args(["search", "--mode", "all", "query"])
+        assert args.search_type == "all"
+        assert args.func.__self__.name == "search"
+        # The other commands are listed without their arguments
+        assert _command_parser(parser, "list").command is None
+        assert _command_parser(parser, "drive") is _command_parser(parser, "list")
+
+    def test_every_command_is_listed(self):
+        parser = _lazy_parser(["--version"])
+        names = set(parser._subparsers._group_actions[0].choices)
+        for spec in COMMAND_SPECS:
+            assert {spec.name, *spec.aliases} <= names
+        assert parser.parse_args(["--version"]).version
+
+    def test_run_registers_every_command(self):
+        parser = _lazy_parser(["run"])
+        assert _command_parser(parser, "list").command is not None
+
+
+@pytest.fixture(scope="module")
+def eager_ms():
+    total, _ = _import_profile("--version", lazy=False)
+    return total
+
+
+class TestImportTime:
+    """Profile the imports of the CLI startup"""
+
+    @pytest.mark.parametrize("args", PROFILED_COMMANDS)
+    def test_lazy_imports(self, args, eager_ms):
+        total, modules = _import_profile(args)
+        assert total < eager_ms * LAZY_IMPORT_RATIO
+        assert not [
+            module
+            for module in modules
+            for heavy in HEAVY_MODULES
+            if module == heavy or module.startswith(heavy + ".")
+        ]
+        if args != "list":
+            assert "pieces.core.list_command" not in modules
+            assert "prompt_toolkit" not in modules
@@ -0,0 +1,117 @@
+"""
+Test suite for the chunk coalescing of CopilotController.
+
+Replays recorded QGPTStreamOutput frames through the controller and checks
+that the streamed chunks are batched into few COPILOT_STREAM_CHUNK events,
+whose deltas add up to the whole answer, all emitted before completion.
+"""
+
+import time
+from unittest.mock import Mock, patch
+
+import pytest
+
+from pieces._vendor.pieces_os_client.models.qgpt_stream_output import QGPTStreamOutput
+from pieces.settings import Settings
+from pieces.tui.controllers.base_controller import EventType
+from pieces.tui.controllers.copilot_controller import CopilotController
+
+
+def _frame(status: str, text: str = "") -> QGPTStreamOutput:
+    answers = [{"score": 1, "text": text}] if text else []
+    return QGPTStreamOutput.from_dict(
+        {
+            "conversation": "conversation-id",
+            "request": "request-id",
+            "status": status,
+            "question": {"answers": {"iterable": answers}},
+        }
+    )
+
+
+@pytest.fixture
+def events():
+    """Record the events emitted by a controller, in order."""
+    recorded = []
+    with (
+        patch.object(Settings, "logger", Mock()),
+        patch.object(Settings, "pieces_client", Mock()),
+        patch("pieces.tui.controllers.copilot_controller.BasicChat"),
+    ):
+        yield recorded
+
+
+def _controller(events, interval):
+    controller = CopilotController(coalesce_interval=interval)
+    for event_type in (
+        EventType.COPILOT_STREAM_STARTED,
+        EventType.COPILOT_STREAM_CHUNK,
+        EventType.COPILOT_STREAM_COMPLETED,
+        EventType.COPILOT_STREAM_ERROR,
+    ):
+        controller.on(
+            event_type,
+            lambda data, event_type=event_type: events.append((event_type, data)),
+        )
+    return controller
+
+
+def _stream(controller, tokens, delay=0.0, final_status="COMPLETED"):
+    controller._on_stream_message(_frame("INITIALIZED"))
+    for token in tokens:
+        controller._on_stream_message(_frame("IN-PROGRESS", token))
+        if delay:
+            time.sleep(delay)
+    controller._on_stream_message(_frame(final_status))
+
+
+def _chunks(events):
+    return [
+        data
+        for event_type, data in events
+        if event_type == EventType.COPILOT_STREAM_CHUNK
+    ]
+
+
+class TestCopilotStreamCoalescing:
+    """Test the batching of COPILOT_STREAM_CHUNK events"""
+
+    def test_chunks_are_batched(self, events):
+        tokens = [f"token{i} " for i in range(400)]
+        controller = _controller(events, interval=0.03)
+        _stream(controller, tokens, delay=0.0005)
+
+        chunks = _chunks(events)
+        print(f"{len(tokens)} tokens streamed in {len(chunks)} chunk events")
+        assert len(chunks) < len(tokens) / 5
+        assert events[0] == (EventType.COPILOT_STREAM_STARTED, tokens[0])
+        streamed = tokens[0] + "".join(chunk["text"] for chunk in chunks)
+        assert streamed == "".join(tokens)
+        assert all(chunk.keys() == {"text"} for chunk in chunks)  # Only deltas
+        assert events[-1] == (EventType.COPILOT_STREAM_COMPLETED, "".join(tokens))
+
+    def test_zero_interval_emits_every_chunk(self, events):
+        tokens = ["a", "b", "c"]
+        controller = _controller(events, interval=0)
+        _stream(controller, tokens)
+        assert [chunk["text"] for chunk in _chunks(events)] == ["b", "c"]
+
+    def test_pending_chunk_is_flushed_before_error(self, events):
+        controller = _controller(events, interval=60)
+        _stream(controller, ["Hello", " world"], final_status="FAILED")
+
+        assert _chunks(events) == [{"text": " world"}]
+        event_type, data = events[-1]
+        assert event_type == EventType.COPILOT_STREAM_ERROR
+        assert data["partial_response"] == "Hello world"
+
+    def test_timer_flushes_idle_stream(self, events):
+        """Chunks are emitted after the interval even if no other frame arrives"""
+        controller = _controller(events, interval=0.02)
+        controller._on_stream_message(_frame("IN-PROGRESS", "Hello"))
+        controller._on_stream_message(_frame("IN-PROGRESS", " world"))
+        deadline = time.monotonic() + 2
+        while not _chunks(events) and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert _chunks(events) == [{"text": " world"}]
+        controller.cleanup()
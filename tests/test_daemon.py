@@ -0,0 +1,233 @@
+"""
+Test suite for the pieces daemon.
+
+Tests which commands are forwarded, that a forwarded command streams its
+output and exit code back to the client, and that the client falls back to
+running the command locally whenever the daemon cannot run it. Also tests
+that a running daemon keeps its socket and how it is spawned.
+"""
+
+import errno
+import io
+import os
+import socket
+import stat
+import sys
+import threading
+from types import SimpleNamespace
+from unittest.mock import Mock, patch
+
+import pytest
+
+from pieces.app import PiecesCLI
+from pieces.command_interface.daemon_command_group import DaemonStartCommand
+from pieces.daemon import is_supported, should_forward
+from pieces.daemon.client import forward, request
+from pieces.daemon.server import PiecesDaemon
+from pieces.settings import Settings
+
+pytestmark = pytest.mark.skipif(
+    not is_supported(), reason="Unix domain sockets are not available"
+)
+
+
+@pytest.fixture
+def daemon(tmp_path):
+    PiecesCLI()
+    daemon = PiecesDaemon(str(tmp_path / "daemon.sock"))
+    daemon.bind()
+    thread = threading.Thread(target=daemon.serve, daemon=True)
+    thread.start()
+    with patch.object(PiecesDaemon, "reload_config"):
+        yield daemon
+    daemon.stop()
+    thread.join(timeout=1)
+
+
+def _forward(daemon, argv):
+    stdout, stderr = io.StringIO(), io.StringIO()
+    code = forward(argv, daemon.socket_path, stdout=stdout, stderr=stderr)
+    return code, stdout.getvalue(), stderr.getvalue()
+
+
+class TestShouldForward:
+    """Test which commands are run by the daemon"""
+
+    def test_forwarded(self):
+        assert should_forward(["chats"])
+        assert should_forward(["--ignore-onboarding", "chats"])
+        assert should_forward(["list", "--headless"])
+        assert should_forward(["--headless", "search", "query"])
+
+    def test_not_forwarded(self):
+        assert not should_forward([])
+        assert not should_forward(["ask", "question"])
+        assert not should_forward(["daemon", "start"])
+        # Interactive menus need the terminal of the client
+        assert not should_forward(["list"])
+        assert not should_forward(["search", "query"])
+
+    def test_no_daemon(self, tmp_path):
+        assert forward(["chats"], str(tmp_path / "daemon.sock")) is None
+        assert request({"control": "ping"}, str(tmp_path / "daemon.sock")) is None
+
+
+class TestForward:
+    """Test running commands in the daemon"""
+
+    def test_output_and_exit_code(self, daemon):
+        def get_conversations(**kwargs):
+            print("1: First chat")
+            print("2: Second chat")
+
+        with patch(
+            "pieces.command_interface.conversation_commands.get_conversations",
+            side_effect=get_conversations,
+        ):
+            _forward(daemon, ["chats"])  # Warm up the parser
+            code, stdout, _ = _forward(daemon, ["chats"])
+
+        assert code == 0
+        assert stdout == "1: First chat\n2: Second chat\n"
+        assert daemon.commands_run == 2
+        # The config files can change between commands
+        assert PiecesDaemon.reload_config.call_count == 2
+
+    def test_error(self, daemon):
+        with patch(
+            "pieces.command_interface.conversation_commands.get_conversations",
+            side_effect=RuntimeError("Boom"),
+        ):
+            code, stdout, stderr = _forward(daemon, ["chats"])
+
+        assert code == 2
+        assert stdout == ""
+        assert stderr
+
+    def test_working_directory(self, daemon, tmp_path):
+        def get_conversations(**kwargs):
+            print(os.getcwd())
+
+        cwd = os.getcwd()
+        os.chdir(tmp_path)
+        try:
+            with patch(
+                "pieces.command_interface.conversation_commands.get_conversations",
+                side_effect=get_conversations,
+            ):
+                _, stdout, _ = _forward(daemon, ["chats"])
+        finally:
+            os.chdir(cwd)
+
+        assert stdout.strip() == str(tmp_path)
+        assert os.getcwd() == cwd
+
+    def test_background_threads_do_not_print_to_the_client(self, daemon, capsys):
+        def get_conversations(**kwargs):
+            thread = threading.Thread(target=print, args=("Hydrating",))
+            thread.start()
+            thread.join()
+            print("1: First chat")
+
+        with patch(
+            "pieces.command_interface.conversation_commands.get_conversations",
+            side_effect=get_conversations,
+        ):
+            _, stdout, _ = _forward(daemon, ["chats"])
+
+        assert stdout == "1: First chat\n"
+        assert capsys.readouterr().out == "Hydrating\n"
+
+    def test_fallback_on_another_version(self, daemon):
+        with patch("pieces.daemon.client.__version__", "0.0.0"):
+            assert _forward(daemon, ["chats"]) == (None, "", "")
+        assert daemon.commands_run == 0
+
+    def test_fallback_when_pieces_os_is_not_running(self, daemon):
+        Settings.pieces_client.is_pieces_running.return_value = False
+        assert _forward(daemon, ["chats"]) == (None, "", "")
+        assert daemon.commands_run == 0
+
+    def test_fallback_when_not_forwardable(self, daemon):
+        with patch("pieces.daemon.client.should_forward", return_value=True):
+            assert _forward(daemon, ["ask", "question"]) == (None, "", "")
+
+
+class TestControl:
+    """Test the control messages"""
+
+    def test_ping(self, daemon):
+        status = request({"control": "ping"}, daemon.socket_path)
+        assert status["pid"] == os.getpid()
+        assert status["commands_run"] == 0
+
+    def test_stop(self, daemon):
+        assert request({"control": "stop"}, daemon.socket_path) == {"stopped": True}
+        assert not os.path.exists(daemon.socket_path)
+        assert request({"control": "ping"}, daemon.socket_path) is None
+
+
+class TestReloadConfig:
+    """Test applying the config files before a command"""
+
+    def test_reload_config(self):
+        managers = [Mock() for _ in range(4)]
+        managers[1].model = SimpleNamespace(name="Claude")
+        with (
+            patch.object(Settings, "cli_config", managers[0]),
+            patch.object(Settings, "model_config", managers[1]),
+            patch.object(Settings, "mcp_config", managers[2]),
+            patch.object(Settings, "user_config", managers[3]),
+            patch.object(Settings, "configure_client") as configure_client,
+        ):
+            PiecesDaemon.reload_config()
+
+        for manager in managers:
+            manager.reload.assert_called_once()
+        configure_client.assert_called_once()
+        assert Settings.pieces_client.model_name == "Claude"
+
+
+class TestBind:
+    """Test taking over the socket"""
+
+    def test_running_daemon_keeps_its_socket(self, daemon):
+        with pytest.raises(OSError) as error:
+            PiecesDaemon(daemon.socket_path).bind()
+        assert error.value.errno == errno.EADDRINUSE
+        assert request({"control": "ping"}, daemon.socket_path)
+
+    def test_socket_of_a_stopped_daemon_is_replaced(self, tmp_path):
+        path = str(tmp_path / "daemon.sock")
+        stale = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        stale.bind(path)
+        stale.close()  # The file is left behind
+
+        daemon = PiecesDaemon(path)
+        daemon.bind()
+        try:
+            assert stat.S_IMODE(os.stat(path).st_mode) == 0o600
+        finally:
+            daemon.stop()
+
+
+class TestSpawn:
+    """Test the command started by `pieces daemon start`"""
+
+    def test_python(self):
+        with patch.object(DaemonStartCommand, "_is_frozen", return_value=False):
+            argv = DaemonStartCommand()._daemon_argv()
+        assert argv == [
+            sys.executable,
+            "-m",
+            "pieces",
+            "daemon",
+            "start",
+            "--foreground",
+        ]
+
+    def test_pyinstaller_bundle(self):
+        # The bundled binary cannot run modules with -m
+        with patch.object(DaemonStartCommand, "_is_frozen", return_value=True):
+            argv = DaemonStartCommand()._daemon_argv()
+        assert argv == [sys.executable, "daemon", "start", "--foreground"]
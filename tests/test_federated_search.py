@@ -0,0 +1,143 @@
+"""
+Test suite for `pieces search --mode all`.
+
+Tests that the three search modes run concurrently, that their results are
+de-duplicated and ranked by reciprocal rank fusion, that a failing mode does
+not fail the search, and the headless JSON output.
+"""
+
+import json
+import threading
+import time
+from types import SimpleNamespace
+from unittest.mock import Mock, patch
+
+import pytest
+
+from pieces.core import search_command
+from pieces.core.list_command import ListCommand
+from pieces.headless.exceptions import HeadlessError
+from pieces.settings import Settings
+from pieces._vendor.pieces_os_client.wrapper.streamed_identifiers.assets_snapshot import (
+    AssetSnapshot,
+)
+
+MODE_LATENCY = 0.2  # Seconds per search request
+
+# Ranked identifiers returned by each mode, "a" is found by every mode
+MODE_RESULTS = {
+    "fuzzy": ["a", "b"],
+    "fts": ["c", "a"],
+    "ncs": ["a", "c", "d"],
+}
+
+
+def _searched(identifier, exact=False):
+    return SimpleNamespace(
+        identifier=identifier,
+        score=1.0,
+        exact=exact,
+        asset=SimpleNamespace(name=f"Name {identifier}"),
+    )
+
+
+class FakeSearch:
+    def __init__(self, failing=()):
+        self.failing = failing
+        self.running = 0
+        self.max_running = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, query, search_type):
+        with self._lock:
+            self.running += 1
+            self.max_running = max(self.max_running, self.running)
+        time.sleep(MODE_LATENCY)
+        with self._lock:
+            self.running -= 1
+        if search_type in self.failing:
+            raise ConnectionError(f"{search_type} is down")
+        return [_searched(id, exact=id == "d") for id in MODE_RESULTS[search_type]]
+
+
+@pytest.fixture
+def fake_search():
+    fake = FakeSearch()
+    with (
+        patch.object(Settings, "logger", Mock()),
+        patch.object(AssetSnapshot, "search_index", None),
+        patch.object(search_command.BasicAsset, "search_results", side_effect=fake),
+    ):
+        yield fake
+
+
+class TestFederatedSearch:
+    """Test search_command.federated_search"""
+
+    def test_modes_run_concurrently(self, fake_search):
+        start = time.perf_counter()
+        results, local = search_command.search_assets("query", "all")
+        elapsed = time.perf_counter() - start
+
+        print(f"3 modes searched in {elapsed * 1e3:.0f}ms")
+        assert fake_search.max_running == 3
+        assert elapsed < 2 * MODE_LATENCY
+        assert not local
+
+    def test_results_are_fused(self, fake_search):
+        results, _ = search_command.search_assets("query", "all")
+
+        # Exact matches first, then materials found by more modes and ranked higher
+        assert [result.identifier for result in results] == ["d", "a", "c", "b"]
+        assert len({result.identifier for result in results}) == len(results)
+        a = results[1]
+        assert a.modes == ["fuzzy", "fts", "ncs"]
+        assert a.name == "Name a"
+        assert a.score == 1.0
+        assert all(0 < result.score <= 1 for result in results)
+        assert results[0].exact
+
+    def test_limit(self, fake_search):
+        results, _ = search_command.search_assets("query", "all", limit=2)
+        assert [result.identifier for result in results] == ["d", "a"]
+
+    def test_failing_mode_is_skipped(self, fake_search):
+        fake_search.failing = ("ncs",)
+        results, _ = search_command.search_assets("query", "all")
+        assert [result.identifier for result in results] == ["a", "c", "b"]
+
+    def test_all_modes_failing(self, fake_search):
+        fake_search.failing = tuple(MODE_RESULTS)
+        with pytest.raises(ConnectionError):
+            search_command.search_assets("query", "all")
+
+
+class TestHeadlessSearch:
+    """Test search_command.search_headless"""
+
+    def test_json_output(self, fake_search):
+        with patch.object(
+            ListCommand,
+            "_iter_asset_names",
+            return_value=iter([[("d", "Name d"), ("a", "Name a"), ("c", "Name c")]]),
+        ):
+            response = search_command.search_headless(["query"], search_type="all")
+
+        data = json.loads(response.to_json())
+        assert data["success"] is True
+        assert data["command"] == "search"
+        assert data["data"]["mode"] == "all"
+        assert data["data"]["query"] == "query"
+        # "b" was deleted meanwhile
+        assert data["data"]["count"] == 3
+        assert data["data"]["results"][1] == {
+            "id": "a",
+            "name": "Name a",
+            "score": 1.0,
+            "exact": False,
+            "modes": ["fuzzy", "fts", "ncs"],
+        }
+
+    def test_invalid_limit(self, fake_search):
+        with pytest.raises(HeadlessError):
+            search_command.search_headless(["query"], limit=0)
@@ -0,0 +1,127 @@
+"""
+Test suite for the name prefetching of `pieces list`.
+
+Tests that ListCommand streams the material names into the select menu in
+order and in batches, the first page before the bulk snapshot returns, and
+benchmarks listing 2,000 materials against a simulated PiecesOS latency.
+"""
+
+import threading
+import time
+from types import SimpleNamespace
+from unittest.mock import Mock, patch
+
+import pytest
+
+from pieces.core.list_command import ListCommand
+from pieces.settings import Settings
+from pieces._vendor.pieces_os_client.wrapper.streamed_identifiers.assets_snapshot import (
+    AssetSnapshot,
+)
+
+REQUEST_LATENCY = 0.01  # Seconds per single asset request
+SNAPSHOT_LATENCY = 0.2  # Seconds for the snapshot of every asset
+
+
+class FakeAssetsApi:
+    def __init__(self, count: int):
+        self.assets = {
+            f"asset-{i}": SimpleNamespace(id=f"asset-{i}", name=f"Material {i}")
+            for i in range(count)
+        }
+        self.single_calls = 0
+        self.snapshot_calls = 0
+        self.snapshot_done = threading.Event()
+
+    def assets_specific_asset_snapshot(self, asset, transferables=None):
+        assert transferables is False
+        self.single_calls += 1
+        time.sleep(REQUEST_LATENCY)
+        if asset not in self.assets:
+            raise Exception("Not found")
+        return self.assets[asset]
+
+    def assets_snapshot(self, transferables=None):
+        assert transferables is False
+        self.snapshot_calls += 1
+        time.sleep(SNAPSHOT_LATENCY)
+        self.snapshot_done.set()
+        return SimpleNamespace(iterable=list(self.assets.values()))
+
+
+@pytest.fixture
+def assets_api():
+    api = FakeAssetsApi(2000)
+    client = Mock(assets_api=api, max_hydration_workers=4)
+    with (
+        patch.object(Settings, "pieces_client", client),
+        patch.object(Settings, "logger", Mock()),
+        patch.object(AssetSnapshot, "identifiers_snapshot", {}),
+    ):
+        yield api
+
+
+class TestListPrefetch:
+    """Test ListCommand._iter_asset_names"""
+
+    def test_names_are_streamed_in_order(self, assets_api):
+        ids = list(assets_api.assets)
+        start = time.perf_counter()
+        batches = []
+        first_page_time = None
+        for batch in ListCommand._iter_asset_names(ids):
+            if first_page_time is None:
+                first_page_time = time.perf_counter() - start
+                # The first screen does not wait for the snapshot of every asset
+                assert not assets_api.snapshot_done.is_set()
+            batches.append(batch)
+        total = time.perf_counter() - start
+
+        print(
+            f"{len(ids)} materials: first page {first_page_time * 1e3:.0f}ms,"
+            f" all {total * 1e3:.0f}ms in {len(batches)} batches"
+        )
+        names = [name for batch in batches for _, name in batch]
+        assert names == [f"Material {i}" for i in range(2000)]
+        assert len(batches[0]) == ListCommand.FIRST_PAGE_SIZE
+        assert all(len(batch) <= ListCommand.BATCH_SIZE for batch in batches)
+        assert assets_api.snapshot_calls == 1
+        assert assets_api.single_calls == ListCommand.FIRST_PAGE_SIZE
+        # Fetching them one by one would take 2000 * REQUEST_LATENCY
+        assert total < 2000 * REQUEST_LATENCY / 4
+
+    def test_cached_assets_are_not_fetched(self, assets_api):
+        ids = list(assets_api.assets)[:10]
+        AssetSnapshot.identifiers_snapshot.update(
+            {id: assets_api.assets[id] for id in ids}
+        )
+        batches = ListCommand._iter_asset_names(ids)
+        names = [name for batch in batches for _, name in batch]
+        assert names == [f"Material {i}" for i in range(10)]
+        assert (assets_api.single_calls, assets_api.snapshot_calls) == (0, 0)
+
+    def test_missing_assets_are_skipped(self, assets_api):
+        ids = ["asset-0", "deleted", "asset-1"]
+        batches = list(ListCommand._iter_asset_names(ids))
+        assert batches == [[("asset-0", "Material 0"), ("asset-1", "Material 1")]]
+
+    def test_list_assets_fills_menu_in_batches(self, assets_api):
+        assets = [Mock(_id=id) for id in assets_api.assets]
+        entries = []
+        done = threading.Event()
+
+        def add_entries(batch):
+            entries.extend(batch)
+            if len(entries) == len(assets):
+                done.set()
+
+        menu = Mock()
+        menu.add_entries.side_effect = add_entries
+        with patch("pieces.utils.PiecesSelectMenu", return_value=menu):
+            ListCommand.list_assets(assets=assets)
+            assert done.wait(5)
+
+        assert entries[0][0] == "1: Material 0"
+        assert entries[-1][0] == "2000: Material 1999"
+        assert entries[-1][1]["asset_id"] == "asset-1999"
+        assert menu.add_entries.call_count < 20
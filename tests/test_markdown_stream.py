@@ -0,0 +1,191 @@
+"""
+Test suite for the streamed markdown rendering of `pieces ask`.
+
+Tests that MarkdownStream splits the answer into blocks the same way a full
+render would show it, and replays recorded QGPTStreamOutput frames through
+AskStream to check the cost per token stays flat on long answers.
+"""
+
+import io
+import re
+import time
+from unittest.mock import patch
+
+import pytest
+from rich.console import Console
+from rich.live import Live
+from rich.markdown import Markdown
+
+from pieces._vendor.pieces_os_client.models.qgpt_stream_output import QGPTStreamOutput
+from pieces.copilot.ask_command import AskStream
+from pieces.copilot.markdown_stream import MarkdownStream
+
+SECTION = """## Step {i}
+
+Some explanation about the **step {i}** with `inline code` and a [link](https://pieces.app).
+It continues on a second line of the same paragraph.
+
+- first item
+- second item
+
+  with a continuation paragraph
+
+1. numbered
+2. list
+
+```python
+def step_{i}():
+
+    return {i}
+```
+
+"""
+
+
+def _answer(sections: int) -> str:
+    return "".join(SECTION.format(i=i) for i in range(sections))
+
+
+def _tokens(text: str):
+    """Split the text in chunks shaped like the streamed LLM tokens."""
+    return re.findall(r"\s*\S+|\s+", text)
+
+
+def _frames(text: str):
+    """Recorded QGPTStreamOutput frames streaming the text, then completing."""
+    for token in _tokens(text):
+        yield QGPTStreamOutput.from_dict(
+            {
+                "conversation": "conversation-id",
+                "request": "request-id",
+                "status": "IN-PROGRESS",
+                "question": {"answers": {"iterable": [{"score": 1, "text": token}]}},
+            }
+        )
+    yield QGPTStreamOutput.from_dict(
+        {
+            "conversation": "conversation-id",
+            "request": "request-id",
+            "status": "COMPLETED",
+            "question": {"answers": {"iterable": []}},
+        }
+    )
+
+
+def _console(file=None) -> Console:
+    return Console(file=file or io.StringIO(), force_terminal=True, width=100)
+
+
+def _plain_lines(text: str):
+    text = re.sub(r"\x1b\[[0-9;?]*[A-Za-z]", "", text)  # Drop ANSI codes
+    return [line.rstrip() for line in text.splitlines() if line.strip()]
+
+
+class TestMarkdownStream:
+    """Test the block splitting of MarkdownStream."""
+
+    def _stream(self, text):
+        console = Console(file=io.StringIO(), width=100, record=True)
+        live = Live(console=console, auto_refresh=False)
+        stream = MarkdownStream(live)
+        live.start()
+        printed = []
+        with patch.object(
+            console, "print", side_effect=lambda *a, **k: printed.append(a)
+        ):
+            for token in _tokens(text):
+                stream.feed(token)
+        return stream, [a[0].markdown.markup for a in printed]
+
+    def test_blocks_are_finalized_once(self):
+        stream, blocks = self._stream("First paragraph\n\nSecond paragraph\n\nTail")
+        assert blocks == ["First paragraph", "Second paragraph"]
+        assert stream.tail == "Tail"
+
+    def test_code_fence_with_blank_lines_is_one_block(self):
+        text = "```python\na = 1\n\n\nb = 2\n```\n\nafter\n\nend"
+        _, blocks = self._stream(text)
+        assert blocks == ["```python\na = 1\n\n\nb = 2\n```", "after"]
+
+    def test_indented_continuation_stays_in_block(self):
+        text = "- item\n\n  continuation\n\nnext\n\n"
+        stream, blocks = self._stream(text)
+        assert blocks == ["- item\n\n  continuation"]
+        assert stream.tail == "next\n\n"
+
+    def test_output_matches_full_render(self):
+        """The streamed output is the same as rendering the whole answer at once."""
+        text = _answer(3) + "> a quote\n\n| a | b |\n|---|---|\n| 1 | 2 |\n"
+        full = Console(file=io.StringIO(), width=100)
+        full.print(Markdown(text))
+
+        streamed = Console(file=io.StringIO(), width=100)
+        live = Live(console=streamed, auto_refresh=False)
+        stream = MarkdownStream(live)
+        live.start()
+        for token in _tokens(text):
+            stream.feed(token)
+        stream.finish()
+
+        assert stream.finalized_blocks > 10
+        assert _plain_lines(streamed.file.getvalue()) == _plain_lines(
+            full.file.getvalue()
+        )
+
+
+class TestAskStreamReplay:
+    """Replay recorded frames through AskStream.on_message."""
+
+    def _replay(self, frames, console):
+        ask_stream = AskStream()
+        ask_stream.live = Live(
+            console=console, refresh_per_second=AskStream.REFRESH_PER_SECOND
+        )
+        ask_stream.markdown_stream = MarkdownStream(ask_stream.live)
+        ask_stream.live.start(refresh=True)
+        timings = []
+        with patch("pieces.copilot.ask_command.BasicChat"):
+            for frame in frames:
+                start = time.perf_counter()
+                ask_stream.on_message(frame)
+                timings.append(time.perf_counter() - start)
+        assert ask_stream.message_compeleted.is_set()
+        return ask_stream, timings
+
+    def test_replay_renders_whole_answer(self):
+        text = _answer(2)
+        ask_stream, _ = self._replay(_frames(text), _console())
+        assert "".join(ask_stream._answer_chunks) == text
+
+    @pytest.mark.parametrize("sections", [350])
+    def test_replay_benchmark(self, sections):
+        """Per token cost stays flat on 10k+ token answers."""
+        text = _answer(sections)
+        frames = list(_frames(text))
+        assert len(frames) > 10_000
+
+        _, timings = self._replay(frames, _console())
+        window = 1000
+        first = sum(timings[:window])
+        last = sum(timings[-window - 1 : -1])
+        total = sum(timings)
+
+        # The previous renderer re-parsed the whole answer on every token
+        full_render = _console()
+        sample = frames[:300]
+        answer = ""
+        start = time.perf_counter()
+        for frame in sample:
+            for chunk in frame.question.answers.iterable:
+                answer += chunk.text
+            full_render.print(Markdown(answer))
+        full_render_time = time.perf_counter() - start
+
+        print(
+            f"{len(frames)} frames: total {total * 1e3:.0f}ms,"
+            f" first {window} tokens {first * 1e3:.1f}ms,"
+            f" last {window} tokens {last * 1e3:.1f}ms;"
+            f" full re-render of the first {len(sample)} tokens {full_render_time * 1e3:.0f}ms"
+        )
+        assert last < max(first * 4, 0.05)
+        assert total / len(frames) < full_render_time / len(sample)
@@ -0,0 +1,171 @@
+"""
+Test suite for the PiecesOS discovery cache.
+
+Tests that the cached port is tried first with a single health check, that
+a stale cache falls back to the parallel port scan and is rewritten, and that
+the health check done while discovering is shared by is_pieces_running.
+Also tests that the PiecesOS id saved with the port is only reused for the
+same health response and version.
+"""
+
+import http.server
+import json
+import socket
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+
+from pieces._vendor.pieces_os_client.wrapper import client as client_module
+from pieces._vendor.pieces_os_client.wrapper.client import PiecesClient
+from pieces._vendor.pieces_os_client.wrapper.streamed_identifiers._streamed_identifiers import (
+    StreamedIdentifiersCache,
+)
+
+FINGERPRINT = "ok:pieces-os"
+
+
+class _HealthHandler(http.server.BaseHTTPRequestHandler):
+    requests = []
+
+    def do_GET(self):
+        self.requests.append(self.path)
+        body = FINGERPRINT.encode() if self.path == "/.well-known/health" else b"{}"
+        self.send_response(200)
+        self.send_header("content-length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+@pytest.fixture
+def pieces_os():
+    """A fake PiecesOS listening on one of the scanned ports."""
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), _HealthHandler)
+    threading.Thread(target=server.serve_forever, args=(0.05,), daemon=True).start()
+    _HealthHandler.requests = []
+    port = server.server_port
+    ports = [_free_port() for _ in range(5)] + [port]
+    with patch.object(client_module, "PORT_RANGE", ports):
+        yield str(port)
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def client(tmp_path):
+    with patch.object(StreamedIdentifiersCache, "pieces_client"):
+        client = PiecesClient(reconnect_on_host_change=False)
+    client.enable_discovery_cache(str(tmp_path / "discovery.json"))
+    return client
+
+
+def _cache(client):
+    with open(client._discovery_cache_path) as f:
+        return json.load(f)
+
+
+class TestDiscovery:
+    """Test PiecesClient port discovery"""
+
+    def test_scan_on_miss(self, client, pieces_os):
+        assert client.port == pieces_os
+        assert client.fingerprint == FINGERPRINT
+        assert _cache(client) == {"port": pieces_os, "fingerprint": FINGERPRINT}
+
+    def test_cached_port_is_tried_first(self, client, pieces_os):
+        with open(client._discovery_cache_path, "w") as f:
+            json.dump({"port": pieces_os, "fingerprint": FINGERPRINT}, f)
+        with patch.object(
+            PiecesClient, "_scan_ports", side_effect=AssertionError("scanned")
+        ):
+            start = time.perf_counter()
+            port = client.port
+            elapsed = time.perf_counter() - start
+
+        print(f"PiecesOS found on its cached port in {elapsed * 1e3:.2f}ms")
+        assert port == pieces_os
+        assert _HealthHandler.requests == ["/.well-known/health"]
+        assert elapsed < 0.05
+
+    def test_stale_cache_falls_back_to_scan(self, client, pieces_os):
+        stale = str(client_module.PORT_RANGE[0])
+        with open(client._discovery_cache_path, "w") as f:
+            json.dump({"port": stale, "fingerprint": FINGERPRINT}, f)
+
+        assert client.port == pieces_os
+        assert _cache(client)["port"] == pieces_os
+
+    def test_not_running(self, client, pieces_os):
+        with patch.object(client_module, "PORT_RANGE", client_module.PORT_RANGE[:-1]):
+            assert not client.is_pieces_running()
+        assert client._port == ""
+
+
+
+class TestOsId:
+    """Test saving the PiecesOS id with the discovered port"""
+
+    def test_reused_by_the_next_run(self, client, pieces_os, tmp_path):
+        assert client.port == pieces_os
+        assert client.known_os_id("12.0.0") is None
+        client.remember_os_id("os-id", "12.0.0")
+        assert _cache(client)["os_id"] == "os-id"
+
+        with patch.object(StreamedIdentifiersCache, "pieces_client"):
+            next_run = PiecesClient(reconnect_on_host_change=False)
+        next_run.enable_discovery_cache(client._discovery_cache_path)
+        assert next_run.port == pieces_os
+        assert next_run.known_os_id("12.0.0") == "os-id"
+        # PiecesOS was upgraded or reinstalled
+        assert next_run.known_os_id("12.1.0") is None
+
+    def test_dropped_for_another_pieces_os(self, client, pieces_os):
+        with open(client._discovery_cache_path, "w") as f:
+            json.dump(
+                {
+                    "port": pieces_os,
+                    "fingerprint": "ok:other",
+                    "os_id": "other-id",
+                    "version": "12.0.0",
+                },
+                f,
+            )
+        assert client.port == pieces_os
+        assert client.known_os_id("12.0.0") is None
+        assert "os_id" not in _cache(client)
+
+    def test_port_set_by_hand(self, client, pieces_os):
+        client.port = pieces_os
+        client.remember_os_id("os-id", "12.0.0")
+        assert client.known_os_id("12.0.0") is None
+
+
+class TestSharedHealth:
+    """Test that the health check is shared by is_pieces_running"""
+
+    def test_discovery_health_is_shared(self, client, pieces_os):
+        assert client.is_pieces_running()
+        assert client.is_pieces_running()
+        assert _HealthHandler.requests == ["/.well-known/health"]
+
+    def test_health_is_checked_again_after_ttl(self, client, pieces_os):
+        assert client.is_pieces_running()
+        with patch.object(client_module, "HEALTH_TTL", 0):
+            assert client.is_pieces_running()
+        assert _HealthHandler.requests == ["/.well-known/health"] * 2
+
+    def test_health_stream_is_reused(self, client, pieces_os):
+        client.port = pieces_os
+        client.is_pos_stream_running = True
+        assert client.is_pieces_running()
+        assert _HealthHandler.requests == []
@@ -0,0 +1,260 @@
+"""
+Test suite for the local search index of the cached materials.
+
+Tests the tokenizer, the ranking of exact, prefix and fuzzy matches, the
+persistence of the index, its incremental updates from AssetSnapshot and
+its use by `pieces search --mode fuzzy`.
+"""
+
+import time
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+from unittest.mock import Mock, patch
+
+import pytest
+
+from pieces._vendor.pieces_os_client.wrapper.client import PiecesClient
+from pieces._vendor.pieces_os_client.wrapper.streamed_identifiers import AssetSnapshot
+from pieces._vendor.pieces_os_client.wrapper.streamed_identifiers._search_index import (
+    AssetSearchIndex,
+    tokenize,
+)
+from pieces.core import search_command
+from pieces.settings import Settings
+
+UPDATED = datetime(2025, 1, 1)
+
+
+def _asset(id, name, content="", tags=(), description=None, updated=UPDATED):
+    return SimpleNamespace(
+        id=id,
+        name=name,
+        updated=SimpleNamespace(value=updated),
+        tags=SimpleNamespace(iterable=[SimpleNamespace(text=tag) for tag in tags]),
+        annotations=SimpleNamespace(
+            iterable=[SimpleNamespace(type="DESCRIPTION", text=description)]
+            if description
+            else []
+        ),
+        preview=None,
+        original=SimpleNamespace(
+            reference=SimpleNamespace(
+                fragment=SimpleNamespace(string=SimpleNamespace(raw=content))
+            )
+        ),
+    )
+
+
+ASSETS = [
+    _asset("parser", "JSON parser", "def parse_json(text):\n    return json.loads(text)"),
+    _asset("server", "HTTP server", "import http.server", tags=["python", "network"]),
+    _asset(
+        "fetch",
+        "Fetch helper",
+        "async function fetchJson(url) { return (await fetch(url)).json() }",
+        description="Fetches JSON from an URL",
+    ),
+    _asset("notes", "Meeting notes", "Discussed the parser refactoring"),
+]
+
+
+@pytest.fixture
+def index(tmp_path):
+    index = AssetSearchIndex(tmp_path / "search_index.json", "os:user")
+    for asset in ASSETS:
+        index.add(asset)
+    return index
+
+
+def _ids(results):
+    return [id for id, _ in results]
+
+
+class TestTokenize:
+    def test_identifiers_are_split(self):
+        assert tokenize("parse_json fetchJson HTTPServer") == [
+            "parse_json",
+            "parse",
+            "json",
+            "fetchjson",
+            "fetch",
+            "json",
+            "httpserver",
+            "http",
+            "server",
+        ]
+
+    def test_empty(self):
+        assert tokenize(None) == []
+        assert tokenize("  ...  ") == []
+
+
+class TestAssetSearchIndex:
+    """Ranking and maintenance of the index"""
+
+    def test_name_ranks_above_content(self, index):
+        results = index.search("parser")
+        assert _ids(results) == ["parser", "notes"]
+        assert results[0][1] == 1.0
+        assert 0 < results[1][1] < 1
+
+    def test_assets_matching_every_term_rank_first(self, index):
+        assert _ids(index.search("json fetch"))[0] == "fetch"
+
+    def test_prefix_and_fuzzy_matches(self, index):
+        assert _ids(index.search("serv")) == ["server"]
+        assert _ids(index.search("pasrer")) == []  # Two edits away
+        assert _ids(index.search("parsr"))[0] == "parser"
+
+    def test_tags_and_description_are_indexed(self, index):
+        assert _ids(index.search("network")) == ["server"]
+        assert _ids(index.search("url")) == ["fetch"]
+
+    def test_ids_filter_and_limit(self, index):
+        assert _ids(index.search("parser", ids=["notes"])) == ["notes"]
+        assert len(index.search("json", limit=1)) == 1
+
+    def test_update_and_remove(self, index):
+        index.add(
+            _asset("notes", "Standup", "nothing", updated=UPDATED + timedelta(days=1))
+        )
+        assert _ids(index.search("parser")) == ["parser"]
+        index.remove(ASSETS[0])
+        assert index.search("parser") == []
+        assert len(index) == 3
+
+    def test_sync_drops_deleted_assets(self, index):
+        index.sync({"parser": None, "server": None})
+        assert len(index) == 2
+        assert _ids(index.search("parser")) == ["parser"]
+
+    def test_persistence(self, index, tmp_path):
+        index.save()
+        loaded = AssetSearchIndex(tmp_path / "search_index.json", "os:user")
+        assert len(loaded) == len(ASSETS)
+        assert loaded.search("json fetch") == index.search("json fetch")
+        assert loaded.is_current(ASSETS[0])
+
+        # An index written for another PiecesOS or user is discarded
+        other = AssetSearchIndex(tmp_path / "search_index.json", "os:other")
+        assert len(other) == 0
+
+    def test_file_is_read_on_first_use(self, index, tmp_path):
+        loaded = AssetSearchIndex(tmp_path / "search_index.json", "os:user")
+        index.save()  # Written after the index was created
+        assert _ids(loaded.search("network")) == ["server"]
+
+    def test_benchmark(self, tmp_path):
+        index = AssetSearchIndex(tmp_path / "search_index.json", "os:user")
+        words = [f"word{i}" for i in range(2000)]
+        start = time.perf_counter()
+        for i in range(5000):
+            content = " ".join(words[(i * 7 + j) % len(words)] for j in range(50))
+            index.add(_asset(f"asset-{i}", f"Material {i}", content))
+        build = time.perf_counter() - start
+
+        start = time.perf_counter()
+        results = index.search("material word12 wrd99")
+        query = time.perf_counter() - start
+        print(f"5000 assets: indexed in {build * 1e3:.0f}ms, query {query * 1e3:.1f}ms")
+        assert results
+        assert query < 0.5
+
+
+class TestIndexUpdates:
+    """The index follows the AssetSnapshot updates"""
+
+    @pytest.fixture(autouse=True)
+    def clean_snapshot(self):
+        with (
+            patch.object(AssetSnapshot, "search_index", None),
+            patch.object(AssetSnapshot, "identifiers_snapshot", {"parser": ASSETS[0]}),
+            patch.object(AssetSnapshot, "on_update_list", []),
+            patch.object(AssetSnapshot, "on_remove_list", []),
+        ):
+            yield
+
+    def test_enable_search_index(self, tmp_path):
+        client = Mock(spec=PiecesClient)
+        PiecesClient.enable_search_index(client, str(tmp_path), "os:user")
+        index = AssetSnapshot.search_index
+        assert _ids(index.search("parser")) == ["parser"]
+
+        AssetSnapshot.on_update(ASSETS[1])
+        assert _ids(index.search("server")) == ["server"]
+        AssetSnapshot.on_remove(ASSETS[0])
+        assert index.search("json") == []
+
+        # Enabling it again for the same instance keeps it
+        PiecesClient.enable_search_index(client, str(tmp_path), "os:user")
+        assert AssetSnapshot.search_index is index
+        assert len(AssetSnapshot.on_update_list) == 1
+
+
+class TestLocalSearch:
+    """pieces search --mode fuzzy uses the local index while it is current"""
+
+    @pytest.fixture(autouse=True)
+    def mocks(self, index):
+        snapshot = {asset.id: asset for asset in ASSETS}
+        self.snapshot = snapshot
+        with (
+            patch.object(AssetSnapshot, "search_index", index),
+            patch.object(AssetSnapshot, "first_shot", False),
+            patch.object(
+                search_command.AssetsIdentifiersWS, "is_running", return_value=True
+            ),
+            patch.object(Settings, "logger", Mock()),
+            patch.object(
+                search_command.BasicAsset,
+                "identifiers_snapshot",
+                return_value=snapshot,
+            ),
+            patch.object(
+                search_command.BasicAsset, "search_results", return_value=[]
+            ) as server_search,
+        ):
+            self.server_search = server_search
+            yield
+
+    def test_fuzzy_is_served_locally(self):
+        results, local = search_command.search_assets("json parser", "fuzzy")
+        assert local
+        assert (results[0].identifier, results[0].score) == ("parser", 1.0)
+        self.server_search.assert_not_called()
+
+    def test_no_local_match_goes_to_pieces_os(self):
+        results, local = search_command.search_assets("kubernetes", "fuzzy")
+        assert not local
+        self.server_search.assert_called_once_with("kubernetes", "fuzzy")
+
+    def test_other_modes_go_to_pieces_os(self):
+        search_command.search_assets("json", "ncs")
+        self.server_search.assert_called_once_with("json", "ncs")
+
+    def test_scores_are_shown(self):
+        with patch.object(search_command.ListCommand, "list_assets") as list_assets:
+            search_command.search(["json"], search_type="fuzzy")
+        kwargs = list_assets.call_args.kwargs
+        assert kwargs["scores"]["parser"] == 1.0
+        assert "(local index)" in kwargs["footer"]
+
+    def test_edited_material_is_found(self):
+        self.snapshot["notes"] = _asset(
+            "notes", "Kubernetes notes", updated=UPDATED + timedelta(days=1)
+        )
+        results, local = search_command.search_assets("kubernetes", "fuzzy")
+        assert local
+        assert [result.identifier for result in results] == ["notes"]
+
+    def test_not_hydrated_goes_to_pieces_os(self):
+        with patch.object(AssetSnapshot, "first_shot", True):
+            _, local = search_command.search_assets("json parser", "fuzzy")
+        assert not local
+        self.server_search.assert_called_once_with("json parser", "fuzzy")
+
+    def test_disconnected_goes_to_pieces_os(self):
+        search_command.AssetsIdentifiersWS.is_running.return_value = False
+        _, local = search_command.search_assets("json parser", "fuzzy")
+        assert not local
+        self.server_search.assert_called_once_with("json parser", "fuzzy")
@@ -0,0 +1,150 @@
+"""
+Test suite for the streaming of `pieces search` results.
+
+Tests that the exact matches are shown first, that the names returned with
+the results are not fetched again, that the suggested matches are appended
+in small batches as their names resolve, and that --limit stops early.
+"""
+
+import threading
+import time
+from types import SimpleNamespace
+from unittest.mock import Mock, patch
+
+import pytest
+
+from pieces.core import search_command
+from pieces.core.list_command import ListCommand
+from pieces.settings import Settings
+from pieces._vendor.pieces_os_client.wrapper.streamed_identifiers.assets_snapshot import (
+    AssetSnapshot,
+)
+
+REQUEST_LATENCY = 0.01  # Seconds per single asset request
+
+
+class FakeAssetsApi:
+    def __init__(self, count: int):
+        self.names = {f"asset-{i}": f"Material {i}" for i in range(count)}
+        self.fetched = []
+        self.snapshot_calls = 0
+        self._lock = threading.Lock()
+
+    def assets_specific_asset_snapshot(self, asset, transferables=None):
+        with self._lock:
+            self.fetched.append(asset)
+        time.sleep(REQUEST_LATENCY)
+        return SimpleNamespace(id=asset, name=self.names[asset])
+
+    def assets_snapshot(self, transferables=None):
+        self.snapshot_calls += 1
+        assets = [SimpleNamespace(id=id, name=name) for id, name in self.names.items()]
+        return SimpleNamespace(iterable=assets)
+
+
+def _searched(i, exact, with_asset=False):
+    id = f"asset-{i}"
+    return SimpleNamespace(
+        identifier=id,
+        score=1.0 if exact else 0.5,
+        exact=exact,
+        asset=SimpleNamespace(name=f"Material {i}") if with_asset else None,
+    )
+
+
+@pytest.fixture
+def assets_api():
+    api = FakeAssetsApi(60)
+    client = Mock(assets_api=api, max_hydration_workers=4)
+    with (
+        patch.object(Settings, "pieces_client", client),
+        patch.object(Settings, "logger", Mock()),
+        patch.object(AssetSnapshot, "identifiers_snapshot", {}),
+        patch.object(AssetSnapshot, "search_index", None),
+    ):
+        yield api
+
+
+class TestSearchStreaming:
+    """Test the streaming of the search results into the select menu"""
+
+    def test_exact_matches_come_first(self, assets_api):
+        ids = list(assets_api.names)
+        known = {ids[0]: "Known"}
+        batches = list(ListCommand._iter_asset_names(ids, known, first_page_size=3))
+
+        assert batches[0] == [
+            ("asset-0", "Known"),
+            ("asset-1", "Material 1"),
+            ("asset-2", "Material 2"),
+        ]
+        # Few suggestions are named one by one and appended in small batches
+        assert all(len(batch) <= ListCommand.STREAM_BATCH_SIZE for batch in batches[1:])
+        names = [name for batch in batches[1:] for _, name in batch]
+        assert names == [f"Material {i}" for i in range(3, 60)]
+        assert "asset-0" not in assets_api.fetched
+        assert assets_api.snapshot_calls == 0
+
+    def test_search_shows_results_with_known_names(self, assets_api):
+        results = [_searched(i, exact=i < 2, with_asset=i % 2 == 0) for i in range(6)]
+        with (
+            patch.object(
+                search_command.BasicAsset, "search_results", return_value=results
+            ),
+            patch.object(ListCommand, "list_assets") as list_assets,
+        ):
+            assert search_command.search(["json"], search_type="ncs", limit=4) == 0
+
+        kwargs = list_assets.call_args.kwargs
+        assert [asset._id for asset in kwargs["assets"]] == [
+            f"asset-{i}" for i in range(4)
+        ]
+        assert kwargs["names"] == {"asset-0": "Material 0", "asset-2": "Material 2"}
+        assert kwargs["first_page_size"] == 2
+        assert kwargs["scores"]["asset-3"] == 0.5
+        assert "Results Found: 4" in kwargs["footer"]
+
+    def test_time_to_first_result_is_logged(self, assets_api):
+        results = [_searched(i, exact=i == 0, with_asset=i == 0) for i in range(30)]
+        entries = []
+        done = threading.Event()
+
+        def add_entries(batch):
+            entries.extend(batch)
+            if len(entries) == len(results):
+                done.set()
+
+        menu = Mock()
+        menu.add_entries.side_effect = add_entries
+        with (
+            patch.object(
+                search_command.BasicAsset, "search_results", return_value=results
+            ),
+            patch("pieces.utils.PiecesSelectMenu", return_value=menu),
+        ):
+            search_command.search(["json"], search_type="fuzzy")
+            assert done.wait(5)
+
+        first_batch = menu.add_entries.call_args_list[0].args[0]
+        # The exact match is shown before any suggested name is fetched
+        assert [label for label, _ in first_batch] == ["1: Material 0 (1.00)"]
+        deadline = time.monotonic() + 2
+        while time.monotonic() < deadline:
+            logs = [call.args[0] for call in Settings.logger.debug.call_args_list]
+            if any("results listed in" in log for log in logs):
+                break
+            time.sleep(0.01)
+        assert any(log.startswith("Time to first result:") for log in logs)
+        assert any(log.startswith("30 results listed in") for log in logs)
+
+    def test_no_matches(self, assets_api):
+        with (
+            patch.object(search_command.BasicAsset, "search_results", return_value=[]),
+            patch.object(ListCommand, "list_assets") as list_assets,
+        ):
+            assert search_command.search(["nothing"], search_type="fts") == 0
+        list_assets.assert_not_called()
+        Settings.logger.print.assert_called_once_with("No matches found.")
+
+    def test_invalid_limit(self, assets_api):
+        assert search_command.search(["json"], limit=0) == 1
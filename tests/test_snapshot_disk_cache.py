@@ -0,0 +1,201 @@
+"""
+Test suite for the on-disk cache of the asset and conversation snapshots.
+
+Tests that objects are only served back at the `updated` timestamp they were
+cached at, the least recently used eviction, the invalidation of a file
+written for another PiecesOS instance or user, the removal of objects deleted
+since the last run and that the file is only read and written when needed.
+"""
+
+import json
+import os
+import threading
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+import pytest
+from pydantic import BaseModel
+
+from pieces._vendor.pieces_os_client.wrapper.streamed_identifiers._disk_cache import (
+    SnapshotDiskCache,
+)
+from pieces._vendor.pieces_os_client.wrapper.streamed_identifiers._streamed_identifiers import (
+    StreamedIdentifiersCache,
+)
+
+UPDATED = datetime(2025, 1, 1)
+
+
+class Stamp(BaseModel):
+    value: datetime
+
+
+class Material(BaseModel):
+    id: str
+    name: str
+    updated: Stamp
+
+    @classmethod
+    def from_dict(cls, obj):
+        return cls.model_validate(obj)
+
+
+def _material(id, updated=UPDATED):
+    return Material(id=id, name=f"Material {id}", updated=Stamp(value=updated))
+
+
+@pytest.fixture
+def path(tmp_path):
+    return tmp_path / "assets.json"
+
+
+def _cache(path, instance="os:user", max_entries=5000):
+    return SnapshotDiskCache(path, Material, instance, max_entries)
+
+
+def _saved(path, *materials, instance="os:user"):
+    cache = _cache(path, instance)
+    for material in materials:
+        cache.put(material)
+    cache.save()
+
+
+class TestSnapshotDiskCache:
+    """Test the persistence rules of the cache"""
+
+    def test_served_at_the_cached_timestamp(self, path):
+        _saved(path, _material("a"))
+        cache = _cache(path)
+        assert cache.get("a", UPDATED) == _material("a")
+        assert cache.get("a", UPDATED + timedelta(seconds=1)) is None
+        assert cache.get("a", None) is None
+        assert cache.get("b", UPDATED) is None
+
+    def test_newer_version_replaces_the_entry(self, path):
+        cache = _cache(path)
+        cache.put(_material("a"))
+        cache.put(_material("a", UPDATED + timedelta(days=1)))
+        assert cache.get("a", UPDATED) is None
+        assert cache.get("a", UPDATED + timedelta(days=1)) is not None
+        assert len(cache) == 1
+
+    def test_lru_eviction(self, path):
+        cache = _cache(path, max_entries=2)
+        cache.put(_material("a"))
+        cache.put(_material("b"))
+        cache.get("a", UPDATED)  # "b" is now the least recently used
+        cache.put(_material("c"))
+
+        assert cache.get("b", UPDATED) is None
+        assert cache.get("a", UPDATED) is not None
+        assert cache.get("c", UPDATED) is not None
+
+    def test_other_instance_is_discarded(self, path):
+        _saved(path, _material("a"))
+        cache = _cache(path, "os:other-user")
+        assert cache.get("a", UPDATED) is None
+        cache.save()
+        data = json.loads(path.read_text())
+        assert data["instance"] == "os:other-user"
+        assert data["entries"] == []
+
+    def test_retain_drops_deleted_objects(self, path):
+        _saved(path, _material("a"), _material("b"))
+        cache = _cache(path)
+        cache.retain(["b"])
+        cache.save()
+        assert [entry["id"] for entry in json.loads(path.read_text())["entries"]] == [
+            "b"
+        ]
+
+    def test_file_is_read_on_first_use(self, path):
+        cache = _cache(path)
+        _saved(path, _material("a"))  # Written after the cache was created
+        assert cache.get("a", UPDATED) is not None
+
+    def test_unchanged_objects_are_not_written(self, path):
+        _saved(path, _material("a"))
+        os.utime(path, ns=(0, 0))
+        cache = _cache(path)
+        cache.put(_material("a"))
+        cache.save()
+        assert path.stat().st_mtime_ns == 0
+
+        cache.put(_material("a", UPDATED + timedelta(days=1)))
+        cache.save()
+        assert path.stat().st_mtime_ns != 0
+
+
+class TestStreamedReconciliation:
+    """Test a streamed cache hydrated from the disk cache"""
+
+    @pytest.fixture
+    def snapshot(self, path):
+        class Snapshot(StreamedIdentifiersCache):
+            _initialized = threading.Event()
+            api_call = Mock(side_effect=lambda id: _material(id))
+
+            @staticmethod
+            def _name():
+                return "asset"
+
+            @classmethod
+            def _api_call(cls, id):
+                return cls.api_call(id)
+
+            @staticmethod
+            def _sort_first_shot():
+                pass
+
+        Snapshot._worker_thread = Mock(is_alive=Mock(return_value=True))
+        Snapshot.disk_cache = _cache(path)
+        return Snapshot
+
+    @staticmethod
+    def _stream(snapshot, *ids, updated=UPDATED):
+        snapshot.streamed_identifiers_callback(
+            SimpleNamespace(
+                iterable=[
+                    SimpleNamespace(
+                        asset=SimpleNamespace(id=id),
+                        deleted=False,
+                        updated=SimpleNamespace(value=updated),
+                    )
+                    for id in ids
+                ]
+            )
+        )
+        snapshot.worker()
+
+    def test_cached_objects_are_not_fetched(self, snapshot, path):
+        _saved(path, _material("a"), _material("gone"))
+
+        self._stream(snapshot, "a", "b")
+
+        snapshot.api_call.assert_called_once_with("b")
+        assert snapshot.identifiers_snapshot == {
+            "a": _material("a"),
+            "b": _material("b"),
+        }
+        # "gone" was deleted while the CLI was not running
+        assert snapshot.disk_cache.get("gone", UPDATED) is None
+        snapshot.disk_cache.save()
+        assert {
+            entry["id"] for entry in json.loads(path.read_text())["entries"]
+        } == {"a", "b"}
+
+    def test_up_to_date_cache_is_not_rewritten(self, snapshot, path):
+        _saved(path, _material("a"))
+        os.utime(path, ns=(0, 0))
+
+        self._stream(snapshot, "a")
+        snapshot.disk_cache.save()
+
+        snapshot.api_call.assert_not_called()
+        assert path.stat().st_mtime_ns == 0
+
+    def test_changed_object_is_fetched_again(self, snapshot, path):
+        _saved(path, _material("a"))
+        self._stream(snapshot, "a", updated=UPDATED + timedelta(days=1))
+        snapshot.api_call.assert_called_once_with("a")
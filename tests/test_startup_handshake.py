@@ -0,0 +1,179 @@
+"""
+Test suite for the concurrent startup handshake.
+
+Tests that Settings.startup sends the independent PiecesOS requests at once,
+that their results are memoized, that the PiecesOS id the caches are keyed on
+is only requested when PiecesOS changed, that the models can be reused from
+the disk cache within their TTL and that a startup trace is logged.
+"""
+
+import json
+import time
+from types import SimpleNamespace
+from unittest.mock import Mock, patch
+
+import pytest
+
+from pieces._vendor.pieces_os_client.models.application_name_enum import (
+    ApplicationNameEnum,
+)
+from pieces._vendor.pieces_os_client.models.model import Model
+from pieces.handshake import StartupHandshake
+from pieces.settings import Settings
+
+# Settings.startup is mocked by conftest.py once the tests run
+STARTUP = Settings.__dict__["startup"].__func__
+
+REQUEST_LATENCY = 0.1  # Seconds per request
+
+MODEL = {
+    "id": "model-id",
+    "version": "1.0.0",
+    "created": {"value": "2024-01-01T10:00:00.000Z"},
+    "name": "GPT-4o",
+    "cloud": True,
+    "type": "BALANCED",
+    "usage": "ASSET",
+    "foundation": "GPT_4o",
+}
+
+
+def _slow(value):
+    def call(*args, **kwargs):
+        time.sleep(REQUEST_LATENCY)
+        return value
+
+    return call
+
+
+@pytest.fixture
+def client():
+    client = Mock(port="39300", fingerprint="ok")
+    client.known_os_id.return_value = None  # Not saved yet
+    client.well_known_api.get_well_known_version.side_effect = _slow("12.0.0")
+    client.user_api.user_snapshot.side_effect = _slow(
+        SimpleNamespace(user=SimpleNamespace(id="user-id"))
+    )
+    client.models_api.models_snapshot.side_effect = _slow(
+        SimpleNamespace(iterable=[Model.from_dict(MODEL)])
+    )
+    client.applications_api.applications_snapshot.side_effect = _slow(
+        SimpleNamespace(
+            iterable=[SimpleNamespace(name=ApplicationNameEnum.OS_SERVER, id="os-id")]
+        )
+    )
+    with (
+        patch.object(Settings, "pieces_client", client),
+        patch.object(Settings, "_os_id", None),
+        patch.object(Settings, "configure_client"),
+        patch.object(Settings, "model_config", Mock(model=None)),
+        patch.object(
+            Settings,
+            "cli_config",
+            Mock(config=Mock(startup_cache_ttl=0, local_search_index=False)),
+        ),
+        patch.object(Settings, "logger", Mock()),
+    ):
+        yield client
+
+
+class TestStartup:
+    """Test the handshake of Settings.startup"""
+
+    def test_requests_are_concurrent(self, client):
+        start = time.perf_counter()
+        STARTUP(Settings)
+        elapsed = time.perf_counter() - start
+
+        print(f"3 startup requests in {elapsed * 1e3:.0f}ms")
+        assert elapsed < 2 * REQUEST_LATENCY
+        assert Settings.pieces_os_version == "12.0.0"
+        assert client.user.user_profile.id == "user-id"
+        assert client.models_object[0].name == "GPT-4o"
+        client.user_api.user_snapshot.assert_called_once()
+
+    def test_os_id_is_requested_once(self, client):
+        STARTUP(Settings)
+        # The caches are bound to the PiecesOS id, not to its health response
+        client.enable_snapshot_disk_cache.assert_called_once_with(
+            Settings.snapshots_dir, "os-id:user-id"
+        )
+        client.known_os_id.assert_called_once_with("12.0.0")
+        client.remember_os_id.assert_called_once_with("os-id", "12.0.0")
+
+    def test_saved_os_id_is_not_requested(self, client):
+        client.known_os_id.return_value = "saved-id"
+        STARTUP(Settings)
+        client.enable_snapshot_disk_cache.assert_called_once_with(
+            Settings.snapshots_dir, "saved-id:user-id"
+        )
+        client.applications_api.applications_snapshot.assert_not_called()
+        client.remember_os_id.assert_not_called()
+
+    def test_bypass_login_only_checks_the_version(self, client):
+        STARTUP(Settings, bypass_login=True)
+        client.well_known_api.get_well_known_version.assert_called_once()
+        client.user_api.user_snapshot.assert_not_called()
+        client.models_api.models_snapshot.assert_not_called()
+
+    def test_trace_is_logged(self, client):
+        STARTUP(Settings)
+        (trace,) = [
+            call.args[0]
+            for call in Settings.logger.debug.call_args_list
+            if call.args[0].startswith("Startup handshake:")
+        ]
+        print(trace)
+        for step in ("health", "version", "user", "models"):
+            assert f"{step} " in trace
+        assert "critical path" in trace
+
+
+class TestDiskCache:
+    """Test reusing the models across runs"""
+
+    def _run(self, client, path, ttl=60):
+        handshake = StartupHandshake(client, str(path), ttl)
+        handshake.start(["version", "models"])
+        result = handshake.get("version"), handshake.get("models")
+        handshake.save()
+        return handshake, result
+
+    def test_reused_within_ttl(self, client, tmp_path):
+        path = tmp_path / "startup_cache.json"
+        self._run(client, path)
+        data = json.loads(path.read_text())
+        assert data["models"]["value"][0]["name"] == "GPT-4o"
+
+        handshake, (version, models) = self._run(client, path)
+        assert handshake.cached == {"models"}
+        assert version == "12.0.0"
+        assert models[0].name == "GPT-4o"
+        client.models_api.models_snapshot.assert_called_once()
+
+    def test_version_is_always_requested(self, client, tmp_path):
+        path = tmp_path / "startup_cache.json"
+        self._run(client, path)
+        client.well_known_api.get_well_known_version.side_effect = _slow("12.1.0")
+        _, (version, _) = self._run(client, path)
+        assert version == "12.1.0"
+        assert "version" not in json.loads(path.read_text())
+
+    def test_expired(self, client, tmp_path):
+        path = tmp_path / "startup_cache.json"
+        self._run(client, path)
+        with patch("pieces.handshake.time.time", return_value=time.time() + 61):
+            handshake, _ = self._run(client, path)
+        assert handshake.cached == set()
+
+    def test_other_pieces_os(self, client, tmp_path):
+        path = tmp_path / "startup_cache.json"
+        self._run(client, path)
+        client.fingerprint = "ok:restarted"
+        handshake, _ = self._run(client, path)
+        assert handshake.cached == set()
+
+    def test_disabled(self, client, tmp_path):
+        path = tmp_path / "startup_cache.json"
+        self._run(client, path, ttl=0)
+        assert not path.exists()
@@ -0,0 +1,187 @@
+"""
+Test suite for the hydration of the streamed identifier caches.
+
+Tests that the ids streamed by PiecesOS are fetched in bulk batches, that
+updates received while a bulk request is in flight and deleted ids are
+reconciled, and that the per-id requests run concurrently on a bounded pool
+while the results are stored in order.
+"""
+
+import threading
+import time
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+import pytest
+
+from pieces._vendor.pieces_os_client.wrapper.streamed_identifiers._streamed_identifiers import (
+    StreamedIdentifiersCache,
+)
+
+
+def _item(id, deleted=False):
+    return SimpleNamespace(asset=SimpleNamespace(id=id), deleted=deleted, updated=None)
+
+
+def _stream(cache, ids, deleted=False):
+    """Stream the ids to the cache then hydrate them in this thread."""
+    cache.streamed_identifiers_callback(
+        SimpleNamespace(iterable=[_item(id, deleted) for id in ids])
+    )
+    cache.worker()
+
+
+@pytest.fixture
+def cache():
+    class Snapshot(StreamedIdentifiersCache):
+        _initialized = threading.Event()
+        api_call = Mock(side_effect=lambda id: f"{id}:single")
+        bulk_api_call = Mock(side_effect=lambda ids: {id: f"{id}:bulk" for id in ids})
+
+        @staticmethod
+        def _name():
+            return "asset"
+
+        @classmethod
+        def _api_call(cls, id):
+            return cls.api_call(id)
+
+        @classmethod
+        def _bulk_api_call(cls, ids):
+            return cls.bulk_api_call(ids)
+
+        @staticmethod
+        def _sort_first_shot():
+            pass
+
+    # The worker runs in the test thread, see _stream
+    Snapshot._worker_thread = Mock(is_alive=Mock(return_value=True))
+    Snapshot.updated = []
+    Snapshot.removed = []
+    Snapshot.on_update_list.append(Snapshot.updated.append)
+    Snapshot.on_remove_list.append(Snapshot.removed.append)
+    return Snapshot
+
+
+class TestBulkHydration:
+    """Test coalescing the streamed ids into bulk requests"""
+
+    def test_batches(self, cache):
+        cache.batch_size = 100
+        ids = [f"id{i}" for i in range(250)]
+        _stream(cache, ids)
+
+        assert [len(call.args[0]) for call in cache.bulk_api_call.call_args_list] == [
+            100,
+            100,
+            50,
+        ]
+        cache.api_call.assert_not_called()
+        assert list(cache.identifiers_snapshot) == ids
+        assert cache.updated == [f"{id}:bulk" for id in ids]
+        assert cache._initialized.is_set()
+
+    def test_missing_ids_are_fetched_one_by_one(self, cache):
+        cache.bulk_api_call.side_effect = lambda ids: {
+            id: f"{id}:bulk" for id in ids if id != "b"
+        }
+        _stream(cache, ["a", "b", "c"])
+
+        cache.bulk_api_call.assert_called_once_with(["a", "b", "c"])
+        cache.api_call.assert_called_once_with("b")
+        assert cache.identifiers_snapshot == {
+            "a": "a:bulk",
+            "b": "b:single",
+            "c": "c:bulk",
+        }
+
+    def test_failed_bulk_request(self, cache):
+        cache.bulk_api_call.side_effect = RuntimeError("Boom")
+        _stream(cache, ["a", "b"])
+        assert cache.identifiers_snapshot == {"a": "a:single", "b": "b:single"}
+
+
+class TestReconciliation:
+    """Test the updates and deletions streamed while hydrating"""
+
+    def test_update_during_bulk_request(self, cache):
+        _stream(cache, ["a", "b"])
+        cache.updated.clear()
+        cache.api_call.reset_mock()
+
+        def bulk_api_call(ids):
+            # "a" changes while the bulk request is in flight
+            cache.streamed_identifiers_callback(SimpleNamespace(iterable=[_item("a")]))
+            return {id: f"{id}:bulk" for id in ids}
+
+        cache.bulk_api_call.side_effect = bulk_api_call
+        _stream(cache, ["a", "b"])
+
+        # The bulk copy of "a" is older than the update, it is never stored
+        assert "a:bulk" not in cache.updated
+        assert cache.identifiers_snapshot == {"a": "a:single", "b": "b:bulk"}
+
+    def test_deleted(self, cache):
+        cache.disk_cache = Mock()
+        _stream(cache, ["a", "b"])
+        _stream(cache, ["a"], deleted=True)
+
+        assert cache.identifiers_snapshot == {"b": "b:bulk"}
+        assert cache.removed == ["a:bulk"]
+        cache.disk_cache.remove.assert_called_once_with("a")
+
+    def test_new_ids_are_listed_first(self, cache):
+        _stream(cache, ["a", "b"])
+        _stream(cache, ["c"])
+        assert list(cache.identifiers_snapshot) == ["c", "a", "b"]
+
+
+class TestConcurrentHydration:
+    """Test the per-id requests run on the hydration pool"""
+
+    @pytest.fixture
+    def tracked(self, cache):
+        cache.bulk_api_call.side_effect = lambda ids: {}
+        cache.max_hydration_workers = 4
+        state = {"in_flight": 0, "max_in_flight": 0}
+        lock = threading.Lock()
+
+        def api_call(id):
+            with lock:
+                state["in_flight"] += 1
+                state["max_in_flight"] = max(state["max_in_flight"], state["in_flight"])
+            # The first ids are the slowest, they complete last
+            time.sleep(0.02 / (int(id[2:]) + 1))
+            with lock:
+                state["in_flight"] -= 1
+            return f"{id}:single"
+
+        cache.api_call.side_effect = api_call
+        yield cache, state
+        cache._executor.shutdown()
+
+    def test_results_are_stored_in_order(self, tracked):
+        cache, state = tracked
+        ids = [f"id{i}" for i in range(12)]
+        _stream(cache, ids)
+
+        assert cache.updated == [f"{id}:single" for id in ids]
+        assert 1 < state["max_in_flight"] <= cache.max_hydration_workers
+
+    def test_pool_is_reused(self, tracked):
+        cache, _ = tracked
+        _stream(cache, ["id0", "id1"])
+        executor = cache._executor
+        _stream(cache, ["id2", "id3"])
+        assert cache._executor is executor
+
+        cache.max_hydration_workers = 2
+        _stream(cache, ["id4", "id5"])
+        assert cache._executor is not executor
+        assert cache._executor._max_workers == 2
+
+    def test_failed_request_is_skipped(self, tracked):
+        cache, _ = tracked
+        cache.api_call.side_effect = lambda id: 1 / 0 if id == "id1" else id
+        _stream(cache, ["id0", "id1", "id2"])
+        assert cache.updated == ["id0", "id2"]
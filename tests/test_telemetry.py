@@ -0,0 +1,99 @@
+"""
+Test suite for the deferred Sentry initialization.
+
+Tests that Sentry is only initialized once started or when an error is
+reported, in a background thread, that the PiecesOS id is only looked up
+when an event is sent and that the exit flush is skipped when no event was
+queued.
+"""
+
+import threading
+from unittest.mock import patch
+
+import pytest
+import sentry_sdk
+
+from pieces import telemetry
+from pieces.settings import Settings
+
+
+@pytest.fixture
+def reset():
+    with (
+        patch.object(telemetry, "_options", None),
+        patch.object(telemetry, "_init_thread", None),
+        patch.object(telemetry, "_queued", False),
+    ):
+        yield
+
+
+@pytest.fixture
+def enabled(reset):
+    telemetry.setup("1.0.0", "production", dsn=None)
+    yield
+
+
+class TestTelemetry:
+    """Test pieces.telemetry"""
+
+    def test_disabled(self, reset):
+        with patch.object(sentry_sdk, "init") as init:
+            telemetry.start()
+            telemetry.capture_exception(ValueError("error"))
+        init.assert_not_called()
+        sentry_sdk.capture_exception.assert_not_called()
+
+    def test_setup_does_not_initialize(self, enabled):
+        with patch.object(sentry_sdk, "init") as init:
+            telemetry.setup("1.0.0", "production")
+        init.assert_not_called()
+        assert telemetry._init_thread is None
+
+    def test_start_initializes_in_background(self, enabled):
+        threads = []
+        with patch.object(
+            sentry_sdk,
+            "init",
+            side_effect=lambda **kwargs: threads.append(threading.current_thread()),
+        ) as init:
+            telemetry.start()
+            telemetry.start()
+            telemetry._init_thread.join(5)
+
+        init.assert_called_once()
+        assert init.call_args.kwargs["release"] == "1.0.0"
+        assert threads[0] is not threading.main_thread()
+
+    def test_capture_exception_initializes(self, enabled):
+        error = ValueError("error")
+        with (
+            patch.object(sentry_sdk, "init") as init,
+            patch.object(sentry_sdk, "capture_exception") as capture,
+        ):
+            telemetry.capture_exception(error)
+        init.assert_called_once()
+        capture.assert_called_once_with(error)
+
+    def test_os_id_is_looked_up_when_an_event_is_sent(self, enabled):
+        with patch.object(Settings, "get_os_id", return_value="os-id") as get_os_id:
+            telemetry.start()
+            telemetry._init_thread.join(5)
+            get_os_id.assert_not_called()
+
+            event = telemetry._before_send({"message": "error"}, {})
+        assert event["user"] == {"id": "os-id"}
+
+    def test_os_id_unreachable(self, enabled):
+        with patch.object(Settings, "get_os_id", side_effect=ConnectionError):
+            event = telemetry._before_send({"user": {"ip_address": "::1"}}, {})
+        assert event["user"] == {"ip_address": "::1", "id": "unknown"}
+
+    def test_flush_skipped_when_nothing_was_queued(self, enabled):
+        with patch.object(sentry_sdk, "flush") as flush:
+            telemetry.flush()
+            flush.assert_not_called()
+
+            with patch.object(Settings, "get_os_id", return_value="os-id"):
+                telemetry._before_send({}, {})
+            telemetry.flush()
+        flush.assert_called_once_with(2)